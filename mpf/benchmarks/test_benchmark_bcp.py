@@ -0,0 +1,190 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+from mpf.core.bcp import bcp_socket_client
+from mpf.core.bcp.bcp_socket_client import decode_command_string, encode_command_string
+from mpf.core.logging import LogMixin
+
+from mpf.tests.MpfFakeGameTestCase import MpfFakeGameTestCase
+from mpf.tests.loop import MockServer, MockQueueSocket
+
+
+class MediaControllerStandIn:
+
+    """Connects to the BCP server and registers like the media controller does."""
+
+    MONITORS = ("core_events", "player_vars", "machine_vars", "modes")
+    TRIGGERS = ("bcp_benchmark_trigger", "ball_started", "mode_mode_bcp_started", "mode_mode_bcp_stopped")
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.socket = MockQueueSocket(loop)
+        self._buffer = b''
+        self._reader = None
+        self.messages = 0
+        self.bytes = 0
+        self.decode_time = 0
+        self.latencies = []
+
+    def start(self):
+        self._reader = self.loop.create_task(self._read_loop())
+
+    def stop(self):
+        self._reader.cancel()
+
+    def reset_stats(self):
+        self.messages = 0
+        self.bytes = 0
+        self.decode_time = 0
+        self.latencies = []
+
+    def send(self, cmd, **kwargs):
+        self.socket.recv_queue.append((encode_command_string(cmd, **kwargs) + '\n').encode())
+
+    def register(self):
+        for category in self.MONITORS:
+            self.send("monitor_start", category=category)
+        for event in self.TRIGGERS:
+            self.send("register_trigger", event=event)
+
+    @asyncio.coroutine
+    def _read_loop(self):
+        while True:
+            data = yield from self.socket.send_queue.get()
+            self._receive(data)
+
+    def _receive(self, data):
+        received_at = time.perf_counter()
+        self.bytes += len(data)
+        lines = (self._buffer + data).split(b'\n')
+        self._buffer = lines.pop()
+        for line in lines:
+            start = time.perf_counter()
+            cmd, kwargs = decode_command_string(line.decode())
+            self.decode_time += time.perf_counter() - start
+            self.messages += 1
+
+            if cmd == "reset":
+                self.send("reset_complete")
+            elif "sent_at" in kwargs:
+                self.latencies.append(received_at - kwargs["sent_at"])
+
+
+class BenchmarkBcp(MpfFakeGameTestCase):
+
+    def __init__(self, methodName):
+        super().__init__(methodName)
+        # enable the bcp server but do not connect to a media controller
+        self.machine_config_patches['bcp'] = dict()
+        self.machine_config_patches['bcp']['connections'] = []
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'benchmarks/machine_files/bcp/'
+
+    def getOptions(self):
+        options = super().getOptions()
+        if self.unittest_verbosity() <= 1:
+            options["production"] = True
+        return options
+
+    def get_platform(self):
+        return 'virtual'
+
+    def get_use_bcp(self):
+        return True
+
+    def _mock_loop(self):
+        self.mock_server = MockServer(self.clock.loop)
+        self.clock.mock_server("127.0.0.1", 5051, self.mock_server)
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        self.clients = []
+        self.encode_calls = 0
+        self.encode_time = 0
+        super().setUp()
+
+    def tearDown(self):
+        for client in self.clients:
+            client.stop()
+        super().tearDown()
+
+    def _timed_encode(self, bcp_command, **kwargs):
+        start = time.perf_counter()
+        result = encode_command_string(bcp_command, **kwargs)
+        self.encode_time += time.perf_counter() - start
+        self.encode_calls += 1
+        return result
+
+    def _add_client(self):
+        client = MediaControllerStandIn(self.loop)
+        client.start()
+        self.loop.run_until_complete(self.mock_server.add_client(client.socket))
+        client.register()
+        self.clients.append(client)
+        self.advance_time_and_run()
+
+    def _play_ball(self, targets):
+        self.post_event("start_mode_bcp")
+        self.machine_run()
+        for i in range(targets):
+            switch = "s_target{}".format(i % 4 + 1)
+            self.machine.switch_controller.process_switch(switch, 1, logical=True)
+            self.machine.switch_controller.process_switch(switch, 0, logical=True)
+            self.machine_run()
+        self.post_event_with_params("bcp_benchmark_trigger", sent_at=time.perf_counter())
+        self.machine_run()
+        self.post_event("stop_mode_bcp")
+        self.machine_run()
+
+    def _output(self, num_clients, duration, num):
+        messages = sum(client.messages for client in self.clients)
+        received_bytes = sum(client.bytes for client in self.clients)
+        decode_time = sum(client.decode_time for client in self.clients)
+        latencies = [latency for client in self.clients for latency in client.latencies]
+        print("Clients: {} Messages/s: {:.0f} KB/s: {:.1f} Encode: {:.2f}us/msg Decode: {:.2f}us/msg "
+              "Latency avg: {:.3f}ms max: {:.3f}ms Duration per ball: {:.3f}ms".format(
+                  num_clients, messages / duration, received_bytes / duration / 1024,
+                  1000000 * self.encode_time / max(self.encode_calls, 1), 1000000 * decode_time / max(messages, 1),
+                  1000 * sum(latencies) / len(latencies), 1000 * max(latencies), 1000 * duration / num))
+
+    def testGameTraffic(self):
+        self._add_client()
+        self.start_game()
+        self.assertEqual(1, self.machine.game.player.number)
+
+        num = 100
+        targets = 20
+        with patch.object(bcp_socket_client, "encode_command_string", self._timed_encode):
+            for num_clients in (1, 2, 4, 8):
+                while len(self.clients) < num_clients:
+                    self._add_client()
+
+                # warm up
+                self._play_ball(targets)
+                self.advance_time_and_run()
+
+                for client in self.clients:
+                    client.reset_stats()
+                self.encode_calls = 0
+                self.encode_time = 0
+
+                start = time.perf_counter()
+                for _ in range(num):
+                    self._play_ball(targets)
+                duration = time.perf_counter() - start
+                self.advance_time_and_run()
+
+                self._output(num_clients, duration, num)
+
+                # every client received the same traffic
+                for client in self.clients:
+                    self.assertEqual(num, len(client.latencies))
+                    self.assertEqual(self.clients[0].messages, client.messages)
+
+        # one warm up ball and num measured balls per client count. four targets score 1800
+        self.assertEqual(4 * (num + 1) * targets // 4 * 1800, self.machine.game.player.score)
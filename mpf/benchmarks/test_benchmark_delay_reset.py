@@ -0,0 +1,61 @@
+import asyncio
+import time
+import unittest
+
+from mpf.core.clock import ClockBase
+
+
+class BenchmarkDelayReset(unittest.TestCase):
+
+    """Compare unschedule + schedule_once with pushing back a deadline timer."""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.clock = ClockBase(loop=self.loop)
+        self.calls = 0
+
+    def tearDown(self):
+        self.loop.close()
+
+    def _callback(self):
+        self.calls += 1
+
+    def _run_loop(self):
+        self.loop.run_until_complete(asyncio.sleep(0, loop=self.loop))
+
+    def _output(self, name, start, end, num):
+        print("Duration {} {:.5f}us per reset. Scheduled handles in loop: {}".format(
+            name, (1000000 * (end - start)) / num, len(self.loop._scheduled)))
+
+    def _reschedule(self, num):
+        handle = self.clock.schedule_once(self._callback, 10)
+        start = time.time()
+        for i in range(num):
+            self.clock.unschedule(handle)
+            handle = self.clock.schedule_once(self._callback, 10)
+            if i % 100 == 0:
+                self._run_loop()
+        end = time.time()
+        self._output("unschedule_and_schedule_once", start, end, num)
+        self.clock.unschedule(handle)
+
+    def _deadline(self, num):
+        timer = self.clock.schedule_deadline(self._callback, 10)
+        start = time.time()
+        for i in range(num):
+            timer.reset(10)
+            if i % 100 == 0:
+                self._run_loop()
+        end = time.time()
+        self._output("deadline_timer_reset", start, end, num)
+        timer.cancel()
+
+    def testDelayReset(self):
+        num = 100000
+        for i in range(5):
+            self._reschedule(num)
+            self._run_loop()
+            self._deadline(num)
+            self._run_loop()
+
+        self.assertEqual(0, self.calls)
@@ -0,0 +1,112 @@
+import time
+import tracemalloc
+from unittest.mock import patch
+
+from mpf.core.logging import LogMixin
+from mpf.core.rgb_color import RGBColor
+from mpf.devices.light_group import LightGroup
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class BenchmarkLightGroups(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'benchmarks/machine_files/light_groups/'
+
+    def getOptions(self):
+        options = super().getOptions()
+        if self.unittest_verbosity() <= 1:
+            options["production"] = True
+        return options
+
+    def get_platform(self):
+        return 'virtual'
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        self.boot_time = 0
+        self.memory = 0
+        original_initialize = LightGroup._initialize
+
+        def _timed_initialize(group):
+            tracemalloc.start()
+            start = time.perf_counter()
+            yield from original_initialize(group)
+            self.boot_time += time.perf_counter() - start
+            self.memory += tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+        with patch.object(LightGroup, "_initialize", _timed_initialize):
+            super().setUp()
+
+    def _get_num_lights(self):
+        return sum(len(group.lights) for group in self.machine.light_stripes.values()) + \
+            sum(len(group.lights) for group in self.machine.light_rings.values())
+
+    def _run_frames(self, num, fade_ms):
+        groups = list(self.machine.light_stripes.values()) + list(self.machine.light_rings.values())
+        colors = [RGBColor("red"), RGBColor("blue")]
+        start = time.perf_counter()
+        for i in range(num):
+            for group in groups:
+                group.color(colors[i % 2], fade_ms=fade_ms, key="benchmark")
+            # one frame at 50Hz
+            self.advance_time_and_run(.02)
+        return time.perf_counter() - start
+
+    def testBenchmark(self):
+        num_lights = self._get_num_lights()
+        self.assertEqual(660, num_lights)
+
+        num = 500
+        self._run_frames(10, 0)
+        instant = self._run_frames(num, 0)
+        fade = self._run_frames(num, 100)
+        # a show step on single pixels on top of the group color
+        for i in range(0, 300, 3):
+            self.machine.lights["stripe1_light_{}".format(i)].color("white", priority=1, key="show")
+        overlay = self._run_frames(num, 100)
+
+        print("Lights: {} Boot: {:.3f}ms ({:.1f}us per light) Memory: {:.0f}KB ({:.0f} bytes per light) "
+              "Frame with group colors: {:.3f}ms with fades: {:.3f}ms with pixel overlay: {:.3f}ms".format(
+                  num_lights, self.boot_time * 1000, self.boot_time * 1000000 / num_lights,
+                  self.memory / 1024, self.memory / num_lights,
+                  instant * 1000 / num, fade * 1000 / num, overlay * 1000 / num))
+
+        self.advance_time_and_run(1)
+        self.assertLightColor("stripe1_light_0", "white")
+        self.assertLightColor("stripe1_light_1", "blue")
+        self.assertLightColor("ring1_light_59", "blue")
+        # one stack entry per group. pixels only store their own entries
+        self.assertEqual(1, len(self.machine.light_stripes["stripe1"].stack))
+        self.assertFalse(self.machine.lights["stripe1_light_1"].stack)
+
+    def _run_show_steps(self, num, settings):
+        player = self.machine.light_player
+        start = time.perf_counter()
+        for i in range(num):
+            player.play(settings[i % 2], "benchmark", None)
+            self.advance_time_and_run(.02)
+        return time.perf_counter() - start
+
+    def testBenchmarkLightPlayer(self):
+        player = self.machine.light_player
+        num = 500
+        # show steps which color whole groups and single lights by tag
+        stripes = [player.validate_config_entry({"stripes": color}, "benchmark") for color in ("red", "blue")]
+        inserts = [player.validate_config_entry({"inserts": color}, "benchmark") for color in ("red", "blue")]
+        self._run_show_steps(10, stripes)
+        groups = self._run_show_steps(num, stripes)
+        lights = self._run_show_steps(num, inserts)
+
+        print("Show step on 600 lights in two groups: {:.3f}ms on 100 lights: {:.3f}ms".format(
+            groups * 1000 / num, lights * 1000 / num))
+
+        self.assertLightColor("stripe2_light_299", "blue")
+        self.assertLightColor("l_insert99", "blue")
+        self.assertEqual(1, len(self.machine.light_stripes["stripe1"].stack))
+        self.assertFalse(self.machine.lights["stripe1_light_1"].stack)
@@ -0,0 +1,78 @@
+import time
+
+from mpf.core.logging import LogMixin
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class BenchmarkModeStartStop(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'benchmarks/machine_files/mode_start_stop/'
+
+    def getOptions(self):
+        options = super().getOptions()
+        if self.unittest_verbosity() <= 1:
+            options["production"] = True
+        return options
+
+    def get_platform(self):
+        return 'virtual'
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        super().setUp()
+
+    def _output(self, name, start, end, end2, num):
+        print("Duration {} {:.5f}ms Processing {:.5f}ms Total: {:5f}ms Per second: {:2f}".format(
+            name,
+            (1000 * (end - start) / num), ((end2 - end) * 1000) / num, (1000 * (end2 - start)) / num,
+            (num * 1) / (end2 - start)
+        ))
+
+    def _start_stop(self, num):
+        mode = self.machine.modes["mode_benchmark"]
+        start = time.time()
+        for i in range(num):
+            mode.start()
+            self.machine_run()
+            mode.stop()
+            self.machine_run()
+        end = time.time()
+        self.advance_time_and_run()
+        end2 = time.time()
+        return start, end, end2
+
+    def _mode_started(self, **kwargs):
+        del kwargs
+        self.starts += 1
+
+    def testModeStartStop(self):
+        self.starts = 0
+        self.machine.events.add_handler("mode_mode_benchmark_started", self._mode_started)
+
+        # first start compiles the activation plan
+        self.post_event("start_mode_benchmark")
+        self.assertModeRunning("mode_benchmark")
+        self.post_event("stop_mode_benchmark")
+        self.assertModeNotRunning("mode_benchmark")
+        handlers_before = sum(len(handlers) for handlers in self.machine.events.registered_handlers.values())
+
+        num = 200
+        total = 0
+        iterations = 10
+        for i in range(iterations):
+            start, end, end2 = self._start_stop(num)
+            total += (end2 - start) / num
+            self._output("mode_start_stop", start, end, end2, num)
+
+        print("Total average {:.5f}ms".format(total * 1000 / iterations))
+
+        # all handlers have to be removed again
+        self.assertEqual(1 + num * iterations, self.starts)
+        self.assertModeNotRunning("mode_benchmark")
+        self.assertEqual(handlers_before,
+                         sum(len(handlers) for handlers in self.machine.events.registered_handlers.values()))
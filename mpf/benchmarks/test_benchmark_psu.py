@@ -0,0 +1,70 @@
+import time
+from unittest.mock import MagicMock
+
+from mpf.core.logging import LogMixin
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class BenchmarkPsu(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'benchmarks/machine_files/psu/'
+
+    def getOptions(self):
+        options = super().getOptions()
+        if self.unittest_verbosity() <= 1:
+            options["production"] = True
+        return options
+
+    def get_platform(self):
+        return 'virtual'
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        super().setUp()
+        self.requested = {}
+        self.waits = {}
+        for coil in self.machine.coils:
+            coil.hw_driver.pulse = MagicMock(side_effect=lambda *args, name=coil.name: self._pulsed(name))
+
+    def _pulsed(self, name):
+        wait = self.machine.clock.get_time() - self.requested.pop(name)
+        self.waits.setdefault(name, []).append(wait)
+
+    def _burst(self):
+        """Drop bank reset, trough eject and kickback at the same instant."""
+        for name in ("c_drop_reset1", "c_drop_reset2", "c_drop_reset3", "c_drop_reset4", "c_drop_reset5",
+                     "c_trough_eject", "c_kickback"):
+            self.requested[name] = self.machine.clock.get_time()
+            self.machine.coils[name].pulse(max_wait_ms=500)
+
+    def _run(self, psu_name, num):
+        for coil in self.machine.coils:
+            coil.config['psu'] = self.machine.psus[psu_name]
+        self.waits = {}
+
+        start = time.time()
+        for _ in range(num):
+            self._burst()
+            self.advance_time_and_run(1)
+        duration = time.time() - start
+
+        self.assertFalse(self.requested)
+        all_waits = [wait for waits in self.waits.values() for wait in waits]
+        print("PSU: {:6} Bursts per second: {:.0f} Pulses per second: {:.0f} Max wait: {:.0f}ms "
+              "Max kickback wait: {:.0f}ms Max trough eject wait: {:.0f}ms".format(
+                  psu_name, num / duration, len(all_waits) / duration, 1000 * max(all_waits),
+                  1000 * max(self.waits["c_kickback"]), 1000 * max(self.waits["c_trough_eject"])))
+        return max(all_waits)
+
+    def testBurst(self):
+        num = 500
+        serial_wait = self._run("serial", num)
+        budget_wait = self._run("budget", num)
+        self.assertLess(budget_wait, serial_wait)
+        # the kickback never waits for the rest of the burst
+        self.assertLess(max(self.waits["c_kickback"]), .041)
@@ -0,0 +1,115 @@
+import random
+import time
+from functools import partial
+from unittest.mock import patch
+
+from mpf.core.logging import LogMixin
+from mpf.core.switch_controller import SwitchController
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class WaitPerCall:
+
+    """Registers switch handlers on every wait like wait_for_any_switch (for comparison)."""
+
+    def __init__(self, switch_controller, switch_names, state=1, ms=0):
+        self.switch_controller = switch_controller
+        self.switch_names = switch_names
+        self.state = state
+        self.ms = ms
+
+    def wait(self, only_on_change=True):
+        return self.switch_controller.wait_for_any_switch(self.switch_names, self.state, only_on_change, self.ms)
+
+    def close(self):
+        pass
+
+
+class BenchmarkScoreReels(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'benchmarks/machine_files/score_reels/'
+
+    def getOptions(self):
+        options = super().getOptions()
+        if self.unittest_verbosity() <= 1:
+            options["production"] = True
+        return options
+
+    def get_platform(self):
+        return 'virtual'
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        super().setUp()
+        self.handlers_added = 0
+        original_add = SwitchController.add_switch_handler_obj
+
+        def _counted_add(switch_controller, *args, **kwargs):
+            self.handlers_added += 1
+            return original_add(switch_controller, *args, **kwargs)
+
+        patcher = patch.object(SwitchController, "add_switch_handler_obj", _counted_add)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # the reels move the value switches when their coil is pulsed
+        for reel in self.machine.score_reels.values():
+            reel.position = 0
+            reel.config['coil_inc'].pulse = partial(self._pulse, reel)
+
+    def _pulse(self, reel, **kwargs):
+        del kwargs
+        self.machine.clock.loop.call_later(.05, self._advance, reel)
+        return 0
+
+    def _advance(self, reel):
+        self.machine.switch_controller.process_switch_obj(reel.value_switches[reel.position], 0, True)
+        reel.position = (reel.position + 1) % len(reel.value_switches)
+        self.machine.switch_controller.process_switch_obj(reel.value_switches[reel.position], 1, True)
+
+    def _run_scores(self, num):
+        """Set random values on all reels and wait for them num times."""
+        reels = list(self.machine.score_reels.values())
+        random.seed(42)
+        self.handlers_added = 0
+        start = time.perf_counter()
+        for _ in range(num):
+            for reel in reels:
+                reel.set_destination_value(random.randint(0, 9))
+            self.advance_time_and_run(5)
+        duration = time.perf_counter() - start
+        for reel in reels:
+            self.assertEqual(reel.position, reel.assumed_value)
+            self.assertEqual(reel._destination_value, reel.assumed_value)
+        return duration
+
+    def _output(self, name, duration, num):
+        print("{}: {:.3f}ms per score change on {} reels. {} switch handlers added".format(
+            name, duration * 1000 / num, len(self.machine.score_reels), self.handlers_added))
+
+    def testSwitchWatch(self):
+        self._run_scores(5)
+        num = 50
+        duration = self._run_scores(num)
+        self._output("Switch watch", duration, num)
+
+    def testWaitPerCall(self):
+        def _watch_any_switch(switch_controller, switch_names, state=1, ms=0):
+            return WaitPerCall(switch_controller, switch_names, state, ms)
+
+        with patch.object(SwitchController, "watch_any_switch", _watch_any_switch):
+            # restart the reel tasks with the old waits
+            for reel in self.machine.score_reels.values():
+                reel.stop()
+                reel._runner = self.machine.clock.loop.create_task(reel._run())
+            self.machine_run()
+            self.post_event("init_phase_3")
+            self._run_scores(5)
+            num = 50
+            duration = self._run_scores(num)
+        self._output("Wait per call", duration, num)
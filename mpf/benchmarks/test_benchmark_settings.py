@@ -0,0 +1,65 @@
+import time
+
+from mpf.core.logging import LogMixin
+from mpf.core.rgb_color import RGBColor
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class BenchmarkSettings(MpfTestCase):
+
+    """Measure settings reads and light updates which read the brightness setting."""
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'benchmarks/machine_files/shows/'
+
+    def getOptions(self):
+        options = super().getOptions()
+        if self.unittest_verbosity() <= 1:
+            options["production"] = True
+        return options
+
+    def get_platform(self):
+        return 'virtual'
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        super().setUp()
+
+    def _measure(self, name, function, num):
+        start = time.time()
+        for _ in range(num):
+            function()
+        end = time.time()
+        print("Duration {} {:.3f}us per call".format(name, 1000000 * (end - start) / num))
+
+    def testSettings(self):
+        num = 100000
+        settings = self.machine.settings
+        lights = list(self.machine.lights)
+        light = lights[0]
+        colors = [RGBColor((i % 256, 100, 200)) for i in range(16)]
+
+        for _ in range(5):
+            self.machine.set_machine_var("brightness", 0.8)
+            self._measure("get_setting_value", lambda: settings.get_setting_value("brightness"), num)
+            self._measure("get_machine_var", lambda: self.machine.get_machine_var("brightness"), num)
+            self._measure("snapshot_attribute", lambda: settings.snapshot.brightness, num)
+            self._measure("gamma_correct", lambda: light.gamma_correct(colors[0]), num)
+
+            start = time.time()
+            for i in range(num // 100):
+                for light in lights:
+                    light.color(colors[i % 16])
+                    light.get_color()
+            end = time.time()
+            print("Duration light_updates {:.3f}us per update".format(
+                1000000 * (end - start) / (num // 100 * len(lights))))
+
+            self.machine.set_machine_var("brightness", 1.0)
+            self._measure("gamma_correct_full_brightness", lambda: light.gamma_correct(colors[0]), num)
+
+        self.assertEqual(1.0, settings.snapshot.brightness)
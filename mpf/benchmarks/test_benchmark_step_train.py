@@ -0,0 +1,75 @@
+import asyncio
+import random
+import statistics
+import time
+import unittest
+
+from mpf.platforms.step_stick import LoopStepTrain
+
+
+class BenchmarkStepTrain(unittest.TestCase):
+
+    """Compare the step train with sleeping per edge on a real loop which is busy with simulated switch hits."""
+
+    steps = 1000
+    high_time = .0005
+    low_time = .0005
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.edges = []
+        self.random = random.Random(0)
+        self._load_handle = None
+
+    def tearDown(self):
+        self.loop.close()
+
+    def _enable(self):
+        self.edges.append(time.perf_counter())
+
+    def _disable(self):
+        pass
+
+    def _switch_load(self):
+        # most switch hits are cheap but some trigger long handler chains
+        end = time.perf_counter() + (.003 if self.random.random() < .02 else .0002)
+        while time.perf_counter() < end:
+            pass
+        self._load_handle = self.loop.call_later(.001, self._switch_load)
+
+    @asyncio.coroutine
+    def _sleep_steps(self):
+        # the previous implementation with two sleeps per step
+        for _ in range(self.steps):
+            self._enable()
+            yield from asyncio.sleep(self.high_time, loop=self.loop)
+            self._disable()
+            yield from asyncio.sleep(self.low_time, loop=self.loop)
+
+    def _run(self, name, load, train_class=None):
+        self.edges = []
+        if load:
+            self._switch_load()
+        start = time.perf_counter()
+        if train_class:
+            train = train_class(self.loop, self._enable, self._disable, self.steps, self.high_time, self.low_time)
+            train.start()
+            self.loop.run_until_complete(train.future)
+        else:
+            self.loop.run_until_complete(self._sleep_steps())
+        duration = time.perf_counter() - start
+        if self._load_handle:
+            self._load_handle.cancel()
+            self._load_handle = None
+
+        period = self.high_time + self.low_time
+        intervals = [second - first for first, second in zip(self.edges, self.edges[1:])]
+        print("{:<6} load: {:<5} Steps/s: {:>8.1f} (nominal {:.0f}) Jitter stdev: {:.3f}ms max: {:.3f}ms".format(
+            name, str(load), self.steps / duration, 1 / period,
+            statistics.pstdev(intervals) * 1000, max(abs(interval - period) for interval in intervals) * 1000))
+        self.assertEqual(self.steps, len(self.edges))
+
+    def testStepTrain(self):
+        for load in (False, True):
+            self._run("sleep", load)
+            self._run("loop", load, LoopStepTrain)
@@ -0,0 +1,52 @@
+import time
+
+from mpf.core.logging import LogMixin
+
+from mpf.tests.MpfTestCase import MpfTestCase, patch
+from mpf.tests.test_TextUi import HeadlessScreen
+
+
+class BenchmarkTextUi(MpfTestCase):
+
+    """Measure text UI redraw cost for switch bursts on a 128 switch matrix."""
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/text_ui/'
+
+    def getOptions(self):
+        options = super().getOptions()
+        options['text_ui'] = True
+        if self.unittest_verbosity() <= 1:
+            options["production"] = True
+        return options
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        self.screen = HeadlessScreen()
+        screen_open = patch('mpf.core.text_ui.Screen.open', return_value=self.screen)
+        screen_open.start()
+        self.addCleanup(screen_open.stop)
+        super().setUp()
+
+    def _hits(self, num):
+        cells_drawn = self.screen.cells_drawn
+        refreshes = self.screen.refreshes
+        start = time.time()
+        for i in range(num):
+            name = "s_matrix_{:03d}".format(i % 128)
+            self.machine.switch_controller.process_switch(name, 1, logical=True)
+            self.advance_time_and_run(.001)
+            self.machine.switch_controller.process_switch(name, 0, logical=True)
+            self.advance_time_and_run(.001)
+        end = time.time()
+        print("Duration {:.5f}ms per switch change. Refreshes: {} Cells drawn: {}".format(
+            1000 * (end - start) / (2 * num), self.screen.refreshes - refreshes,
+            self.screen.cells_drawn - cells_drawn))
+
+    def testSwitchBursts(self):
+        self.advance_time_and_run(1)
+        for i in range(5):
+            self._hits(1000)
@@ -0,0 +1,48 @@
+import asyncio
+import time
+import unittest
+
+from mpf.core.clock import ClockBase
+from mpf.tests.loop import TimeTravelLoop
+
+
+class BenchmarkTimerTicks(unittest.TestCase):
+
+    """Compare one periodic task per timer with shared interval ticks."""
+
+    def setUp(self):
+        self.loop = TimeTravelLoop()
+        self.clock = ClockBase(loop=self.loop)
+        self.calls = 0
+
+    def tearDown(self):
+        self.loop.close()
+
+    def _callback(self):
+        self.calls += 1
+
+    def _run(self, name, schedule, timers, interval, duration):
+        self.calls = 0
+        tasks = []
+        for i in range(timers):
+            tasks.append(schedule(self._callback, interval))
+            # timers are started in a few different events
+            if i % (timers // 4) == 0:
+                self.loop.run_until_complete(asyncio.sleep(interval / 2, loop=self.loop))
+        handles = len([handle for handle in self.loop._scheduled if not handle._cancelled])
+        start = time.time()
+        self.loop.run_until_complete(asyncio.sleep(duration, loop=self.loop))
+        end = time.time()
+        for task in tasks:
+            task.cancel()
+        print("Duration {} {:.3f}us per tick. Loop callbacks per interval: {}".format(
+            name, 1000000 * (end - start) / self.calls, handles))
+        return self.calls
+
+    def testTimerTicks(self):
+        timers = 200
+        for i in range(5):
+            calls_periodic = self._run("schedule_interval", self.clock.schedule_interval, timers, .01, 10)
+            calls_shared = self._run("schedule_shared_interval", self.clock.schedule_shared_interval,
+                                     timers, .01, 10)
+            self.assertEqual(calls_periodic, calls_shared)
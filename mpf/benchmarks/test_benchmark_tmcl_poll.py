@@ -0,0 +1,68 @@
+import time
+
+from mpf.core.logging import LogMixin
+
+from mpf.tests.MpfTestCase import MpfTestCase
+from mpf.tests.test_TrinamicsStepRocker import MockTMCLSerial
+
+
+class BenchmarkTMCLPoll(MpfTestCase):
+
+    """Measure loop stalls while two TMCL steppers move and get polled."""
+
+    def getConfigFile(self):
+        return 'trinamics_steprocker.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/trinamics_steprocker/'
+
+    def get_platform(self):
+        return False
+
+    def _mock_loop(self):
+        self.serialMock = MockTMCLSerial(self.loop)
+        # one request and one reply of 9 bytes at 9600 baud
+        self.serialMock.latency = 18 * 10 / 9600
+        self.serialMock.polls_per_move = 10
+        self.clock.mock_serial("/dev/ttyACM0", self.serialMock)
+
+    def setUp(self):
+        LogMixin.unit_test = False
+        super().setUp()
+
+    def _measure_run_once(self):
+        original_run_once = self.loop._run_once
+        self.stalls = []
+
+        def _run_once():
+            start = time.perf_counter()
+            original_run_once()
+            self.stalls.append(time.perf_counter() - start)
+
+        self.loop._run_once = _run_once
+
+    def testPoll(self):
+        self.advance_time_and_run(1)
+        self._measure_run_once()
+        del self.serialMock.requests[:]
+
+        num = 100
+        start = time.time()
+        for i in range(num):
+            position = (i % 2) * .5
+            self.machine.steppers.positionStepper._move_to_absolute_position(position)
+            self.machine.steppers.secondStepper._move_to_absolute_position(position / 2)
+            self.advance_time_and_run(2)
+            self.assertEqual(position, self.machine.steppers.positionStepper._current_position)
+        end = time.time()
+
+        requests = len(self.serialMock.requests)
+        cycles = len(set(timestamp for timestamp, _ in self.serialMock.requests))
+        print("Moves: {} Requests: {} Batches: {} Duration: {:.3f}s".format(num, requests, cycles, end - start))
+        print("Loop iteration max {:.3f}ms mean {:.3f}ms".format(
+            max(self.stalls) * 1000, sum(self.stalls) * 1000 / len(self.stalls)))
+        print("A blocking transport would have stalled the loop for {:.3f}ms per request ({:.1f}s in total)".format(
+            self.serialMock.latency * 1000, requests * self.serialMock.latency))
+        # no iteration may wait for the serial round trip. ignore outliers caused by gc or a busy host
+        stalls = sorted(self.stalls)
+        self.assertLess(stalls[int(len(stalls) * .99)], self.serialMock.latency)
@@ -8,13 +8,14 @@ import socket
 import sys
 from datetime import datetime
 import logging
-from logging.handlers import QueueHandler, SysLogHandler
+from logging.handlers import SysLogHandler
 from queue import Queue
 
 from asciimatics.screen import Screen
 
 from mpf.core.machine import MachineController
 from mpf.core.utility_functions import Util
+from mpf.core.logging import DeferredQueueHandler, LevelQueueListener
 from mpf.commands.logging_formatters import JSONFormatter
 
 
@@ -96,6 +97,14 @@ class Command:
                             help="Production mode. Will suppress errors, wait for hardware on start and "
                                  "try to exit when startup fails. Run this inside a loop.")
 
+        parser.add_argument("--profile-startup",
+                            action="store", dest="profile_startup", nargs="?",
+                            const="startup_profile.txt", default=None,
+                            metavar="file_name",
+                            help="Measures time and memory allocations of each "
+                                 "init step and writes a report to the logs "
+                                 "folder. Default file is startup_profile.txt")
+
         parser.add_argument("-t",
                             action="store_false", dest='text_ui', default=True,
                             help="Use the ASCII test-based UI")
@@ -178,13 +187,6 @@ class Command:
         console_log.setFormatter(logging.Formatter(
             '%(levelname)s : %(name)s : %(message)s'))
 
-        # initialise async handler for console
-        console_log_queue = Queue()
-        console_queue_handler = QueueHandler(console_log_queue)
-        self.console_queue_listener = logging.handlers.QueueListener(
-            console_log_queue, console_log)
-        self.console_queue_listener.start()
-
         # initialise file log
         file_log = logging.FileHandler(full_logfile_path)
         if self.args.jsonlogging:
@@ -193,18 +195,7 @@ class Command:
             formatter = logging.Formatter('%(asctime)s : %(levelname)s : %(name)s : %(message)s')
         file_log.setFormatter(formatter)
 
-        # initialise async handler for file log
-        file_log_queue = Queue()
-        file_queue_handler = QueueHandler(file_log_queue)
-        self.file_queue_listener = logging.handlers.QueueListener(
-            file_log_queue, file_log)
-        self.file_queue_listener.start()
-
-        # add loggers
-        logger = logging.getLogger()
-        logger.addHandler(console_queue_handler)
-        logger.addHandler(file_queue_handler)
-        logger.setLevel(self.args.loglevel)
+        handlers = [console_log, file_log]
 
         if self.args.syslog_address:
             try:
@@ -214,7 +205,19 @@ class Command:
             else:
                 syslog_logger = SysLogHandler((host, int(port)))
 
-            logger.addHandler(syslog_logger)
+            handlers.append(syslog_logger)
+
+        # initialise one async handler for all outputs. records are formatted
+        # in the listener thread and not in the event loop
+        log_queue = Queue()
+        queue_handler = DeferredQueueHandler(log_queue)
+        self.queue_listener = LevelQueueListener(log_queue, *handlers)
+        self.queue_listener.start()
+
+        # add loggers
+        logger = logging.getLogger()
+        logger.addHandler(queue_handler)
+        logger.setLevel(self.args.loglevel)
 
         try:
             MachineController(mpf_path, machine_path, vars(self.args)).run()
@@ -247,8 +250,7 @@ class Command:
             logging.exception(exception)
 
         logging.shutdown()
-        self.console_queue_listener.stop()
-        self.file_queue_listener.stop()
+        self.queue_listener.stop()
 
         if self.args.pause:
             input('Press ENTER to continue...')     # nosec
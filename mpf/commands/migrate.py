@@ -2,6 +2,7 @@
 
 import argparse
 import logging
+import multiprocessing
 import os
 from datetime import datetime
 import errno
@@ -33,6 +34,12 @@ class Command:
                                     "migration-%Y-%m-%d-%H-%M-%S.log")),
                             help="The name (and path) of the log file")
 
+        parser.add_argument("-j",
+                            action="store", dest="jobs", type=int,
+                            default=multiprocessing.cpu_count(),
+                            help="Number of processes which migrate files in "
+                                 "parallel. Default is the number of CPUs")
+
         args = parser.parse_args(args)
 
         try:
@@ -59,4 +66,4 @@ class Command:
         # add the handler to the root logger
         logging.getLogger('').addHandler(console)
 
-        Migrator(mpf_path, machine_path)
+        Migrator(mpf_path, machine_path, args.jobs)
@@ -0,0 +1,284 @@
+"""Command to replay a switch recording faster than real time."""
+import argparse
+import asyncio
+import copy
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import time
+import traceback
+from collections import Counter
+
+from mpf.commands.simulate import SimulationMachineController, SimulationError
+from mpf.core.switch_recorder import SwitchRecording
+from mpf.core.utility_functions import Util
+from mpf.tests.TestDataManager import TestDataManager
+
+
+class ReplayMachineController(SimulationMachineController):
+
+    """Simulated machine which starts with the persisted machine vars of a recording."""
+
+    # pylint: disable-msg=too-many-arguments
+    def __init__(self, mpf_path, machine_path, options, config_patches, machine_vars):
+        """Initialise replay machine."""
+        self._machine_vars = machine_vars
+        super().__init__(mpf_path, machine_path, options, config_patches)
+
+    def create_data_manager(self, config_name):
+        """Load machine vars from the recording and keep all other data in memory."""
+        if config_name == "machine_vars":
+            return TestDataManager(copy.deepcopy(self._machine_vars))
+        return super().create_data_manager(config_name)
+
+
+class SwitchReplay:
+
+    """Feeds a switch recording into a machine on the virtual platform.
+
+    The machine runs on a virtual clock so the replay runs as fast as the CPU
+    allows. The replayed machine records itself with the same recorder and
+    the result is compared to the original recording.
+    """
+
+    # maximum loop iterations to wait for the events and pulses which preceded a switch change
+    MAX_SYNC_STEPS = 100
+
+    # pylint: disable-msg=too-many-arguments
+    def __init__(self, mpf_path, machine_path, options, recording: SwitchRecording, output_file, profile=False):
+        """Initialise replay."""
+        self.mpf_path = mpf_path
+        self.machine_path = machine_path
+        self.options = options
+        self.recording = recording
+        self.output_file = output_file
+        self.profile = profile
+        self.machine = None     # type: ReplayMachineController
+
+    def _advance_to(self, timestamp):
+        """Advance the virtual clock to timestamp (relative to the start of the recording)."""
+        self.machine.advance(self.machine.switch_recorder.start_time + timestamp - self.machine.clock.get_time())
+
+    def _sync_outputs(self, output_index):
+        """Run the loop until the events and pulses which came before a switch change happened again.
+
+        Switch changes which happen at the same time as the machine acts
+        (e.g. a ball leaving the trough when the eject coil is pulsed) are
+        only in the right order if the machine already got that far.
+        """
+        loop = self.machine.clock.loop
+        for _ in range(self.MAX_SYNC_STEPS):
+            if self.machine.switch_recorder.output_count >= output_index:
+                return
+            loop.run_until_complete(asyncio.sleep(0, loop=loop))
+
+    def _boot(self):
+        config_patches = {
+            'mpf': {'switch_recorder_file': self.output_file},
+            # do not listen on any sockets
+            'bcp': [],
+            'virtual_platform_start_active_switches': self.recording.start_state.get("active_switches", [])}
+        self.machine = ReplayMachineController(self.mpf_path, self.machine_path, self.options, config_patches,
+                                               self.recording.start_state.get("machine_vars", {}))
+        self.machine.boot()
+
+    def _replay(self):
+        for timestamp, name, state, output_index in self.recording.switches:
+            if name not in self.machine.switches:
+                raise SimulationError("Switch {} from the recording does not exist.".format(name))
+            self._advance_to(timestamp)
+            self._sync_outputs(output_index)
+            self.machine.switch_controller.process_switch(name, state, logical=True)
+
+        self._advance_to(self.recording.final_time)
+
+    def run(self):
+        """Replay the recording and return the replayed recording and timings."""
+        result = {"errors": [], "wall_time": 0, "simulated_time": 0, "profile": None, "replayed": None}
+        try:
+            self._boot()
+        except Exception:   # pylint: disable-msg=broad-except
+            result["errors"].append("Boot failed: {}".format(traceback.format_exc()))
+            return result
+
+        profiler = cProfile.Profile() if self.profile else None
+        if profiler:
+            profiler.enable()
+
+        start = time.perf_counter()
+        try:
+            self._replay()
+        except SimulationError as e:
+            result["errors"].append(str(e))
+        except Exception:   # pylint: disable-msg=broad-except
+            result["errors"].append(traceback.format_exc())
+
+        result["wall_time"] = time.perf_counter() - start
+        result["simulated_time"] = self.machine.clock.get_time() - self.machine.switch_recorder.start_time
+
+        if profiler:
+            profiler.disable()
+            result["profile"] = pstats.Stats(profiler)
+
+        try:
+            self.machine.stop_simulation()
+        except Exception:   # pylint: disable-msg=broad-except
+            pass
+
+        result["replayed"] = SwitchRecording.load(self.output_file)
+        return result
+
+
+def _compare_dicts(prefix, recorded, replayed):
+    differences = []
+    for key in sorted(set(recorded) | set(replayed), key=str):
+        if recorded.get(key) != replayed.get(key):
+            differences.append("{}{}: recorded {!r} replayed {!r}".format(
+                prefix, key, recorded.get(key), replayed.get(key)))
+    return differences
+
+
+# pylint: disable-msg=too-many-locals
+def compare_recordings(recorded: SwitchRecording, replayed: SwitchRecording, context=5):
+    """Return a list of differences in posted events and final state between two recordings."""
+    differences = []
+    recorded_events = [name for _, name in recorded.events]
+    replayed_events = [name for _, name in replayed.events]
+    for index, (recorded_event, replayed_event) in enumerate(zip(recorded_events, replayed_events)):
+        if recorded_event != replayed_event:
+            break
+    else:
+        index = min(len(recorded_events), len(replayed_events))
+
+    if recorded_events != replayed_events:
+        timestamp = recorded.events[index][0] if index < len(recorded.events) else recorded.final_time
+        differences.append("Events diverge at event {} ({:.3f}s). Recorded: {} Replayed: {}".format(
+            index, timestamp, recorded_events[index:index + context], replayed_events[index:index + context]))
+        recorded_counts = Counter(recorded_events)
+        replayed_counts = Counter(replayed_events)
+        for event in sorted(set(recorded_counts) | set(replayed_counts)):
+            if recorded_counts[event] != replayed_counts[event]:
+                differences.append("Event {} posted {} times but replayed {} times".format(
+                    event, recorded_counts[event], replayed_counts[event]))
+
+    if recorded.final_state is None:
+        differences.append("Recording has no final state (not shut down properly).")
+        return differences
+
+    differences.extend(_compare_dicts("Machine var ", recorded.final_state["machine_vars"],
+                                      replayed.final_state["machine_vars"]))
+    recorded_players = recorded.final_state["players"]
+    replayed_players = replayed.final_state["players"]
+    if len(recorded_players) != len(replayed_players):
+        differences.append("Recorded {} players but replayed {} players".format(
+            len(recorded_players), len(replayed_players)))
+    for number, (recorded_player, replayed_player) in enumerate(zip(recorded_players, replayed_players), 1):
+        differences.extend(_compare_dicts("Player {} var ".format(number), recorded_player, replayed_player))
+
+    return differences
+
+
+def format_report(recording, result, differences, top):
+    """Return a human readable replay report."""
+    lines = ["Replayed {} switch changes and {} events ({:.0f}s) in {:.2f}s ({:.0f}x real time).".format(
+        len(recording.switches), len(recording.events), result["simulated_time"], result["wall_time"],
+        result["simulated_time"] / result["wall_time"] if result["wall_time"] else 0)]
+
+    if result["profile"]:
+        lines.append("")
+        lines.append("Top {} functions by own time:".format(top))
+        stats = sorted(result["profile"].stats.items(), key=lambda x: -x[1][2])[:top]
+        for (file_name, line, function), (_, calls, total_time, _, _) in stats:
+            lines.append("  {:>9.3f}s {:>10} {}:{}({})".format(
+                total_time, calls, os.path.basename(file_name), line, function))
+
+    lines.append("")
+    lines.append("Errors: {}".format(len(result["errors"])))
+    for error in result["errors"]:
+        lines.append("  " + error)
+
+    lines.append("Divergences: {}".format(len(differences)))
+    for difference in differences:
+        lines.append("  " + difference)
+
+    return "\n".join(lines)
+
+
+class Command:
+
+    """Replay a switch recording on the virtual platform faster than real time."""
+
+    # pylint: disable-msg=too-many-locals
+    def __init__(self, mpf_path, machine_path, args):
+        """Run mpf replay."""
+        parser = argparse.ArgumentParser(description='Replays a switch recording (see switch_recorder_file in the '
+                                                     'mpf section) faster than real time')
+
+        parser.add_argument("-r",
+                            action="store", dest="recording", required=True, metavar='file_name',
+                            help="The switch recording to replay")
+
+        parser.add_argument("-c",
+                            action="store", dest="configfile",
+                            default="config.yaml", metavar='config_file',
+                            help="The name of a config file to load. Default "
+                                 "is config.yaml. Multiple files can be used "
+                                 "via a comma-separated list (no spaces between)")
+
+        parser.add_argument("-C",
+                            action="store", dest="mpfconfigfile",
+                            default=os.path.join(mpf_path, "mpfconfig.yaml"),
+                            metavar='config_file',
+                            help="The MPF framework default config file. "
+                                 "Default is mpf/mpfconfig.yaml")
+
+        parser.add_argument("-a",
+                            action="store_true", dest="no_load_cache",
+                            help="Forces the config to be loaded from files "
+                                 "and not cache")
+
+        parser.add_argument("-o",
+                            action="store", dest="output", default=None, metavar='file_name',
+                            help="Where to store the recording of the replay. "
+                                 "Default is the recording with .replay appended")
+
+        parser.add_argument("--profile",
+                            action="store_true", dest="profile", default=False,
+                            help="Profile the replay and report the hot spots")
+
+        parser.add_argument("--top",
+                            action="store", dest="top", type=int, default=15,
+                            help="Number of functions in the report. Default is 15")
+
+        parser.add_argument("-v",
+                            action="store_const", dest="loglevel",
+                            const=logging.INFO, default=logging.ERROR,
+                            help="Enables logging to the console")
+
+        self.args = parser.parse_args(args)
+
+        options = {
+            'force_platform': 'virtual',
+            'production': False,
+            'mpfconfigfile': self.args.mpfconfigfile,
+            'configfile': Util.string_to_list(self.args.configfile),
+            'bcp': False,
+            'no_load_cache': self.args.no_load_cache,
+            'create_config_cache': True,
+            'text_ui': False,
+            'force_assets_load': False,
+            'profile_startup': None,
+        }
+
+        logging.basicConfig(level=self.args.loglevel)
+
+        recording_file = os.path.abspath(self.args.recording)
+        output_file = os.path.abspath(self.args.output or recording_file + ".replay")
+        recording = SwitchRecording.load(recording_file)
+        result = SwitchReplay(mpf_path, machine_path, options, recording, output_file, self.args.profile).run()
+        differences = compare_recordings(recording, result["replayed"]) if result["replayed"] else []
+        print(format_report(recording, result, differences, self.args.top))
+
+        sys.exit(1 if result["errors"] or differences else 0)
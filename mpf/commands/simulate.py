@@ -0,0 +1,485 @@
+"""Command to play simulated games faster than real time."""
+import argparse
+import asyncio
+import cProfile
+import logging
+import os
+import pstats
+import random
+import sys
+import time
+import traceback
+from collections import Counter
+from multiprocessing import Pool
+
+from mpf.core.flight_recorder import FlightRecorder
+from mpf.core.machine import MachineController
+from mpf.core.utility_functions import Util
+from mpf.tests.TestDataManager import TestDataManager
+from mpf.tests.loop import TimeTravelLoop, TestClock
+
+# switches with these tags are never hit randomly
+EXCLUDED_SWITCH_TAGS = {"start", "tilt", "slam_tilt", "tilt_warning", "service_esc", "service_up", "service_down",
+                        "service_enter", "service_door_open", "power_off"}
+
+
+class SimulationError(Exception):
+
+    """A simulated game could not continue."""
+
+
+class SimulationMachineController(MachineController):
+
+    """Machine controller which runs on a virtual clock and keeps all data in memory."""
+
+    def __init__(self, mpf_path, machine_path, options, config_patches):
+        """Initialise simulated machine."""
+        self._simulation_loop = TimeTravelLoop()
+        self._config_patches = config_patches
+        super().__init__(mpf_path, machine_path, options)
+
+    def _load_clock(self):
+        clock = TestClock(self._simulation_loop)
+        clock.loop.set_exception_handler(self._exception_handler)
+        return clock
+
+    def _exception_handler(self, loop, context):
+        """Remember the first exception and stop the loop."""
+        if not self._exception:
+            self._exception = context
+        loop.stop()
+
+    def _load_config(self):
+        super()._load_config()
+        self.config = Util.dict_merge(self.config, self._config_patches)
+
+    def create_data_manager(self, config_name):
+        """Keep all data in memory."""
+        del config_name
+        return TestDataManager({})
+
+    def boot(self):
+        """Initialise the machine on the virtual clock."""
+        loop = self.clock.loop
+        init = Util.ensure_future(self.initialise(), loop=loop)
+        try:
+            loop.run_until_complete(init)
+        except RuntimeError:
+            pass
+        if self._exception:
+            self.advance(0)
+        init.result()
+
+    def advance(self, delta):
+        """Advance the virtual clock and run everything scheduled in between.
+
+        Raises a SimulationError if a callback crashed.
+        """
+        loop = self.clock.loop
+        try:
+            loop.run_until_complete(asyncio.sleep(delay=max(delta, 0), loop=loop))
+        except RuntimeError:
+            if not self._exception:
+                raise
+
+        if self._exception:
+            context = self._exception
+            if 'exception' in context:
+                raise SimulationError("".join(traceback.format_exception(
+                    type(context['exception']), context['exception'], context['exception'].__traceback__)))
+            raise SimulationError(context.get('message', str(context)))
+
+    def stop_simulation(self):
+        """Post shutdown and stop the machine."""
+        self._do_stop()
+
+
+class GameSimulator:
+
+    """Boots one simulated machine and plays games with random switch activity.
+
+    Balls on the playfield hit random playfield switches, occasionally enter
+    ball devices and eventually drain. All randomness comes from one seed so
+    a run can be reproduced.
+    """
+
+    def __init__(self, mpf_path, machine_path, options, settings):
+        """Initialise simulator."""
+        self._machine_args = (mpf_path, machine_path, options)
+        self.settings = settings
+        self.rng = random.Random(settings['seed'])
+        self.machine = None     # type: SimulationMachineController
+        self.event_counts = Counter()
+        self.switch_hits = 0
+        self.errors = []
+        self._game_ended = False
+        self._playfield_switches = []
+        self._ball_switches = []
+        self._drains = []
+        self._captures = []
+
+    def _advance(self, delta):
+        """Advance the virtual clock and count the posted events."""
+        self.machine.advance(delta)
+        self._count_events()
+
+    def _count_events(self):
+        for _, record_type, name, _ in self.machine.flight_recorder.get_records():
+            if record_type == FlightRecorder.TYPE_NAMES[FlightRecorder.EVENT]:
+                self.event_counts[name] += 1
+        self.machine.flight_recorder.clear()
+
+    def _boot(self):
+        config_patches = {
+            'mpf': {'flight_recorder_size': 100000},
+            # do not listen on any sockets
+            'bcp': [],
+            'smart_virtual': {'simulate_manual_plunger': True,
+                              'simulate_manual_plunger_timeout': self.settings['plunger_time']}}
+        self.machine = SimulationMachineController(*self._machine_args, config_patches=config_patches)
+        self.machine.boot()
+
+        self.machine.events.add_handler('game_ended', self._game_ended_handler)
+
+        excluded_switches = set()
+        for device in self.machine.ball_devices:
+            if device.is_playfield():
+                continue
+            self._ball_switches.extend(device.config['ball_switches'])
+            excluded_switches.update(device.config['ball_switches'])
+            excluded_switches.update(device.config['hold_switches'])
+            for key in ('entrance_switch', 'jam_switch', 'confirm_eject_switch'):
+                if device.config[key]:
+                    excluded_switches.add(device.config[key])
+
+        self._playfield_switches = [switch for switch in self.machine.switches if
+                                    switch not in excluded_switches and
+                                    not EXCLUDED_SWITCH_TAGS.intersection(switch.tags)]
+        self._drains = [device for device in self.machine.ball_devices.items_tagged('drain')
+                        if not device.is_playfield()]
+        self._captures = [device for device in self.machine.ball_devices if
+                          not device.is_playfield() and device.config['ball_switches'] and
+                          device not in self._drains and 'trough' not in device.tags]
+
+        # fill troughs
+        for trough in self.machine.ball_devices.items_tagged('trough'):
+            for switch in trough.config['ball_switches']:
+                self.machine.switch_controller.process_switch(switch.name, 1, logical=True)
+        self._advance(self.settings['settle_time'])
+
+    def _game_ended_handler(self, **kwargs):
+        del kwargs
+        self._game_ended = True
+
+    def _hit_switch(self, switch):
+        self.machine.switch_controller.process_switch(switch.name, 1, logical=True)
+        self._advance(.02)
+        self.machine.switch_controller.process_switch(switch.name, 0, logical=True)
+        self.switch_hits += 1
+
+    def _balls_on_playfield(self):
+        """Return the number of balls which may drain or enter a device.
+
+        Returns 0 while ball devices are still counting because the playfield
+        count is not up to date in that case and a drain would add a ball
+        which does not exist.
+        """
+        active_switches = sum(1 for switch in self._ball_switches if
+                              self.machine.switch_controller.is_active(switch.name))
+        if active_switches != sum(device.balls for device in self.machine.ball_controller.routing.devices):
+            return 0
+
+        return sum(playfield.balls for playfield in self.machine.playfields)
+
+    def _add_ball_to_random_device(self, devices):
+        devices = [device for device in devices if device.balls < device.config['ball_capacity']]
+        if devices:
+            self.machine.default_platform.add_ball_to_device(self.rng.choice(devices))
+
+    def _start_game(self, game_number):
+        self._game_ended = False
+        start_switches = self.machine.switches.items_tagged('start')
+        if not start_switches:
+            raise SimulationError("Machine has no switch tagged start.")
+
+        self._hit_switch(start_switches[0])
+        for _ in range(100):
+            if self.machine.game:
+                return
+            self._advance(.1)
+
+        raise SimulationError("Game {} did not start.".format(game_number))
+
+    def _play_game(self, game_number):
+        self._start_game(game_number)
+        game_start = self.machine.clock.get_time()
+        while not self._game_ended:
+            if self.machine.clock.get_time() - game_start > self.settings['max_game_time']:
+                raise SimulationError("Game {} did not end after {}s.".format(
+                    game_number, self.settings['max_game_time']))
+
+            self._advance(self.rng.expovariate(1 / self.settings['switch_interval']))
+            if self.settings['scripted']:
+                continue
+
+            balls_on_playfield = self._balls_on_playfield()
+            if balls_on_playfield <= 0:
+                continue
+
+            roll = self.rng.random()
+            drain_chance = balls_on_playfield * self.settings['switch_interval'] / self.settings['ball_time']
+            if roll < drain_chance:
+                self._add_ball_to_random_device(self._drains)
+            elif roll < drain_chance + self.settings['capture_chance']:
+                self._add_ball_to_random_device(self._captures)
+            elif self._playfield_switches:
+                self._hit_switch(self.rng.choice(self._playfield_switches))
+
+        self._advance(self.settings['settle_time'])
+        self._check_ball_counts(game_number)
+
+    def _check_ball_counts(self, game_number):
+        """Verify that all balls are accounted for after a game."""
+        for playfield in self.machine.playfields:
+            if playfield.balls != 0:
+                self.errors.append("Seed {} game {}: {} has {} balls after game end.".format(
+                    self.settings['seed'], game_number, playfield.name, playfield.balls))
+
+        balls = 0
+        for device in self.machine.ball_controller.routing.devices:
+            balls += device.balls
+            if device.available_balls != device.balls:
+                self.errors.append("Seed {} game {}: {} has {} balls but {} available balls after game end.".format(
+                    self.settings['seed'], game_number, device.name, device.balls, device.available_balls))
+
+        if balls != self.machine.ball_controller.num_balls_known:
+            self.errors.append("Seed {} game {}: Found {} balls in devices but {} balls are known.".format(
+                self.settings['seed'], game_number, balls, self.machine.ball_controller.num_balls_known))
+
+    def run(self):
+        """Boot the machine, play all games and return the results."""
+        result = {"seed": self.settings['seed'], "games": 0, "boot_time": 0, "wall_time": 0,
+                  "simulated_time": 0, "profile": {}}
+        start = time.perf_counter()
+        try:
+            self._boot()
+        except Exception as e:  # pylint: disable-msg=broad-except
+            self.errors.append("Seed {}: Boot failed: {}".format(self.settings['seed'], e))
+            result["errors"] = self.errors
+            return result
+
+        result["boot_time"] = time.perf_counter() - start
+        simulation_start = self.machine.clock.get_time()
+
+        profiler = cProfile.Profile() if self.settings['profile'] else None
+        if profiler:
+            profiler.enable()
+
+        start = time.perf_counter()
+        try:
+            for game_number in range(1, self.settings['games'] + 1):
+                self._play_game(game_number)
+                result["games"] += 1
+        except SimulationError as e:
+            self.errors.append("Seed {}: {}".format(self.settings['seed'], e))
+        except Exception:   # pylint: disable-msg=broad-except
+            self.errors.append("Seed {}: {}".format(self.settings['seed'], traceback.format_exc()))
+
+        result["wall_time"] = time.perf_counter() - start
+        result["simulated_time"] = self.machine.clock.get_time() - simulation_start
+
+        if profiler:
+            profiler.disable()
+            for (file_name, line, function), (_, calls, total_time, _, _) in pstats.Stats(profiler).stats.items():
+                result["profile"]["{}:{}({})".format(os.path.basename(file_name), line, function)] = \
+                    (calls, total_time)
+
+        result["events"] = dict(self.event_counts)
+        result["switch_hits"] = self.switch_hits
+        result["errors"] = self.errors
+
+        try:
+            self.machine.stop_simulation()
+        except Exception:   # pylint: disable-msg=broad-except
+            pass
+
+        return result
+
+
+def run_simulation(mpf_path, machine_path, options, settings):
+    """Run one simulation. This is the entry point for worker processes."""
+    logging.basicConfig(level=settings['loglevel'])
+    return GameSimulator(mpf_path, machine_path, options, settings).run()
+
+
+def _run_simulation_task(task):
+    return run_simulation(*task)
+
+
+# pylint: disable-msg=too-many-locals
+def format_report(results, wall_time, processes, top):
+    """Return a human readable report for a list of simulation results."""
+    games = sum(result["games"] for result in results)
+    simulated_time = sum(result["simulated_time"] for result in results)
+    events = Counter()
+    profile = {}
+    errors = []
+    for result in results:
+        events.update(result.get("events", {}))
+        errors.extend(result["errors"])
+        for function, (calls, total_time) in result["profile"].items():
+            old_calls, old_time = profile.get(function, (0, 0))
+            profile[function] = (old_calls + calls, old_time + total_time)
+
+    lines = ["Simulated {} games in {:.2f}s ({:.2f} games/s) using {} process(es).".format(
+        games, wall_time, games / wall_time if wall_time else 0, processes),
+        "Simulated time: {:.0f}s ({:.0f}x real time). Average boot: {:.2f}s. Switch hits: {}".format(
+            simulated_time, simulated_time / wall_time if wall_time else 0,
+            sum(result["boot_time"] for result in results) / len(results),
+            sum(result.get("switch_hits", 0) for result in results))]
+
+    lines.append("")
+    lines.append("Top {} events:".format(top))
+    for event, count in events.most_common(top):
+        lines.append("  {:>10} {}".format(count, event))
+
+    if profile:
+        lines.append("")
+        lines.append("Top {} functions by own time:".format(top))
+        for function, (calls, total_time) in sorted(profile.items(), key=lambda x: -x[1][1])[:top]:
+            lines.append("  {:>9.3f}s {:>10} {}".format(total_time, calls, function))
+
+    lines.append("")
+    lines.append("Errors: {}".format(len(errors)))
+    for error in errors:
+        lines.append("  " + error)
+
+    return "\n".join(lines)
+
+
+class Command:
+
+    """Play simulated games on the smart_virtual platform faster than real time."""
+
+    # pylint: disable-msg=too-many-locals
+    def __init__(self, mpf_path, machine_path, args):
+        """Run mpf simulate."""
+        parser = argparse.ArgumentParser(description='Simulates games on the smart_virtual platform '
+                                                     'faster than real time')
+
+        parser.add_argument("-c",
+                            action="store", dest="configfile",
+                            default="config.yaml", metavar='config_file',
+                            help="The name of a config file to load. Default "
+                                 "is config.yaml. Multiple files can be used "
+                                 "via a comma-separated list (no spaces between)")
+
+        parser.add_argument("-C",
+                            action="store", dest="mpfconfigfile",
+                            default=os.path.join(mpf_path, "mpfconfig.yaml"),
+                            metavar='config_file',
+                            help="The MPF framework default config file. "
+                                 "Default is mpf/mpfconfig.yaml")
+
+        parser.add_argument("-a",
+                            action="store_true", dest="no_load_cache",
+                            help="Forces the config to be loaded from files "
+                                 "and not cache")
+
+        parser.add_argument("--games",
+                            action="store", dest="games", type=int, default=100,
+                            help="Total number of games to play. Default is 100")
+
+        parser.add_argument("--processes",
+                            action="store", dest="processes", type=int, default=1,
+                            help="Number of processes. Every process uses its own "
+                                 "seed (seed + process number). Default is 1")
+
+        parser.add_argument("--seed",
+                            action="store", dest="seed", type=int, default=0,
+                            help="Seed of the first process. Default is 0")
+
+        parser.add_argument("--max-game-time",
+                            action="store", dest="max_game_time", type=float, default=3600,
+                            help="Simulated seconds after which a game counts as "
+                                 "stuck. Default is 3600")
+
+        parser.add_argument("--switch-interval",
+                            action="store", dest="switch_interval", type=float, default=.5,
+                            help="Average simulated seconds between two playfield "
+                                 "actions. Default is 0.5")
+
+        parser.add_argument("--ball-time",
+                            action="store", dest="ball_time", type=float, default=30,
+                            help="Average simulated seconds a ball stays on the "
+                                 "playfield. Default is 30")
+
+        parser.add_argument("--capture-chance",
+                            action="store", dest="capture_chance", type=float, default=.02,
+                            help="Chance that a playfield action puts the ball into "
+                                 "a ball device. Default is 0.02")
+
+        parser.add_argument("--scripted",
+                            action="store_true", dest="scripted", default=False,
+                            help="Do not add random switch activity. Use the "
+                                 "switch_player section in your config to drive games")
+
+        parser.add_argument("--profile",
+                            action="store_true", dest="profile", default=False,
+                            help="Profile all handlers and report the hot spots")
+
+        parser.add_argument("--top",
+                            action="store", dest="top", type=int, default=15,
+                            help="Number of events and functions in the report. Default is 15")
+
+        parser.add_argument("-v",
+                            action="store_const", dest="loglevel",
+                            const=logging.INFO, default=logging.ERROR,
+                            help="Enables logging to the console")
+
+        self.args = parser.parse_args(args)
+
+        options = {
+            'force_platform': 'smart_virtual',
+            'production': False,
+            'mpfconfigfile': self.args.mpfconfigfile,
+            'configfile': Util.string_to_list(self.args.configfile),
+            'bcp': False,
+            'no_load_cache': self.args.no_load_cache,
+            'create_config_cache': True,
+            'text_ui': False,
+            'force_assets_load': False,
+            'profile_startup': None,
+        }
+
+        logging.basicConfig(level=self.args.loglevel)
+
+        processes = max(1, min(self.args.processes, self.args.games))
+        tasks = []
+        for process in range(processes):
+            settings = {
+                'seed': self.args.seed + process,
+                'games': self.args.games // processes + (1 if process < self.args.games % processes else 0),
+                'max_game_time': self.args.max_game_time,
+                'switch_interval': self.args.switch_interval,
+                'ball_time': self.args.ball_time,
+                'capture_chance': self.args.capture_chance,
+                'scripted': self.args.scripted,
+                'profile': self.args.profile,
+                'plunger_time': '1s',
+                'settle_time': 10,
+                'loglevel': self.args.loglevel,
+            }
+            tasks.append((mpf_path, machine_path, options, settings))
+
+        start = time.perf_counter()
+        if processes == 1:
+            results = [_run_simulation_task(tasks[0])]
+        else:
+            with Pool(processes) as pool:
+                results = pool.map(_run_simulation_task, tasks)
+
+        self.results = results
+        print(format_report(results, time.perf_counter() - start, processes, self.args.top))
+
+        sys.exit(1 if any(result["errors"] for result in results) else 0)
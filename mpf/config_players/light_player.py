@@ -1,20 +1,78 @@
 """Light config player."""
-from copy import deepcopy
+from typing import Dict, List, Tuple
+
 from mpf.config_players.device_config_player import DeviceConfigPlayer
 from mpf.core.rgb_color import RGBColor
 from mpf.core.utility_functions import Util
+from mpf.devices.light import Light
+from mpf.devices.light_group import LightGroup, LightGroupPixel
 
 
 class LightPlayer(DeviceConfigPlayer):
 
-    """Sets lights based on config."""
+    """Sets lights based on config.
+
+    Tags are resolved when the config is validated. Light groups which are
+    completely covered by a tag are replaced by the group so their color is
+    stored once in the stack of the group. All other lights which share a
+    setting are colored in one batch.
+    """
 
     config_file_section = 'light_player'
     show_section = 'lights'
     machine_collection_name = 'lights'
     allow_placeholders_in_keys = True
 
-    __slots__ = []
+    __slots__ = ["_targets"]
+
+    def __init__(self, machine):
+        """Initialise light player."""
+        super().__init__(machine)
+        self._targets = {}      # type: Dict[str, Tuple[List[LightGroup], List[Light]]]
+
+    def _validate_config_item(self, device, device_settings):
+        """Replace lights of completely covered light groups with the group."""
+        validated = super()._validate_config_item(device, device_settings)
+        groups, lights = self._split_groups([light for light in validated if isinstance(light, Light)])
+        if not groups:
+            return validated
+
+        settings = next(iter(validated.values()))
+        return_dict = {group: settings for group in groups}
+        return_dict.update({light: settings for light in lights})
+        return_dict.update({key: settings for key in validated if not isinstance(key, Light)})
+        return return_dict
+
+    @staticmethod
+    def _split_groups(lights) -> Tuple[List[LightGroup], List[Light]]:
+        """Return light groups which are completely in lights and the remaining lights."""
+        groups = []     # type: List[LightGroup]
+        all_lights = set(lights)
+        for light in lights:
+            if isinstance(light, LightGroupPixel) and light.group not in groups and \
+                    all_lights.issuperset(light.group.lights):
+                groups.append(light.group)
+
+        if not groups:
+            return groups, lights
+
+        grouped_lights = set(light for group in groups for light in group.lights)
+        return groups, [light for light in lights if light not in grouped_lights]
+
+    def _get_targets(self, light_name) -> Tuple[List[LightGroup], List[Light]]:
+        """Return the light groups and lights for a light name or tag (e.g. after replacing show tokens).
+
+        The result is cached because lights and tags do not change after init.
+        """
+        targets = self._targets.get(light_name)
+        if targets is None:
+            try:
+                lights = [self.machine.lights[light_name]]
+            except KeyError:
+                lights = self.machine.lights.items_tagged(light_name)
+
+            targets = self._targets[light_name] = self._split_groups(lights)
+        return targets
 
     def play(self, settings, context, calling_context, priority=0, **kwargs):
         """Set light color based on config."""
@@ -23,32 +81,41 @@ class LightPlayer(DeviceConfigPlayer):
         del kwargs
 
         for light, s in settings.items():
-            s = deepcopy(s)
-            try:
-                s['priority'] += priority
-            except KeyError:
-                s['priority'] = priority
+            if not isinstance(light, str):
+                continue
+            for light_name in Util.string_to_list(light):
+                # skip non-replaces placeholders
+                if not light_name or light_name[0:1] == "(" and light_name[-1:] == ")":
+                    continue
+                self._light_named_color(light_name, instance_dict, full_context, s['color'], s["fade"],
+                                        s.get('priority', 0) + priority)
+
+        for s, groups, lights in self._get_batches(settings).values():
+            self._lights_color(groups, lights, instance_dict, full_context, s['color'], s["fade"],
+                               s.get('priority', 0) + priority)
+
+    @staticmethod
+    def _get_batches(settings) -> Dict[int, Tuple[dict, List[LightGroup], List[Light]]]:
+        """Return light groups and lights which share their settings (e.g. all lights of a tag)."""
+        batches = {}    # type: Dict[int, Tuple[dict, List[LightGroup], List[Light]]]
+        for light, s in settings.items():
             if isinstance(light, str):
-                light_names = Util.string_to_list(light)
-                for light_name in light_names:
-                    # skip non-replaces placeholders
-                    if not light_name or light_name[0:1] == "(" and light_name[-1:] == ")":
-                        continue
-                    self._light_named_color(light_name, instance_dict, full_context, s['color'], s["fade"],
-                                            s['priority'])
+                continue
+            batch = batches.get(id(s))
+            if batch is None:
+                batch = batches[id(s)] = (s, [], [])
+            if isinstance(light, LightGroup):
+                batch[1].append(light)
             else:
-                self._light_color(light, instance_dict, full_context, s['color'], s["fade"], s['priority'])
+                batch[2].append(light)
+        return batches
 
     def _remove(self, settings, context, priority):
+        del priority
         instance_dict = self._get_instance_dict(context)
         full_context = self._get_full_context(context)
 
         for light, s in settings.items():
-            s = deepcopy(s)
-            try:
-                s['priority'] += priority
-            except KeyError:
-                s['priority'] = priority
             if isinstance(light, str):
                 light_names = Util.string_to_list(light)
                 for light_name in light_names:
@@ -57,12 +124,8 @@ class LightPlayer(DeviceConfigPlayer):
                 self._light_remove(light, instance_dict, full_context, s['fade'])
 
     def _light_remove_named(self, light_name, instance_dict, full_context, fade_ms):
-        try:
-            lights = [self.machine.lights[light_name]]
-        except KeyError:
-            lights = self.machine.lights.items_tagged(light_name)
-
-        for light in lights:
+        groups, lights = self._get_targets(light_name)
+        for light in groups + lights:
             self._light_remove(light, instance_dict, full_context, fade_ms)
 
     @staticmethod
@@ -83,32 +146,42 @@ class LightPlayer(DeviceConfigPlayer):
     # pylint: disable-msg=too-many-arguments
     def _light_named_color(self, light_name, instance_dict,
                            full_context, color, fade_ms, priority):
-        try:
-            lights = [self.machine.lights[light_name]]
-        except KeyError:
-            lights = self.machine.lights.items_tagged(light_name)
+        groups, lights = self._get_targets(light_name)
 
-        if not lights:
+        if not groups and not lights:
             raise AssertionError("Could not find light or tag {} in {}".format(light_name, full_context))
 
-        for light in lights:
-            self._light_color(light, instance_dict, full_context, color, fade_ms, priority)
+        self._lights_color(groups, lights, instance_dict, full_context, color, fade_ms, priority)
 
     # pylint: disable-msg=too-many-arguments
-    def _light_color(self, light, instance_dict, full_context, color, fade_ms, priority):
+    def _lights_color(self, groups, lights, instance_dict, full_context, color, fade_ms, priority):
+        """Set the same color on light groups and lights."""
         if color == "stop":
-            self._light_remove(light, instance_dict, full_context, fade_ms)
+            for light in groups + lights:
+                self._light_remove(light, instance_dict, full_context, fade_ms)
             return
-        if color != "on":
-            # hack to keep compatibility for matrix_light values
-            if len(color) == 1:
-                color = "0" + color + "0" + color + "0" + color
-            elif len(color) == 2:
-                color = color + color + color
-
-            color = RGBColor(color)
-        light.color(color, key=full_context, fade_ms=fade_ms, priority=priority)
-        instance_dict[light.name] = light
+
+        color = self._parse_color(color)
+        for group in groups:
+            group.color(color, key=full_context, fade_ms=fade_ms, priority=priority)
+            instance_dict[group.name] = group
+
+        Light.color_lights(lights, color, key=full_context, fade_ms=fade_ms, priority=priority)
+        for light in lights:
+            instance_dict[light.name] = light
+
+    @staticmethod
+    def _parse_color(color):
+        if color == "on":
+            return color
+
+        # hack to keep compatibility for matrix_light values
+        if len(color) == 1:
+            color = "0" + color + "0" + color + "0" + color
+        elif len(color) == 2:
+            color = color + color + color
+
+        return RGBColor(color)
 
     def clear_context(self, context):
         """Remove all colors which were set in context."""
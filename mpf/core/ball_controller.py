@@ -5,6 +5,7 @@ from typing import Generator, Union, Iterable
 
 from mpf.devices.ball_device.ball_device import BallDevice
 
+from mpf.core.ball_routing import BallRoutingGraph
 from mpf.core.delays import DelayManager
 from mpf.core.machine import MachineController
 from mpf.core.utility_functions import Util
@@ -17,7 +18,7 @@ class BallController(MpfController):
 
     config_name = "ball_controller"
 
-    __slots__ = ["delay", "num_balls_known", "_add_new_balls_task", "_captured_balls"]
+    __slots__ = ["delay", "num_balls_known", "_add_new_balls_task", "_captured_balls", "routing"]
 
     def __init__(self, machine: MachineController) -> None:
         """Initialise ball controller.
@@ -33,6 +34,9 @@ class BallController(MpfController):
 
         self.num_balls_known = 0
 
+        self.routing = BallRoutingGraph(machine)
+        '''Routing graph of all ball devices. Built on first use.'''
+
         # register for events
         self.machine.events.add_handler('request_to_start_game',
                                         self.request_to_start_game)
@@ -51,12 +55,7 @@ class BallController(MpfController):
         del kwargs
 
         # see if there are non-playfield devices
-        for device in self.machine.ball_devices:
-            if device.is_playfield():
-                continue
-            # found a device
-            break
-        else:
+        if not self.routing.devices:
             # there is no non-playfield device. end this.
             return
 
@@ -80,10 +79,7 @@ class BallController(MpfController):
         """Return the total ball count over all devices in the machine."""
         balls = 0
         # get count for all ball devices
-        for device in self.machine.ball_devices:
-            if device.is_playfield():
-                continue
-
+        for device in self.routing.devices:
             balls += device.ball_count_handler.counter.count_balls_sync()
         return balls
 
@@ -131,10 +127,9 @@ class BallController(MpfController):
             # wait until all devices are stable
             # prepare futures in case we have to wait to prevent race between count and building futures
             futures = []
-            for device in self.machine.ball_devices:
-                if not device.is_playfield():
-                    futures.append(Util.ensure_future(device.ball_count_handler.counter.wait_for_ball_activity(),
-                                                      loop=self.machine.clock.loop))
+            for device in self.routing.devices:
+                futures.append(Util.ensure_future(device.ball_count_handler.counter.wait_for_ball_activity(),
+                                                  loop=self.machine.clock.loop))
 
             try:
                 return self._get_total_balls_in_devices()
@@ -0,0 +1,131 @@
+"""Contains the BallRoutingGraph which precomputes eject paths between ball devices."""
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.machine import MachineController
+    from mpf.devices.ball_device.ball_device import BallDevice
+    from typing import Deque
+
+__api__ = ['BallRoutingGraph']
+
+
+class BallRoutingGraph:
+
+    """Routing table of all ball devices and playfields.
+
+    Devices are nodes and ``eject_targets`` are edges. Playfields are only
+    endpoints because balls cannot be routed through a playfield. The graph
+    is built once on first use (after all ball devices loaded their config)
+    and contains the shortest path between all pairs of devices and the
+    nearest trough of every device. Devices which have available balls are
+    tracked incrementally by BallDevice so finding a source for a ball does
+    not need to walk the graph.
+    """
+
+    __slots__ = ["machine", "_built", "_devices", "_paths", "_next_trough", "_sources", "_devices_with_balls"]
+
+    def __init__(self, machine: "MachineController") -> None:
+        """Initialise routing graph."""
+        self.machine = machine
+        self._built = False
+        self._devices = []                  # type: List[BallDevice]
+        self._paths = {}                    # type: Dict[Tuple[BallDevice, BallDevice], Tuple[BallDevice, ...]]
+        self._next_trough = {}              # type: Dict[BallDevice, Optional[BallDevice]]
+        self._sources = {}                  # type: Dict[BallDevice, List[BallDevice]]
+        self._devices_with_balls = set()    # type: Set[BallDevice]
+
+    @property
+    def devices(self) -> List["BallDevice"]:
+        """Return all ball devices which are not playfields."""
+        self._build_if_needed()
+        return self._devices
+
+    def _build_if_needed(self) -> None:
+        if not self._built:
+            self.build()
+
+    def build(self) -> None:
+        """Compute all paths and the nearest troughs."""
+        self._devices = [device for device in self.machine.ball_devices if not device.is_playfield()]
+        self._paths = {}
+        self._sources = {}
+        self._next_trough = {}
+
+        for source in self._devices:
+            for target, path in self._shortest_paths_from(source).items():
+                self._paths[(source, target)] = path
+                if not target.is_playfield():
+                    self._sources.setdefault(target, []).append(source)
+
+        for target, sources in self._sources.items():
+            sources.sort(key=lambda x, target=target: len(self._paths[(x, target)]))
+
+        for device in self._devices:
+            self._next_trough[device] = self._find_nearest_trough(device)
+
+        self._built = True
+
+    @staticmethod
+    def _shortest_paths_from(source: "BallDevice") -> Dict["BallDevice", Tuple["BallDevice", ...]]:
+        """Breadth-first search along eject_targets. Ties are resolved in eject_targets order."""
+        paths = {}
+        queue = deque([(source, (source, ))])
+        while queue:
+            device, path = queue.popleft()
+            for target in device.config['eject_targets']:
+                if target in paths:
+                    continue
+                paths[target] = path + (target, )
+                # do not route through playfields or loop back through the source
+                if not target.is_playfield() and target is not source:
+                    queue.append((target, paths[target]))
+
+        return paths
+
+    def _find_nearest_trough(self, device: "BallDevice") -> Optional["BallDevice"]:
+        if 'trough' in device.tags:
+            return device
+
+        nearest_trough = None
+        nearest_path_length = 0
+        for target in self._devices:
+            path = self._paths.get((device, target))
+            if 'trough' in target.tags and path and (not nearest_trough or len(path) < nearest_path_length):
+                nearest_trough = target
+                nearest_path_length = len(path)
+
+        return nearest_trough
+
+    def find_path(self, source: "BallDevice", target: "BallDevice") -> Optional["Deque[BallDevice]"]:
+        """Return the shortest path from source to target or None if there is no path."""
+        self._build_if_needed()
+        path = self._paths.get((source, target))
+        if not path:
+            return None
+        return deque(path)
+
+    def find_next_trough(self, device: "BallDevice") -> Optional["BallDevice"]:
+        """Return the nearest trough reachable from device (or device if it is a trough)."""
+        self._build_if_needed()
+        return self._next_trough.get(device)
+
+    def find_one_available_ball(self, target: "BallDevice") -> Optional["Deque[BallDevice]"]:
+        """Return the shortest path from the nearest device with an available ball to target."""
+        self._build_if_needed()
+        if not self._devices_with_balls:
+            return None
+
+        for source in self._sources.get(target, []):
+            if source in self._devices_with_balls and source is not target:
+                return deque(self._paths[(source, target)])
+
+        return None
+
+    def update_available_balls(self, device: "BallDevice", available_balls: int) -> None:
+        """Update the index of devices with available balls."""
+        if available_balls > 0:
+            self._devices_with_balls.add(device)
+        else:
+            self._devices_with_balls.discard(device)
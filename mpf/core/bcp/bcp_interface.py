@@ -21,7 +21,9 @@ class BcpInterface(MpfController):
 
     The following BCP commands are currently implemented:
         error
+        flight_recorder
         get
+        handler_profile?count=x
         hello?version=xxx&controller_name=xxx&controller_version=xxx
         mode_start?name=xxx&priority=xxx
         mode_stop?name=xxx
@@ -67,6 +69,8 @@ class BcpInterface(MpfController):
             monitor_stop=self._bcp_receive_monitor_stop,
             set_machine_var=self._bcp_receive_set_machine_var,
             service=self._service,
+            flight_recorder=self._bcp_receive_flight_recorder,
+            handler_profile=self._bcp_receive_handler_profile,
         )
         self._shows = {}
 
@@ -107,6 +111,23 @@ class BcpInterface(MpfController):
         del client
         self.machine.set_machine_var(name, value)
 
+    @asyncio.coroutine
+    def _bcp_receive_flight_recorder(self, client, **kwargs):
+        """Send all records of the flight recorder to the client."""
+        del kwargs
+        self.machine.bcp.transport.send_to_client(client, "flight_recorder",
+                                                  records=self.machine.flight_recorder.get_records())
+
+    @asyncio.coroutine
+    def _bcp_receive_handler_profile(self, client, count=None, **kwargs):
+        """Send the handlers with the highest total time to the client."""
+        del kwargs
+        if count is None:
+            count = self.machine.config['mpf']['handler_profiler_report_size']
+        self.machine.bcp.transport.send_to_client(client, "handler_profile",
+                                                  interval=self.machine.handler_profiler.interval,
+                                                  handlers=self.machine.handler_profiler.get_top(int(count)))
+
     @asyncio.coroutine
     def _service_stop(self, client):
         for show in self._shows.values():
@@ -383,17 +404,20 @@ class BcpInterface(MpfController):
     def _monitor_player_vars(self, client):
         # Setup player variables to be monitored (if necessary)
         if not self.machine.bcp.transport.get_transports_for_handler("_player_vars"):
-            Player.monitor_enabled = True
+            Player.enable_monitor()
             self.machine.register_monitor('player', self._player_var_change)
 
         self.machine.bcp.transport.add_handler_to_transport("_player_vars", client)
 
     def _monitor_player_vars_stop(self, client):
+        if client not in self.machine.bcp.transport.get_transports_for_handler("_player_vars"):
+            # do not disable monitoring for other users (e.g. OSC)
+            return
         self.machine.bcp.transport.remove_transport_from_handle("_player_vars", client)
 
         # If there are no more clients monitoring player variables, stop monitoring
         if not self.machine.bcp.transport.get_transports_for_handler("_player_vars"):
-            Player.monitor_enabled = False
+            Player.disable_monitor()
 
     def _monitor_machine_vars(self, client):
         # Setup machine variables to be monitored (if necessary)
@@ -45,16 +45,177 @@ class PeriodicTask:
         self._canceled = True
 
 
+class DeadlineTimer:
+
+    """A one-shot timer which can be pushed back cheaply.
+
+    Resetting the timer only moves the stored deadline. At most one loop
+    callback is scheduled at any time. When it fires before the deadline it
+    reschedules itself for the deadline. Only a reset to an earlier deadline
+    needs to cancel the loop callback.
+    """
+
+    __slots__ = ["_loop", "_callback", "_deadline", "_handle", "_handle_time", "_canceled"]
+
+    def __init__(self, timeout, loop, callback):
+        """Initialise deadline timer."""
+        self._loop = loop
+        self._callback = callback
+        self._canceled = False
+        self._handle = None
+        self._handle_time = None
+        self._deadline = self._loop.time() + timeout
+        self._schedule()
+
+    def _schedule(self):
+        self._handle_time = self._deadline
+        self._handle = self._loop.call_at(self._deadline, self._run)
+
+    def get_next_call_time(self):
+        """Return time of next call."""
+        return self._deadline
+
+    def reset(self, timeout, callback=None):
+        """Move the deadline to <timeout> seconds from now and optionally replace the callback."""
+        if callback:
+            self._callback = callback
+        self._canceled = False
+        self._deadline = self._loop.time() + timeout
+        if not self._handle:
+            self._schedule()
+        elif self._deadline < self._handle_time:
+            self._handle.cancel()
+            self._schedule()
+
+    def _run(self):
+        self._handle = None
+        if self._canceled:
+            return
+        if self._loop.time() < self._deadline:
+            # deadline was pushed back since we scheduled the loop callback
+            self._schedule()
+            return
+        self._canceled = True
+        self._callback()
+
+    def cancel(self):
+        """Cancel deadline timer."""
+        self._canceled = True
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+
+class SharedIntervalTask:
+
+    """Member of a SharedIntervalGroup. Returned by schedule_shared_interval."""
+
+    __slots__ = ["_group", "_callback", "_next_call", "_canceled"]
+
+    def __init__(self, group, callback, next_call):
+        """Initialise shared interval task."""
+        self._group = group
+        self._callback = callback
+        self._next_call = next_call
+        self._canceled = False
+
+    def get_next_call_time(self):
+        """Return time of next call."""
+        return self._next_call
+
+    def cancel(self):
+        """Cancel shared interval task."""
+        if self._canceled:
+            return
+        self._canceled = True
+        self._group.remove(self)
+
+
+class SharedIntervalGroup:
+
+    """Runs all tasks with the same interval and phase in one loop callback.
+
+    Ticks are aligned to the epoch of the group (the time it was created).
+    A task only joins a group if the next tick of the group is exactly one
+    interval away. Otherwise, it creates a new group. Therefore, every task
+    still gets its first tick one interval after it has been scheduled.
+    """
+
+    __slots__ = ["_loop", "_interval", "_groups", "_key", "_context", "_next_call", "_handle", "_tasks"]
+
+    # maximum phase difference between two tasks in the same group (in seconds)
+    TOLERANCE = 0.0005
+
+    def __init__(self, interval, loop, groups, context=None):
+        """Initialise shared interval group and register it in groups."""
+        self._loop = loop
+        self._interval = interval
+        self._groups = groups
+        self._key = (interval, context)
+        self._context = context
+        self._groups.setdefault(self._key, []).append(self)
+        self._tasks = []
+        self._next_call = self._loop.time() + interval
+        self._handle = self._loop.call_at(self._next_call, self._run)
+
+    def is_aligned(self, next_call):
+        """Return true if a task which is due at next_call can join this group."""
+        return abs(self._next_call - next_call) <= self.TOLERANCE
+
+    def add(self, callback):
+        """Add a task to the group."""
+        task = SharedIntervalTask(self, callback, self._next_call)
+        self._tasks.append(task)
+        return task
+
+    def remove(self, task):
+        """Remove a task and stop the group when it was the last one."""
+        self._tasks.remove(task)
+        if not self._tasks:
+            self._handle.cancel()
+            groups = self._groups[self._key]
+            groups.remove(self)
+            if not groups:
+                del self._groups[self._key]
+
+    def _run(self):
+        now = self._next_call
+        self._next_call += self._interval
+        self._handle = self._loop.call_at(self._next_call, self._run)
+        if self._context:
+            with self._context():
+                self._run_tasks(now)
+        else:
+            self._run_tasks(now)
+
+    def _run_tasks(self, now):
+        # tasks may be added or canceled by callbacks
+        for task in list(self._tasks):
+            # pylint: disable-msg=protected-access
+            if task._canceled or task._next_call > now:
+                continue
+            task._next_call = self._next_call
+            try:
+                task._callback()
+            except Exception as e:  # pylint: disable-msg=broad-except
+                # report it like the loop does for a failing callback and run all other tasks
+                self._loop.call_exception_handler({
+                    'message': 'Exception in shared interval task {}'.format(task._callback),
+                    'exception': e,
+                })
+
+
 class ClockBase(LogMixin):
 
     """A clock object with event support."""
 
-    __slots__ = ["machine", "loop"]
+    __slots__ = ["machine", "loop", "_shared_interval_groups"]
 
     def __init__(self, machine=None, loop=None):
         """Initialise clock."""
         super().__init__()
         self.machine = machine
+        self._shared_interval_groups = {}
 
         # needed since the test clock is setup before the machine
         if machine:
@@ -196,6 +357,62 @@ class ClockBase(LogMixin):
 
         return periodic_task
 
+    def schedule_shared_interval(self, callback, timeout, context=None):
+        """Schedule an event to be called every <timeout> seconds on a shared tick.
+
+        All callbacks with the same interval (and context) which have been
+        scheduled in phase are called in one pass from a single loop callback.
+        The first call still happens <timeout> seconds after scheduling.
+
+        Args:
+            callback: callback to call on timeout
+            timeout: period to wait
+            context: optional context manager factory which wraps every pass
+
+        Returns:
+            A SharedIntervalTask object.
+        """
+        if not callable(callback):
+            raise AssertionError('callback must be a callable, got {}'.format(callback))
+
+        next_call = self.loop.time() + timeout
+        for group in self._shared_interval_groups.get((timeout, context), []):
+            if group.is_aligned(next_call):
+                break
+        else:
+            group = SharedIntervalGroup(timeout, self.loop, self._shared_interval_groups, context)
+
+        if self._debug_to_console or self._debug_to_file:
+            self.debug_log("Scheduled a shared recurring clock callback (callback=%s, timeout=%s)",
+                           str(callback), timeout)
+
+        return group.add(callback)
+
+    def schedule_deadline(self, callback, timeout):
+        """Schedule a resettable event in <timeout> seconds.
+
+        Use this instead of unschedule + schedule_once for timers which are
+        pushed back frequently (e.g. watchdogs which are reset on every
+        switch hit).
+
+        Args:
+            callback: callback to call on timeout
+            timeout: seconds to wait
+
+        Returns:
+            A DeadlineTimer object.
+        """
+        if not callable(callback):
+            raise AssertionError('callback must be a callable, got {}'.format(callback))
+
+        deadline_timer = DeadlineTimer(timeout, self.loop, callback)
+
+        if self._debug_to_console or self._debug_to_file:
+            self.debug_log("Scheduled a deadline clock callback (callback=%s, timeout=%s)",
+                           str(callback), timeout)
+
+        return deadline_timer
+
     @staticmethod
     def unschedule(event):
         """Remove a previously scheduled event. Wrapper for cancel for compatibility to kivy clock.
@@ -23,7 +23,7 @@ class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
     show_section = None                 # type: str
     machine_collection_name = None      # type: str
 
-    __slots__ = ["device_collection", "machine", "mode_event_keys", "instances", "_show_keys"]
+    __slots__ = ["device_collection", "machine", "mode_event_keys", "instances", "_show_keys", "_mode_plans"]
 
     def __init__(self, machine):
         """Initialise config player."""
@@ -45,6 +45,7 @@ class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
         self.instances['_global'] = dict()
         self.instances['_global'][self.config_file_section] = dict()
         self._show_keys = {}
+        self._mode_plans = {}
 
     def _add_handlers(self):
         self.machine.events.add_handler('init_phase_1', self._initialize_in_mode, priority=20)
@@ -271,47 +272,66 @@ class ConfigPlayer(LogMixin, metaclass=abc.ABCMeta):
     def register_player_events(self, config, mode: Mode = None, priority=0):
         """Register events for standalone player."""
         # config is localized
-        key_list = list()
         subscription_list = dict()      # type: Dict[BoolTemplate, asyncio.Future]
 
-        if config:
-            for event, settings in config.items():
-                # prevent runtime crashes
-                if (not mode or (mode and not mode.is_game_mode)) and not self.is_entry_valid_outside_mode(settings):
-                    raise ConfigFileError("Section not valid outside of game modes. {} {}:{} Mode: {}".format(
-                        self, event, settings, mode
-                    ), 1, self.config_file_section)
-                if event.startswith("{") and event.endswith("}"):
-                    condition = event[1:-1]
-                    self._create_subscription(condition, subscription_list, settings, priority, mode)
-                else:
-                    event, actual_priority = self._parse_event_priority(event, priority)
-
-                    if mode and event in mode.config['mode']['start_events']:
-                        self.machine.log.error(
-                            "{0} mode's {1}: section contains a \"{2}:\" event "
-                            "which is also in the start_events: for the {0} mode. "
-                            "Change the {1}: {2}: event name to "
-                            "\"mode_{0}_started:\"".format(
-                                mode.name, self.config_file_section, event))
-
-                        raise ValueError(
-                            "{0} mode's {1}: section contains a \"{2}:\" event "
-                            "which is also in the start_events: for the {0} mode. "
-                            "Change the {1}: {2}: event name to "
-                            "\"mode_{0}_started:\"".format(
-                                mode.name, self.config_file_section, event))
-
-                    key_list.append(
-                        self.machine.events.add_handler(
-                            event=event,
-                            handler=self.config_play_callback,
-                            calling_context=event,
-                            priority=actual_priority,
-                            mode=mode,
-                            settings=settings))
-
-        return key_list, subscription_list
+        if not config:
+            return list(), subscription_list
+
+        if mode:
+            # mode configs do not change so the handlers are planned only once per mode
+            plan = self._mode_plans.get(mode)
+            if not plan or plan[0] is not config:
+                plan = (config, ) + self._plan_player_events(config, mode)
+                self._mode_plans[mode] = plan
+            _, handlers, subscriptions = plan
+        else:
+            handlers, subscriptions = self._plan_player_events(config, mode)
+
+        for condition, settings in subscriptions:
+            self._create_subscription(condition, subscription_list, settings, priority, mode)
+
+        return self.machine.events.add_planned_handlers(handlers, priority), subscription_list
+
+    def _plan_player_events(self, config, mode: Mode = None):
+        """Validate config and return planned handlers and subscriptions with priorities relative to the mode."""
+        handlers = list()
+        subscriptions = list()
+        for event, settings in config.items():
+            # prevent runtime crashes
+            if (not mode or (mode and not mode.is_game_mode)) and not self.is_entry_valid_outside_mode(settings):
+                raise ConfigFileError("Section not valid outside of game modes. {} {}:{} Mode: {}".format(
+                    self, event, settings, mode
+                ), 1, self.config_file_section)
+            if event.startswith("{") and event.endswith("}"):
+                subscriptions.append((event[1:-1], settings))
+            else:
+                event, actual_priority = self._parse_event_priority(event, 0)
+
+                if mode and event in mode.config['mode']['start_events']:
+                    self.machine.log.error(
+                        "{0} mode's {1}: section contains a \"{2}:\" event "
+                        "which is also in the start_events: for the {0} mode. "
+                        "Change the {1}: {2}: event name to "
+                        "\"mode_{0}_started:\"".format(
+                            mode.name, self.config_file_section, event))
+
+                    raise ValueError(
+                        "{0} mode's {1}: section contains a \"{2}:\" event "
+                        "which is also in the start_events: for the {0} mode. "
+                        "Change the {1}: {2}: event name to "
+                        "\"mode_{0}_started:\"".format(
+                            mode.name, self.config_file_section, event))
+
+                handlers.append(
+                    self.machine.events.plan_handler(
+                        event=event,
+                        handler=self.config_play_callback,
+                        calling_context=event,
+                        priority=actual_priority,
+                        mode=mode,
+                        settings=settings))
+
+        return handlers, subscriptions
 
     def unload_player_events(self, key_list):
         """Remove event for standalone player."""
@@ -5,6 +5,8 @@ from functools import partial
 
 from typing import Any, Callable, Dict, Set
 
+from mpf.core.clock import DeadlineTimer
+from mpf.core.handler_profiler import HandlerProfiler
 from mpf.core.mpf_controller import MpfController
 
 MYPY = False
@@ -148,10 +150,14 @@ class DelayManager(MpfController):
               **kwargs) -> str:
         """Reset a delay.
 
-        Resetting will first delete the existing delay (if it exists) and then
-        add new delay with the new settings. If the delay does not exist,
-        that's ok, and this method is essentially the same as just adding a
-        delay with this name.
+        Resetting will move the existing delay (if it exists) to the new
+        time and replace its callback. If the delay does not exist, that's
+        ok, and this method is essentially the same as just adding a delay
+        with this name.
+
+        Delays created by this method are deadline timers. Resetting them
+        again only moves the deadline and does not cancel and reschedule a
+        loop callback unless the new deadline is earlier than the old one.
 
         Args:
             ms: The number of milliseconds you want this delay to be for.
@@ -167,10 +173,20 @@ class DelayManager(MpfController):
             String name or UUID4 of the delay which you can use to remove it
             later.
         """
-        if name in self.delays:
+        delay_callback = partial(self._process_delay_callback, name, callback, **kwargs)
+        delay = self.delays.get(name)
+        if isinstance(delay, DeadlineTimer):
+            # only move the deadline. this does not touch the loop in most cases
+            delay.reset(ms / 1000.0, delay_callback)
+            return name
+
+        if delay:
             self.remove(name)
 
-        return self.add(ms, callback, name, **kwargs)
+        self.debug_log("Adding resettable delay. Name: '%s' ms: %s, callback: %s, "
+                       "kwargs: %s", name, ms, callback, kwargs)
+        self.delays[name] = self.machine.clock.schedule_deadline(delay_callback, ms / 1000.0)
+        return name
 
     def clear(self) -> None:
         """Remove (clear) all the delays associated with this DelayManager."""
@@ -208,5 +224,8 @@ class DelayManager(MpfController):
             del self.delays[name]
         except KeyError:
             pass
-        callback(**kwargs)
+        if self.machine.handler_profiler.interval:
+            self.machine.handler_profiler.call(HandlerProfiler.DELAY, None, callback, **kwargs)
+        else:
+            callback(**kwargs)
         self.machine.events.process_event_queue()
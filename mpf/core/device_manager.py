@@ -1,6 +1,7 @@
 """Contains the DeviceManager base class."""
 import asyncio
 from collections import OrderedDict
+from contextlib import contextmanager
 
 from mpf.core.utility_functions import Util
 from mpf.core.mpf_controller import MpfController
@@ -16,16 +17,20 @@ class DeviceManager(MpfController):
 
     config_name = "device_manager"
 
-    __slots__ = ["_monitorable_devices", "collections", "device_classes"]
+    __slots__ = ["_monitorable_devices", "collections", "device_classes", "_device_modules", "_batched_changes",
+                 "_batch_depth"]
 
     def __init__(self, machine):
         """Initialize device manager."""
         super().__init__(machine)
 
         self._monitorable_devices = {}
+        self._batched_changes = OrderedDict()
+        self._batch_depth = 0
 
         self.collections = OrderedDict()
         self.device_classes = OrderedDict()  # collection_name: device_class
+        self._device_modules = OrderedDict()  # device_type: device_class
 
         # this has to happen before mode load (which is priority 10)
         self.machine.events.add_handler('init_phase_1',
@@ -63,25 +68,88 @@ class DeviceManager(MpfController):
             value: The new value.
 
         """
+        if self._batch_depth:
+            previous = self._batched_changes.get((device, notify))
+            if previous:
+                old = previous[0]
+            self._batched_changes[(device, notify)] = (old, value)
+            return
+
+        self._send_device_change(device, notify, old, value)
+
+    def _send_device_change(self, device, notify, old, value):
+        """Send device change to BCP and to all registered device monitors."""
         self.machine.bcp.interface.notify_device_changes(device, notify, old, value)
+        if "devices" in self.machine.monitors:
+            for callback in self.machine.monitors["devices"]:
+                callback(device=device, attribute=notify, old=old, value=value)
+
+    @contextmanager
+    def batch_device_changes(self):
+        """Collect device changes and send one notification per changed attribute at the end.
+
+        Changes of the same attribute are merged (first old value and last new
+        value). Attributes which changed back to their old value are dropped.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                changes = self._batched_changes
+                self._batched_changes = OrderedDict()
+                for (device, notify), (old, value) in changes.items():
+                    if old != value:
+                        self._send_device_change(device, notify, old, value)
+
+    def _get_device_class(self, device_type):
+        """Return the class for a device module and import it only once."""
+        device_cls = self._device_modules.get(device_type)
+        if not device_cls:
+            with self.machine.startup_profiler.measure("device_import", device_type):
+                device_cls = Util.string_to_class(device_type)      # type: Device
+            self._device_modules[device_type] = device_cls
+        return device_cls
+
+    def _load_device_config_spec_for_class(self, device_cls):
+        if device_cls.get_config_spec():
+            # add specific config spec if device has any
+            self.machine.config_validator.load_device_config_spec(
+                device_cls.config_section, device_cls.get_config_spec())
 
     def _load_device_config_spec(self, **kwargs):
         del kwargs
-        for device_type in self.machine.config['mpf']['device_modules']:
-            device_cls = Util.string_to_class(device_type)      # type: Device
+        for device_type, config_section in self.machine.config['mpf']['device_modules'].items():
+            # config spec of lazy modules is loaded when they are imported
+            if config_section:
+                continue
+            self._load_device_config_spec_for_class(self._get_device_class(device_type))
 
-            if device_cls.get_config_spec():
-                # add specific config spec if device has any
-                self.machine.config_validator.load_device_config_spec(
-                    device_cls.config_section, device_cls.get_config_spec())
+    def _get_used_config_sections(self):
+        """Return all config sections used in the machine config or in any mode."""
+        used_sections = set(self.machine.config.keys())
+        for mode in self.machine.modes:
+            used_sections.update(mode.config.keys())
+        return used_sections
 
     @asyncio.coroutine
     def _load_device_modules(self, **kwargs):
         del kwargs
         # step 1: create devices in machine collection
         self.debug_log("Creating devices...")
-        for device_type in self.machine.config['mpf']['device_modules']:
-            device_cls = Util.string_to_class(device_type)      # type: Device
+        used_sections = self._get_used_config_sections()
+        for device_type, config_section in self.machine.config['mpf']['device_modules'].items():
+            if config_section and config_section not in used_sections:
+                # nobody uses this device. create an empty collection without importing the class
+                self.debug_log("Skipping unused device module %s", device_type)
+                setattr(self.machine, config_section,
+                        DeviceCollection(self.machine, config_section, config_section))
+                continue
+
+            device_cls = self._get_device_class(device_type)
+            if config_section:
+                self._load_device_config_spec_for_class(device_cls)
 
             collection_name, config = device_cls.get_config_info()
 
@@ -99,7 +167,8 @@ class DeviceManager(MpfController):
 
             # create the devices
             if config:
-                self.create_devices(collection_name, config)
+                with self.machine.startup_profiler.measure("device_create", collection_name):
+                    self.create_devices(collection_name, config)
 
             # create the default control events
             try:
@@ -111,19 +180,16 @@ class DeviceManager(MpfController):
 
         # step 2: load config and validate devices
         self.load_devices_config(validate=True)
-        yield from self.machine.mode_controller.load_mode_devices()
+        with self.machine.startup_profiler.measure("init", "load_mode_devices"):
+            yield from self.machine.mode_controller.load_mode_devices()
 
         # step 3: initialise devices (mode devices will be initialised when mode is started)
         yield from self.initialize_devices()
 
     def stop_devices(self):
         """Stop all devices in the machine."""
-        for device_type in self.machine.config['mpf']['device_modules']:
-            device_cls = Util.string_to_class(device_type)
-            collection_name, _ = device_cls.get_config_info()
-            if not hasattr(self.machine, collection_name):
-                continue
-            for device in getattr(self.machine, collection_name):
+        for collection in self.collections.values():
+            for device in collection:
                 if hasattr(device, "stop_device"):
                     device.stop_device()
 
@@ -154,11 +220,9 @@ class DeviceManager(MpfController):
     def load_devices_config(self, validate=True):
         """Load all devices."""
         if validate:
-            for device_type in self.machine.config['mpf']['device_modules']:
+            for collection_name, device_cls in self.device_classes.items():
 
-                device_cls = Util.string_to_class(device_type)
-
-                collection_name, config_name = device_cls.get_config_info()
+                config_name = device_cls.config_section
 
                 if config_name not in self.machine.config:
                     continue
@@ -172,15 +236,15 @@ class DeviceManager(MpfController):
                     self.raise_config_error("Format of collection {} is invalid.".format(collection_name), 1)
 
                 # validate config
-                for device_name in config:
-                    config[device_name] = collection[device_name].prepare_config(config[device_name], False)
-                    config[device_name] = collection[device_name].validate_and_parse_config(config[device_name], False)
+                with self.machine.startup_profiler.measure("device_validate", collection_name):
+                    for device_name in config:
+                        config[device_name] = collection[device_name].prepare_config(config[device_name], False)
+                        config[device_name] = collection[device_name].validate_and_parse_config(config[device_name],
+                                                                                                False)
 
-        for device_type in self.machine.config['mpf']['device_modules']:
+        for collection_name, device_cls in self.device_classes.items():
 
-            device_cls = Util.string_to_class(device_type)
-
-            collection_name, config_name = device_cls.get_config_info()
+            config_name = device_cls.config_section
 
             if config_name not in self.machine.config:
                 continue
@@ -190,17 +254,16 @@ class DeviceManager(MpfController):
             config = self.machine.config[config_name]
 
             # load config
-            for device_name in config:
-                collection[device_name].load_config(config[device_name])
+            with self.machine.startup_profiler.measure("device_load_config", collection_name):
+                for device_name in config:
+                    collection[device_name].load_config(config[device_name])
 
     @asyncio.coroutine
     def initialize_devices(self):
         """Initialise devices."""
-        for device_type in self.machine.config['mpf']['device_modules']:
+        for collection_name, device_cls in self.device_classes.items():
 
-            device_cls = Util.string_to_class(device_type)
-
-            collection_name, config_name = device_cls.get_config_info()
+            config_name = device_cls.config_section
 
             if config_name not in self.machine.config:
                 continue
@@ -210,8 +273,9 @@ class DeviceManager(MpfController):
             config = self.machine.config[config_name]
 
             # add machine wide
-            for device_name in config:
-                yield from collection[device_name].device_added_system_wide()
+            with self.machine.startup_profiler.measure("device_initialize", collection_name):
+                for device_name in config:
+                    yield from collection[device_name].device_added_system_wide()
 
     # pylint: disable-msg=too-many-nested-blocks
     def get_device_control_events(self, config):
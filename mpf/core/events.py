@@ -7,8 +7,10 @@ import asyncio
 from functools import partial
 from unittest.mock import MagicMock
 
-from typing import Dict, Any, Tuple, Optional, Generator, Callable, List
+from typing import Dict, Any, Tuple, Optional, Generator, Callable, List, Set
 
+from mpf.core.flight_recorder import FlightRecorder
+from mpf.core.handler_profiler import HandlerProfiler
 from mpf.core.mpf_controller import MpfController
 
 MYPY = False
@@ -21,6 +23,8 @@ EventHandlerKey = namedtuple("EventHandlerKey", ["key", "event"])
 RegisteredHandler = namedtuple("RegisteredHandler", ["callback", "priority", "kwargs", "key", "condition",
                                                      "blocking_facility"])
 PostedEvent = namedtuple("PostedEvent", ["event", "type", "callback", "kwargs"])
+PlannedHandler = namedtuple("PlannedHandler", ["event", "callback", "priority", "kwargs", "condition",
+                                               "blocking_facility"])
 
 
 class EventManager(MpfController):
@@ -138,6 +142,39 @@ class EventManager(MpfController):
         for handler in handler_list:
         ``events.remove_handler(my_handler)``
         """
+        planned_handler = self.plan_handler(event, handler, priority, blocking_facility, **kwargs)
+        key = uuid.uuid4()
+
+        self.registered_handlers.setdefault(planned_handler.event, []).append(
+            RegisteredHandler(planned_handler.callback, planned_handler.priority, planned_handler.kwargs, key,
+                              planned_handler.condition, planned_handler.blocking_facility))
+
+        if self._debug:
+            try:
+                self.debug_log("Registered %s as a handler for '%s', priority: %s, "
+                               "kwargs: %s",
+                               (str(handler).split(' '))[2], planned_handler.event, planned_handler.priority, kwargs)
+            except IndexError:
+                pass
+
+        # Sort the handlers for this event based on priority. We do it now
+        # so the list is pre-sorted so we don't have to do that with each
+        # event post.
+        self.registered_handlers[planned_handler.event].sort(key=lambda x: x.priority, reverse=True)
+
+        if self._info:
+            self._verify_handlers(planned_handler.event, self.registered_handlers[planned_handler.event])
+
+        return EventHandlerKey(key, planned_handler.event)
+
+    def plan_handler(self, event: str, handler: Any, priority: int = 1, blocking_facility: Any = None,
+                     **kwargs) -> PlannedHandler:
+        """Validate a handler and return it as PlannedHandler without registering it.
+
+        Planned handlers can be registered (repeatedly) with
+        ``add_planned_handlers`` which skips validation and sorts every event
+        only once. Arguments are the same as for ``add_handler``.
+        """
         if not callable(handler):
             raise ValueError('Cannot add handler "{}" for event "{}". Did you '
                              'accidentally add parenthesis to the end of the '
@@ -158,37 +195,39 @@ class EventManager(MpfController):
 
         event, condition = self.get_event_and_condition_from_string(event)
 
-        # Add an entry for this event if it's not there already
-        if event not in self.registered_handlers:
-            self.registered_handlers[event] = []
-
-        key = uuid.uuid4()
-
-        # An event 'handler' in our case is a tuple with 4 elements:
-        # the handler method, priority, dict of kwargs, & uuid key
         if hasattr(handler, "relative_priority") and not isinstance(handler, MagicMock):
             priority += handler.relative_priority
 
-        self.registered_handlers[event].append(RegisteredHandler(handler, priority, kwargs, key, condition,
-                                                                 blocking_facility))
+        return PlannedHandler(event, handler, priority, kwargs, condition, blocking_facility)
 
-        if self._debug:
-            try:
-                self.debug_log("Registered %s as a handler for '%s', priority: %s, "
-                               "kwargs: %s",
-                               (str(handler).split(' '))[2], event, priority, kwargs)
-            except IndexError:
-                pass
+    def add_planned_handlers(self, planned_handlers: List[PlannedHandler],
+                             priority_offset: int = 0) -> List[EventHandlerKey]:
+        """Register a list of handlers created by ``plan_handler`` in bulk.
 
-        # Sort the handlers for this event based on priority. We do it now
-        # so the list is pre-sorted so we don't have to do that with each
-        # event post.
-        self.registered_handlers[event].sort(key=lambda x: x.priority, reverse=True)
-
-        if self._info:
-            self._verify_handlers(event, self.registered_handlers[event])
+        Args:
+            planned_handlers: Handlers returned by ``plan_handler``.
+            priority_offset: Added to the priority of every handler (e.g. the
+                priority of a mode).
 
-        return EventHandlerKey(key, event)
+        Returns a list of keys in the same order as planned_handlers.
+        """
+        keys = []
+        touched_events = set()
+        for planned_handler in planned_handlers:
+            key = uuid.uuid4()
+            self.registered_handlers.setdefault(planned_handler.event, []).append(
+                RegisteredHandler(planned_handler.callback, planned_handler.priority + priority_offset,
+                                  planned_handler.kwargs, key, planned_handler.condition,
+                                  planned_handler.blocking_facility))
+            touched_events.add(planned_handler.event)
+            keys.append(EventHandlerKey(key, planned_handler.event))
+
+        for event in touched_events:
+            self.registered_handlers[event].sort(key=lambda x: x.priority, reverse=True)
+            if self._info:
+                self._verify_handlers(event, self.registered_handlers[event])
+
+        return keys
 
     def _verify_handlers(self, event, sorted_handlers):
         """Verify that no races can happen."""
@@ -338,8 +377,17 @@ class EventManager(MpfController):
         Args:
             key_list: A list of keys of the handlers you want to remove
         """
+        keys_by_event = {}      # type: Dict[str, Set[uuid.UUID]]
         for key in key_list:
-            self.remove_handler_by_key(key)
+            keys_by_event.setdefault(key.event, set()).add(key.key)
+
+        # filter every event only once instead of once per key
+        for event, keys in keys_by_event.items():
+            if event not in self.registered_handlers:
+                continue
+            self.registered_handlers[event][:] = [handler for handler in self.registered_handlers[event]
+                                                  if handler.key not in keys]
+            self._remove_event_if_empty(event)
 
     def _remove_event_if_empty(self, event: str) -> None:
         # Checks to see if the event doesn't have any more registered handlers,
@@ -542,6 +590,7 @@ class EventManager(MpfController):
         self._post(event, 'relay', callback, **kwargs)
 
     def _post(self, event: str, ev_type: Optional[str], callback, **kwargs: dict) -> None:
+        self.machine.flight_recorder.record(FlightRecorder.EVENT, event)
         if self._debug:
             self.debug_log("Event: ===='%s'==== Type: %s, Callback: %s, "
                            "Args: %s", event, ev_type, callback, kwargs)
@@ -609,7 +658,11 @@ class EventManager(MpfController):
             except KeyError:
                 queue = QueuedEvent(self.debug_log)
 
-            handler.callback(queue=queue, **merged_kwargs)
+            if self.machine.handler_profiler.interval:
+                self.machine.handler_profiler.call(HandlerProfiler.EVENT, event, handler.callback, queue=queue,
+                                                   **merged_kwargs)
+            else:
+                handler.callback(queue=queue, **merged_kwargs)
 
             if queue.waiter:
                 queue.event = asyncio.Event(loop=self.machine.clock.loop)
@@ -654,7 +707,11 @@ class EventManager(MpfController):
 
             # call the handler and save the results
             try:
-                result = handler.callback(**merged_kwargs)
+                if self.machine.handler_profiler.interval:
+                    result = self.machine.handler_profiler.call(HandlerProfiler.EVENT, event, handler.callback,
+                                                                **merged_kwargs)
+                else:
+                    result = handler.callback(**merged_kwargs)
             except Exception as e:
                 raise Exception("Exception while processing {} for event {}".format(handler, event)) from e
 
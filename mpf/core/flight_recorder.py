@@ -0,0 +1,107 @@
+"""Contains the FlightRecorder which keeps a ring buffer of recent machine activity."""
+import struct
+from typing import List, Tuple, Dict
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.machine import MachineController
+    from logging import Logger
+
+__api__ = ['FlightRecorder']
+
+
+class FlightRecorder:
+
+    """Fixed-size binary ring buffer of recent structured records.
+
+    Every record is packed into a preallocated bytearray as timestamp, record
+    type, interned name and an integer value. Nothing is formatted while
+    recording so this is cheap enough to stay enabled in production. The
+    buffer is dumped on crash, on ``debug_dump_stats`` or on demand via BCP.
+
+    If stream is set every record is also passed to stream.record() (e.g.
+    the SwitchRecorder).
+    """
+
+    __slots__ = ["machine", "size", "stream", "_buffer", "_position", "_count", "_names", "_name_ids"]
+
+    EVENT = 1
+    SWITCH = 2
+    PULSE = 3
+
+    TYPE_NAMES = {EVENT: "event", SWITCH: "switch", PULSE: "pulse"}
+
+    _record = struct.Struct("<dBHi")
+
+    _max_names = 0xFFFF
+
+    def __init__(self, machine: "MachineController", size: int) -> None:
+        """Initialise flight recorder with room for size records."""
+        self.machine = machine
+        self.size = size
+        self.stream = None
+        self._buffer = bytearray(self._record.size * size)
+        self._position = 0
+        self._count = 0
+        self._names = ["<unknown>"]     # type: List[str]
+        self._name_ids = {}             # type: Dict[str, int]
+
+    def _intern(self, name: str) -> int:
+        """Return the id for a name and add it to the name table if needed."""
+        if len(self._names) >= self._max_names:
+            return 0
+        name_id = len(self._names)
+        self._names.append(name)
+        self._name_ids[name] = name_id
+        return name_id
+
+    def record(self, record_type: int, name: str, value: int = 0) -> None:
+        """Append a record to the ring buffer.
+
+        Args:
+            record_type: One of EVENT, SWITCH or PULSE.
+            name: Name of the event, switch or coil.
+            value: Integer payload (e.g. switch state or pulse ms).
+        """
+        timestamp = self.machine.clock.get_time()
+        if self.stream:
+            self.stream.record(record_type, name, value, timestamp)
+
+        if not self.size:
+            return
+
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._intern(name)
+
+        self._record.pack_into(self._buffer, self._position * self._record.size, timestamp,
+                               record_type, name_id, value)
+        self._position += 1
+        if self._position >= self.size:
+            self._position = 0
+        if self._count < self.size:
+            self._count += 1
+
+    def get_records(self) -> List[Tuple[float, str, str, int]]:
+        """Return all records from oldest to newest as (time, type, name, value) tuples."""
+        records = []
+        start = self._position - self._count
+        for i in range(start, start + self._count):
+            timestamp, record_type, name_id, value = self._record.unpack_from(
+                self._buffer, (i % self.size) * self._record.size)
+            records.append((timestamp, self.TYPE_NAMES.get(record_type, str(record_type)), self._names[name_id],
+                            value))
+
+        return records
+
+    def clear(self) -> None:
+        """Remove all records."""
+        self._position = 0
+        self._count = 0
+
+    def dump_to_log(self, log: "Logger") -> None:
+        """Write all records to a logger."""
+        log.info("--- FLIGHT RECORDER DUMP (%s records) ---", self._count)
+        for timestamp, record_type, name, value in self.get_records():
+            log.info("%.3f %s %s %s", timestamp, record_type, name, value)
+        log.info("--- FLIGHT RECORDER DUMP END ---")
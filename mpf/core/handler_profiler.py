@@ -0,0 +1,160 @@
+"""Contains the HandlerProfiler which measures time spent in event, switch and delay handlers."""
+import os
+import time
+from datetime import datetime
+from functools import partial
+from typing import Dict, List, Tuple, Optional
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.machine import MachineController
+    from logging import Logger
+
+__api__ = ['HandlerProfiler']
+
+
+class HandlerStats:
+
+    """Call count, total and max time of one handler."""
+
+    __slots__ = ["calls", "total", "max"]
+
+    def __init__(self) -> None:
+        """Initialise empty stats."""
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class HandlerProfiler:
+
+    """Samples the time spent in event handlers, switch handlers and delay callbacks.
+
+    Enabled by setting ``mpf: handler_profiler_sample_interval`` to N which
+    times every Nth handler call. Callers only use the profiler when
+    interval is set so the disabled profiler costs one attribute check per
+    handler. Counts and total times in reports are extrapolated from the
+    samples.
+    """
+
+    __slots__ = ["machine", "interval", "stats", "stacks", "_countdown", "_running"]
+
+    EVENT = "event"
+    SWITCH = "switch"
+    DELAY = "delay"
+
+    def __init__(self, machine: "MachineController", interval: int) -> None:
+        """Initialise profiler which samples every interval calls (0 to disable)."""
+        self.machine = machine
+        self.interval = interval
+        self.stats = {}         # type: Dict[Tuple[str, str, str], HandlerStats]
+        self.stacks = {}        # type: Dict[Tuple[str, ...], float]
+        self._countdown = interval
+        # sampled handlers which are currently running with the time spent in their sampled children
+        self._running = []      # type: List[List]
+
+    def start(self, category: str, name: Optional[str], callback) -> float:
+        """Return the start time if this call should be sampled or 0 if not.
+
+        Args:
+            category: EVENT, SWITCH or DELAY.
+            name: Name of the event or switch. None to use the name of the callback.
+            callback: The handler which will be called.
+        """
+        if not self.interval:
+            return 0
+        self._countdown -= 1
+        if self._countdown > 0:
+            return 0
+        self._countdown = self.interval
+        handler = self.get_callback_name(callback)
+        self._running.append([(category, name or handler, handler), 0.0])
+        return time.perf_counter()
+
+    def call(self, category: str, name: Optional[str], callback, **kwargs):
+        """Call callback with kwargs and sample the call if it is its turn.
+
+        Callers check interval first so the disabled profiler costs nothing but that check.
+        """
+        start = self.start(category, name, callback)
+        if not start:
+            return callback(**kwargs)
+        try:
+            return callback(**kwargs)
+        finally:
+            self.stop(start)
+
+    def stop(self, start: float) -> None:
+        """Record the sampled call which started at start."""
+        seconds = time.perf_counter() - start
+        key, children = self._running.pop()
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = HandlerStats()
+        stats.calls += 1
+        stats.total += seconds
+        if seconds > stats.max:
+            stats.max = seconds
+
+        frames = tuple("{}:{};{}".format(*frame) for frame, _ in self._running) + ("{}:{};{}".format(*key),)
+        self.stacks[frames] = self.stacks.get(frames, 0.0) + seconds - children
+        if self._running:
+            self._running[-1][1] += seconds
+
+    @staticmethod
+    def get_callback_name(callback) -> str:
+        """Return a readable name for a callback (e.g. Class.method)."""
+        while isinstance(callback, partial):
+            callback = callback.func
+        owner = getattr(callback, "__self__", None)
+        name = getattr(callback, "__name__", None) or type(callback).__name__
+        if owner is not None:
+            return "{}.{}".format(type(owner).__name__, name)
+        return getattr(callback, "__qualname__", name)
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self.stats = {}
+        self.stacks = {}
+
+    def get_top(self, count: int = 20) -> List[dict]:
+        """Return the count handlers with the highest total time (extrapolated)."""
+        top = sorted(self.stats.items(), key=lambda x: -x[1].total)[:count]
+        return [{"category": category, "name": name, "handler": handler, "calls": stats.calls * self.interval,
+                 "total": stats.total * self.interval, "max": stats.max,
+                 "average": stats.total / stats.calls}
+                for (category, name, handler), stats in top]
+
+    def get_report(self, count: int = 20) -> str:
+        """Return a top count report."""
+        lines = ["{:>10} {:>10} {:>10} {:>10}  {}".format("calls", "total ms", "max ms", "avg ms", "handler")]
+        for entry in self.get_top(count):
+            lines.append("{:>10} {:>10.3f} {:>10.3f} {:>10.3f}  {} {} -> {}".format(
+                entry["calls"], entry["total"] * 1000, entry["max"] * 1000, entry["average"] * 1000,
+                entry["category"], entry["name"], entry["handler"]))
+        return "\n".join(lines)
+
+    def dump_to_log(self, log: "Logger", count: int = 20) -> None:
+        """Write the top count handlers to a logger."""
+        if not self.interval:
+            return
+        log.info("--- HANDLER PROFILE (sampling every %s calls) ---", self.interval)
+        for line in self.get_report(count).split("\n"):
+            log.info(line)
+        log.info("--- HANDLER PROFILE END ---")
+
+    def get_collapsed_stacks(self) -> str:
+        """Return samples in the collapsed stack format of flamegraph tools (values in microseconds)."""
+        return "".join("{} {}\n".format(";".join(frames), int(seconds * self.interval * 1000000))
+                       for frames, seconds in sorted(self.stacks.items()))
+
+    @staticmethod
+    def get_file_name(machine_path, file_name) -> str:
+        """Return full path of the collapsed stack file. The name may contain strftime placeholders."""
+        return os.path.join(machine_path, "logs", datetime.now().strftime(file_name))
+
+    def write_collapsed_stacks(self, file_name: str) -> None:
+        """Write collapsed stacks to a file."""
+        os.makedirs(os.path.dirname(file_name), exist_ok=True)
+        with open(file_name, "w") as f:
+            f.write(self.get_collapsed_stacks())
@@ -1,5 +1,6 @@
-"""Contains the LogMixin class."""
+"""Contains the LogMixin class and the queue based log handlers."""
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 from mpf.exceptions.ConfigFileError import ConfigFileError
 
@@ -78,13 +79,17 @@ class LogMixin:
         Note that whether this message shows up in the console or log file is
         controlled by the settings used with configure_logging().
         """
-        if not hasattr(self, 'log'):
-            self._logging_not_configured()
-
         if self._debug_to_console:
-            self.log.log(12, msg, *args, **kwargs)
+            code = 12
         elif self._debug_to_file:
-            self.log.log(11, msg, *args, **kwargs)
+            code = 11
+        else:
+            return
+
+        if not self.log:
+            self._logging_not_configured()
+
+        self.log.log(code, msg, *args, **kwargs)
 
     def info_log(self, msg: str, *args, context=None, **kwargs) -> None:
         """Log a message at the info level.
@@ -92,10 +97,6 @@ class LogMixin:
         Whether this message shows up in the console or log file is controlled
         by the settings used with configure_logging().
         """
-        if not self.log:
-            self._logging_not_configured()
-
-        code = None
         if self._info_to_console or self._debug_to_console:
             code = 22
         elif self._info_to_file or self._debug_to_file:
@@ -103,6 +104,9 @@ class LogMixin:
         else:
             return
 
+        if not self.log:
+            self._logging_not_configured()
+
         if context:
             self.log.log(code, msg + " context: " + context, *args, **kwargs)
         else:
@@ -153,3 +157,39 @@ class LogMixin:
             "Logging has not been configured for the {} module. You must call "
             "configure_logging() before you can post a log message".
             format(self))
+
+
+class DeferredQueueHandler(QueueHandler):
+
+    """Queue handler which does not format records on the calling thread.
+
+    The stock QueueHandler merges msg and args, renders exceptions and copies
+    the record in prepare(). MPF only uses in-process queues so we enqueue the
+    record as is and leave all formatting to the handlers of the listener
+    thread. msg, args and exc_info stay untouched until then.
+
+    Caveat: args are formatted when the listener handles the record. If a
+    caller mutates an object which it passed as log argument before that
+    happens, the log shows the new value. Pass immutable values (or a copy)
+    when logging state which changes right afterwards.
+    """
+
+    def prepare(self, record):
+        """Return record unchanged."""
+        return record
+
+
+class LevelQueueListener(QueueListener):
+
+    """Queue listener which respects the level of each handler.
+
+    This allows console, file and syslog handlers with different levels to
+    share a single queue and listener thread.
+    """
+
+    def handle(self, record):
+        """Pass record to all handlers which accept its level."""
+        record = self.prepare(record)
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
@@ -21,6 +21,10 @@ from mpf.core.config_validator import ConfigValidator
 from mpf.core.data_manager import DataManager
 from mpf.core.delays import DelayManager, DelayManagerRegistry
 from mpf.core.device_manager import DeviceCollection
+from mpf.core.flight_recorder import FlightRecorder
+from mpf.core.handler_profiler import HandlerProfiler
+from mpf.core.startup_profiler import StartupProfiler
+from mpf.core.switch_recorder import SwitchRecorder
 from mpf.core.utility_functions import Util
 from mpf.core.logging import LogMixin
 
@@ -84,7 +88,8 @@ class MachineController(LogMixin):
                  "stop_future", "events", "switch_controller", "mode_controller", "settings", "asset_manager",
                  "bcp", "ball_controller", "show_controller", "placeholder_manager", "device_manager", "auditor",
                  "tui", "service", "switches", "shows", "coils", "ball_devices", "lights", "playfield", "playfields",
-                 "autofires", "__dict__"]
+                 "autofires", "flight_recorder", "switch_recorder", "handler_profiler", "startup_profiler",
+                 "__dict__"]
 
     # pylint: disable-msg=too-many-statements
     def __init__(self, mpf_path: str, machine_path: str, options: dict) -> None:
@@ -95,6 +100,7 @@ class MachineController(LogMixin):
 
         self.log.info("Command line arguments: %s", options)
         self.options = options
+        self.startup_profiler = StartupProfiler(bool(options.get('profile_startup')))
         self.config_validator = ConfigValidator(self, not options["no_load_cache"], options["create_config_cache"])
         self.config_processor = ConfigProcessor(self.config_validator)
 
@@ -163,7 +169,8 @@ class MachineController(LogMixin):
 
         self._set_machine_path()
 
-        self._load_config()
+        with self.startup_profiler.measure("init", "load_config"):
+            self._load_config()
         self.machine_config = self.config       # type: Any
         self.configure_logging(
             'Machine',
@@ -177,6 +184,9 @@ class MachineController(LogMixin):
         self.default_platform = None        # type: SmartVirtualHardwarePlatform
 
         self.clock = self._load_clock()
+        self.flight_recorder = FlightRecorder(self, self.config['mpf']['flight_recorder_size'])
+        self.switch_recorder = None     # type: SwitchRecorder
+        self.handler_profiler = HandlerProfiler(self, self.config['mpf']['handler_profiler_sample_interval'])
         self.stop_future = asyncio.Future(loop=self.clock.loop)     # type: asyncio.Future
 
     @asyncio.coroutine
@@ -185,12 +195,14 @@ class MachineController(LogMixin):
         self._boot_holds = set()    # type: Set[str]
         self.is_init_done = asyncio.Event(loop=self.clock.loop)
         self.register_boot_hold('init')
-        self._load_hardware_platforms()
+        with self.startup_profiler.measure("init", "load_hardware_platforms"):
+            self._load_hardware_platforms()
 
         self._load_core_modules()
         # order is specified in mpfconfig.yaml
 
-        self._validate_config()
+        with self.startup_profiler.measure("init", "validate_config"):
+            self._validate_config()
 
         # This is called so hw platforms have a chance to register for events,
         # and/or anything else they need to do with core modules since
@@ -204,13 +216,16 @@ class MachineController(LogMixin):
 
         self._initialize_credit_string()
 
-        self._register_config_players()
+        with self.startup_profiler.measure("init", "register_config_players"):
+            self._register_config_players()
         self._register_system_events()
-        self._load_machine_vars()
+        with self.startup_profiler.measure("init", "load_machine_vars"):
+            self._load_machine_vars()
         yield from self._run_init_phases()
         self._init_phases_complete()
 
-        yield from self._start_platforms()
+        with self.startup_profiler.measure("init", "start_platforms"):
+            yield from self._start_platforms()
 
         # wait until all boot holds were released
         yield from self.is_init_done.wait()
@@ -224,6 +239,7 @@ class MachineController(LogMixin):
 
         # remember exception
         self._exception = context
+        self.flight_recorder.dump_to_log(self.log)
         self.stop("Exception thrown")
 
     # pylint: disable-msg=no-self-use
@@ -236,31 +252,38 @@ class MachineController(LogMixin):
     @asyncio.coroutine
     def _run_init_phases(self) -> Generator[int, None, None]:
         """Run init phases."""
-        yield from self.events.post_queue_async("init_phase_1")
+        with self.startup_profiler.measure("init_phase", "init_phase_1"):
+            yield from self.events.post_queue_async("init_phase_1")
         '''event: init_phase_1
 
         desc: Posted during the initial boot up of MPF.
         '''
-        yield from self.events.post_queue_async("init_phase_2")
+        with self.startup_profiler.measure("init_phase", "init_phase_2"):
+            yield from self.events.post_queue_async("init_phase_2")
         '''event: init_phase_2
 
         desc: Posted during the initial boot up of MPF.
         '''
-        self._load_plugins()
-        yield from self.events.post_queue_async("init_phase_3")
+        with self.startup_profiler.measure("init", "load_plugins"):
+            self._load_plugins()
+        with self.startup_profiler.measure("init_phase", "init_phase_3"):
+            yield from self.events.post_queue_async("init_phase_3")
         '''event: init_phase_3
 
         desc: Posted during the initial boot up of MPF.
         '''
-        self._load_custom_code()
+        with self.startup_profiler.measure("init", "load_custom_code"):
+            self._load_custom_code()
 
-        yield from self.events.post_queue_async("init_phase_4")
+        with self.startup_profiler.measure("init_phase", "init_phase_4"):
+            yield from self.events.post_queue_async("init_phase_4")
         '''event: init_phase_4
 
         desc: Posted during the initial boot up of MPF.
         '''
 
-        yield from self.events.post_queue_async("init_phase_5")
+        with self.startup_profiler.measure("init_phase", "init_phase_5"):
+            yield from self.events.post_queue_async("init_phase_5")
         '''event: init_phase_5
 
         desc: Posted during the initial boot up of MPF.
@@ -280,17 +303,32 @@ class MachineController(LogMixin):
 
     @asyncio.coroutine
     def _initialize_platforms(self) -> Generator[int, None, None]:
-        """Initialise all used hardware platforms."""
+        """Initialise all used hardware platforms.
+
+        Platforms are initialised in parallel. When profiling startup they are
+        initialised one after another so their measurements do not overlap.
+        """
+        if self.startup_profiler.enabled:
+            for name, hardware_platform in list(self.hardware_platforms.items()):
+                yield from self._initialize_platform(name, hardware_platform)
+            return
+
         init_done = []
         # collect all platform init futures
-        for hardware_platform in list(self.hardware_platforms.values()):
-            init_done.append(hardware_platform.initialize())
+        for name, hardware_platform in list(self.hardware_platforms.items()):
+            init_done.append(self._initialize_platform(name, hardware_platform))
 
         # wait for all of them in parallel
         results = yield from asyncio.wait(init_done, loop=self.clock.loop)
         for result in results[0]:
             result.result()
 
+    @asyncio.coroutine
+    def _initialize_platform(self, name, hardware_platform) -> Generator[int, None, None]:
+        """Initialise one hardware platform."""
+        with self.startup_profiler.measure("platform", name):
+            yield from hardware_platform.initialize()
+
     @asyncio.coroutine
     def _start_platforms(self) -> Generator[int, None, None]:
         """Start all used hardware platforms."""
@@ -339,9 +377,44 @@ class MachineController(LogMixin):
     def _register_system_events(self) -> None:
         """Register default event handlers."""
         self.events.add_handler('quit', self.stop)
+        self.events.add_handler('debug_dump_stats', self._debug_dump_flight_recorder)
+        if self.handler_profiler.interval:
+            self.events.add_handler('debug_dump_stats', self._debug_dump_handler_profiler)
+            self.events.add_handler('shutdown', self._write_handler_profiler_stacks)
+        if self.config['mpf']['switch_recorder_file']:
+            self.switch_recorder = SwitchRecorder(
+                self, SwitchRecorder.get_file_name(self.machine_path, self.config['mpf']['switch_recorder_file']))
         self.events.add_handler(self.config['mpf']['switch_tag_event'].
                                 replace('%', 'quit'), self.stop)
 
+    def _debug_dump_flight_recorder(self, **kwargs) -> None:
+        """Dump the flight recorder to the log."""
+        del kwargs
+        self.flight_recorder.dump_to_log(self.log)
+
+    def _debug_dump_handler_profiler(self, **kwargs) -> None:
+        """Dump the slowest handlers to the log and write the collapsed stacks."""
+        self.handler_profiler.dump_to_log(self.log, self.config['mpf']['handler_profiler_report_size'])
+        self._write_handler_profiler_stacks(**kwargs)
+
+    def _write_handler_profiler_stacks(self, **kwargs) -> None:
+        """Write the collapsed stacks of the handler profiler for flamegraph tools."""
+        del kwargs
+        if not self.config['mpf']['handler_profiler_file']:
+            return
+        file_name = HandlerProfiler.get_file_name(self.machine_path, self.config['mpf']['handler_profiler_file'])
+        self.handler_profiler.write_collapsed_stacks(file_name)
+        self.info_log("Wrote handler profile to %s", file_name)
+
+    def _write_startup_profile(self) -> None:
+        """Write the startup profile report if --profile-startup is used."""
+        if not self.startup_profiler.enabled:
+            return
+
+        file_name = os.path.join(self.machine_path, "logs", self.options['profile_startup'])
+        self.info_log("Writing startup profile to %s", file_name)
+        self.startup_profiler.write_report(file_name)
+
     def _register_config_players(self) -> None:
         """Register config players."""
         # todo move this to config_player module
@@ -463,7 +536,8 @@ class MachineController(LogMixin):
         self.debug_log("Loading core modules...")
         for name, module_class in self.config['mpf']['core_modules'].items():
             self.debug_log("Loading '%s' core module", module_class)
-            m = Util.string_to_class(module_class)(self)
+            with self.startup_profiler.measure("core_module", name):
+                m = Util.string_to_class(module_class)(self)
             setattr(self, name, m)
 
     def _load_hardware_platforms(self) -> None:
@@ -502,7 +576,8 @@ class MachineController(LogMixin):
 
             self.debug_log("Loading '%s' plugin", plugin)
 
-            plugin_obj = Util.string_to_class(plugin)(self)
+            with self.startup_profiler.measure("plugin", plugin):
+                plugin_obj = Util.string_to_class(plugin)(self)
             self.plugins.append(plugin_obj)
 
     def _load_custom_code(self) -> None:
@@ -684,6 +759,7 @@ class MachineController(LogMixin):
             self.error_log("Failed to initialise MPF")
             return False
         if init.done() and init.exception():
+            self.flight_recorder.dump_to_log(self.log)
             self.shutdown()
             traceback.print_tb(init.exception().__traceback__)  # noqa
             self.error_log("Failed to initialise MPF: %s", init.exception())
@@ -799,6 +875,7 @@ class MachineController(LogMixin):
         """
         if name not in self.machine_vars:
             self.machine_vars[name] = {'value': None, 'persist': persist, 'expire_secs': expire_secs}
+            self.settings.machine_var_changed(name)
         else:
             self.machine_vars[name]['persist'] = persist
             self.machine_vars[name]['expire_secs'] = expire_secs
@@ -825,6 +902,7 @@ class MachineController(LogMixin):
         self.machine_vars[name]['value'] = value
 
         if change:
+            self.settings.machine_var_changed(name)
             self._write_machine_var_to_disk(name)
 
             self.debug_log("Setting machine_var '%s' to: %s, (prior: %s, "
@@ -873,6 +951,7 @@ class MachineController(LogMixin):
         except KeyError:
             pass
         else:
+            self.settings.machine_var_changed(name)
             if self.machine_var_monitor:
                 for callback in self.monitors['machine_vars']:
                     callback(name=name, value=None,
@@ -891,6 +970,7 @@ class MachineController(LogMixin):
         for var in list(self.machine_vars.keys()):
             if var.startswith(startswith) and var.endswith(endswith):
                 del self.machine_vars[var]
+                self.settings.machine_var_changed(var)
 
         self._write_machine_vars_to_disk()
 
@@ -935,6 +1015,8 @@ class MachineController(LogMixin):
 
         Called when init is done and all boot holds are cleared.
         """
+        self._write_startup_profile()
+
         yield from self.events.post_async("init_done")
         '''event: init_done
 
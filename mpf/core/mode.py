@@ -1,6 +1,7 @@
 """Contains the Mode base class."""
 import asyncio
 import copy
+from collections import namedtuple
 
 from typing import Any
 from typing import Callable
@@ -17,11 +18,15 @@ from mpf.core.switch_controller import SwitchHandler
 MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.core.events import QueuedEvent
+    from mpf.core.events import PlannedHandler
     from mpf.core.mode_device import ModeDevice
     from mpf.core.events import EventHandlerKey
     from mpf.core.player import Player
     from mpf.core.machine import MachineController
 
+ModeActivationPlan = namedtuple("ModeActivationPlan", ["devices", "stop_handlers", "control_handlers",
+                                                       "control_devices"])
+
 
 # pylint: disable-msg=too-many-instance-attributes
 class Mode(LogMixin):
@@ -31,7 +36,7 @@ class Mode(LogMixin):
     __slots__ = ["machine", "config", "name", "path", "priority", "_active", "_starting", "_mode_start_wait_queue",
                  "stop_methods", "start_callback", "stop_callbacks", "event_handlers", "switch_handlers",
                  "mode_stop_kwargs", "mode_devices", "start_event_kwargs", "stopping", "delay", "player",
-                 "auto_stop_on_ball_end", "restart_on_next_ball"]
+                 "auto_stop_on_ball_end", "restart_on_next_ball", "_activation_plan"]
 
     def __init__(self, machine: "MachineController", config, name: str, path) -> None:
         """Initialise mode.
@@ -63,6 +68,7 @@ class Mode(LogMixin):
         self.mode_devices = set()               # type: Set[ModeDevice]
         self.start_event_kwargs = None          # type: Dict[str, Any]
         self.stopping = False
+        self._activation_plan = None            # type: ModeActivationPlan
 
         self.delay = DelayManager(self.machine.delayRegistry)
         '''DelayManager instance for delays in this mode. Note that all delays
@@ -205,19 +211,14 @@ class Mode(LogMixin):
         # hook for custom code. called before any mode devices are set up
         self.mode_will_start(**self.start_event_kwargs)
 
-        self._add_mode_devices()
+        plan = self._get_activation_plan()
+
+        self._add_mode_devices(plan)
 
         self.debug_log("Registering mode_stop handlers")
 
         # register mode stop events
-        if 'stop_events' in self.config['mode']:
-
-            for event in self.config['mode']['stop_events']:
-                # stop priority is +1 so if two modes of the same priority
-                # start and stop on the same event, the one will stop before
-                # the other starts
-                self.add_mode_event_handler(event=event, handler=self.stop,
-                                            priority=self.config['mode']['stop_priority'] + 1)
+        self.event_handlers.update(self.machine.events.add_planned_handlers(plan.stop_handlers, self.priority))
 
         self.start_callback = callback
 
@@ -232,7 +233,7 @@ class Mode(LogMixin):
                                 mode=self,
                                 **item.kwargs))
 
-        self._setup_device_control_events()
+        self._setup_device_control_events(plan)
 
         self.machine.events.post_queue(event='mode_{}_starting'.format(self.name),
                                        callback=self._started, **kwargs)
@@ -394,9 +395,22 @@ class Mode(LogMixin):
 
         self.stop_callbacks = []
 
-    def _add_mode_devices(self) -> None:
-        # adds and initializes mode devices which get removed at the end of the mode
+    def _get_activation_plan(self) -> ModeActivationPlan:
+        """Return the activation plan of this mode and compile it on first use.
 
+        The plan contains all devices, stop handlers and device control
+        handlers of this mode. Those only depend on the mode config so they
+        are collected and validated once and then applied in bulk on every
+        start.
+        """
+        if not self._activation_plan:
+            self._activation_plan = ModeActivationPlan(self._collect_mode_devices(), self._plan_stop_handlers(),
+                                                       self._plan_control_handlers(),
+                                                       self._collect_control_devices())
+        return self._activation_plan
+
+    def _collect_mode_devices(self) -> List["ModeDevice"]:
+        devices = []
         for collection_name, device_class in (
                 iter(self.machine.device_manager.device_classes.items())):
 
@@ -410,16 +424,83 @@ class Mode(LogMixin):
                     # get device
                     device = collection[device_name]
 
-                    # Track that this device was added via this mode so we
-                    # can remove it when the mode ends.
-                    self.mode_devices.add(device)
                     if not self.config['mode']['game_mode'] and not device.can_exist_outside_of_game:
                         raise AssertionError("Device {} cannot exist in non game-mode {}.".format(
                             device, self.name
                         ))
 
-                    # This lets the device know it was added to a mode
-                    device.device_loaded_in_mode(mode=self, player=self.player)
+                    devices.append(device)
+
+        return devices
+
+    def _plan_stop_handlers(self) -> List["PlannedHandler"]:
+        stop_handlers = []
+        if 'stop_events' in self.config['mode']:
+
+            for event in self.config['mode']['stop_events']:
+                # stop priority is +1 so if two modes of the same priority
+                # start and stop on the same event, the one will stop before
+                # the other starts
+                stop_handlers.append(self.machine.events.plan_handler(
+                    event=event, handler=self.stop, priority=self.config['mode']['stop_priority'] + 1, mode=self))
+
+        return stop_handlers
+
+    def _plan_control_handlers(self) -> List["PlannedHandler"]:
+        # plans mode handlers for control events for all devices specified
+        # in this mode's config (not just newly-created devices)
+
+        self.debug_log("Scanning mode-based config for device control_events")
+
+        control_handlers = []
+        for event, method, delay, device in (
+                self.machine.device_manager.get_device_control_events(
+                self.config)):
+
+            try:
+                event, priority = event.split('|')
+            except ValueError:
+                priority = 0
+
+            if not delay:
+                control_handlers.append(self.machine.events.plan_handler(
+                    event=event,
+                    handler=method,
+                    priority=int(priority) + 2,
+                    blocking_facility=device.class_label,
+                    mode=self))
+            else:
+                control_handlers.append(self.machine.events.plan_handler(
+                    event=event,
+                    handler=self._control_event_handler,
+                    priority=int(priority) + 2,
+                    blocking_facility=device.class_label,
+                    callback=method,
+                    ms_delay=delay,
+                    mode=self))
+
+        return control_handlers
+
+    def _collect_control_devices(self) -> Set["ModeDevice"]:
+        # get all devices in the mode
+        device_list = set()
+        for collection in self.machine.device_manager.collections:
+            if self.machine.device_manager.collections[collection].config_section in self.config:
+                for device, _ in \
+                        iter(self.config[self.machine.device_manager.collections[collection].config_section].items()):
+                    device_list.add(self.machine.device_manager.collections[collection][device])
+
+        return device_list
+
+    def _add_mode_devices(self, plan: ModeActivationPlan) -> None:
+        # adds and initializes mode devices which get removed at the end of the mode
+        for device in plan.devices:
+            # Track that this device was added via this mode so we
+            # can remove it when the mode ends.
+            self.mode_devices.add(device)
+
+            # This lets the device know it was added to a mode
+            device.device_loaded_in_mode(mode=self, player=self.player)
 
     def create_mode_devices(self) -> None:
         """Create new devices that are specified in a mode config that haven't been created in the machine-wide."""
@@ -485,45 +566,12 @@ class Mode(LogMixin):
 
         self.mode_devices = set()
 
-    def _setup_device_control_events(self) -> None:
+    def _setup_device_control_events(self, plan: ModeActivationPlan) -> None:
         # registers mode handlers for control events for all devices specified
         # in this mode's config (not just newly-created devices)
+        self.event_handlers.update(self.machine.events.add_planned_handlers(plan.control_handlers, self.priority))
 
-        self.debug_log("Scanning mode-based config for device control_events")
-
-        for event, method, delay, device in (
-                self.machine.device_manager.get_device_control_events(
-                self.config)):
-
-            try:
-                event, priority = event.split('|')
-            except ValueError:
-                priority = 0
-
-            if not delay:
-                self.add_mode_event_handler(
-                    event=event,
-                    handler=method,
-                    priority=int(priority) + 2,
-                    blocking_facility=device.class_label)
-            else:
-                self.add_mode_event_handler(
-                    event=event,
-                    handler=self._control_event_handler,
-                    priority=int(priority) + 2,
-                    callback=method,
-                    ms_delay=delay,
-                    blocking_facility=device.class_label)
-
-        # get all devices in the mode
-        device_list = set()
-        for collection in self.machine.device_manager.collections:
-            if self.machine.device_manager.collections[collection].config_section in self.config:
-                for device, _ in \
-                        iter(self.config[self.machine.device_manager.collections[collection].config_section].items()):
-                    device_list.add(self.machine.device_manager.collections[collection][device])
-
-        for device in device_list:
+        for device in plan.control_devices:
             device.add_control_events_in_mode(self)
 
     def _control_event_handler(self, callback: Callable[..., None], ms_delay: int = 0, **kwargs) -> None:
@@ -571,8 +619,7 @@ class Mode(LogMixin):
         return key
 
     def _remove_mode_event_handlers(self) -> None:
-        for key in self.event_handlers:
-            self.machine.events.remove_handler_by_key(key)
+        self.machine.events.remove_handlers_by_keys(self.event_handlers)
         self.event_handlers = set()
 
     def _remove_mode_switch_handlers(self) -> None:
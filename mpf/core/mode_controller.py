@@ -114,7 +114,8 @@ class ModeController(MpfController):
                 raise AssertionError('Mode {} already exists. Cannot load again.'.format(mode))
 
             # load mode
-            self.machine.modes[mode] = self._load_mode(mode)
+            with self.machine.startup_profiler.measure("mode", mode):
+                self.machine.modes[mode] = self._load_mode(mode)
 
             # add a very very short yield to prevent hangs in platforms (e.g. watchdog timeouts during IO)
             yield from asyncio.sleep(.0001, loop=self.machine.clock.loop)
@@ -493,6 +494,9 @@ class ModeController(MpfController):
 
     def dump(self):
         """Dump the current status of the running modes to the log file."""
+        if not self._debug:
+            return
+
         self.debug_log('+=========== ACTIVE MODES ============+')
 
         for mode in self.active_modes:
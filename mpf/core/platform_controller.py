@@ -48,7 +48,7 @@ class PlatformController(MpfController):
     @staticmethod
     def _notify_psu_about_pulse(driver: Driver, pulse_ms: int):
         """Notify PSU that a pulse via a rule happened."""
-        driver.config['psu'].notify_about_instant_pulse(pulse_ms=pulse_ms)
+        driver.config['psu'].notify_about_instant_pulse(pulse_ms=pulse_ms, amps=driver.config['psu_amps'])
 
     @staticmethod
     def _get_configured_switch(switch: SwitchRuleSettings) -> SwitchSettings:
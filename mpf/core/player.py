@@ -81,6 +81,23 @@ class Player:
     to track player variable changes.
     """
 
+    _monitor_users = 0
+
+    @classmethod
+    def enable_monitor(cls):
+        """Enable monitoring of player variables for one more user (e.g. BCP or OSC)."""
+        cls._monitor_users += 1
+        cls.monitor_enabled = True
+
+    @classmethod
+    def disable_monitor(cls):
+        """Stop monitoring of player variables for one user.
+
+        Monitoring stays enabled until the last user disabled it.
+        """
+        cls._monitor_users = max(cls._monitor_users - 1, 0)
+        cls.monitor_enabled = cls._monitor_users > 0
+
     def __init__(self, machine, index):
         """Initialise player."""
         # use self.__dict__ below since __setattr__ would make these player vars
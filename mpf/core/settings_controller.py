@@ -26,7 +26,18 @@ class SettingsController(MpfController):
         self._settings = {}     # type: Dict[str, SettingEntry]
         """Dictionary of available settings."""
 
+        self._machine_vars = {}     # type: Dict[str, List[str]]
+        self._snapshot_class = None
+        self._snapshot_index = {}   # type: Dict[str, int]
+        self.snapshot = None
+        """Immutable namedtuple with the current values of all settings.
+
+        Use this in hot paths (e.g. ``self.machine.settings.snapshot.brightness``).
+        It is replaced (never modified) when a setting or its machine var changes.
+        """
+
         self._add_entries_from_config()
+        self._update_snapshot_class()
 
     def _add_entries_from_config(self):
         # add entries from config
@@ -49,6 +60,35 @@ class SettingsController(MpfController):
     def add_setting(self, setting: SettingEntry):
         """Add a setting."""
         self._settings[setting.name] = setting
+        self._update_snapshot_class()
+
+    def _update_snapshot_class(self):
+        """Create a snapshot type for the current settings and populate it."""
+        names = list(self._settings.keys())
+        self._snapshot_class = namedtuple("SettingsSnapshot", names, rename=True)
+        self._snapshot_index = {name: index for index, name in enumerate(names)}
+        self._machine_vars = {}
+        for setting in self._settings.values():
+            self._machine_vars.setdefault(setting.machine_var, []).append(setting.name)
+        self._update_snapshot()
+
+    def _update_snapshot(self):
+        """Swap in a new snapshot with the current values."""
+        values = []
+        for setting in self._settings.values():
+            if not self.machine.is_machine_var(setting.machine_var):
+                values.append(setting.default)
+            else:
+                values.append(self.machine.get_machine_var(setting.machine_var))
+        self.snapshot = self._snapshot_class._make(values)
+
+    def machine_var_changed(self, name):
+        """Update the snapshot if a machine var which backs a setting changed.
+
+        Called by the machine when a machine var is added, changed or removed.
+        """
+        if name in self._machine_vars:
+            self._update_snapshot()
 
     def get_settings(self) -> List[SettingEntry]:
         """Return all available settings."""
@@ -63,8 +103,8 @@ class SettingsController(MpfController):
 
     def __getattr__(self, item):
         """Return setting."""
-        if "_settings" not in self.__dict__ or item not in self.__dict__['settings']:
-            raise AttributeError()
+        if "_snapshot_index" not in self.__dict__ or item not in self.__dict__['_snapshot_index']:
+            raise AttributeError(item)
         return self.get_setting_value(item)
 
     def get_setting_machine_var(self, setting_name):
@@ -73,21 +113,14 @@ class SettingsController(MpfController):
 
     def get_setting_value(self, setting_name):
         """Return the current value of a setting."""
-        if setting_name not in self._settings:
+        try:
+            return self.snapshot[self._snapshot_index[setting_name]]
+        except KeyError:
             raise AssertionError("Invalid setting {}".format(setting_name))
 
-        if not self.machine.is_machine_var(self._settings[setting_name].machine_var):
-            value = self._settings[setting_name].default
-        else:
-            value = self.machine.get_machine_var(self._settings[setting_name].machine_var)
-
-        self.debug_log("Retrieving value: {}={}".format(setting_name, value))
-
-        return value
-
     def set_setting_value(self, setting_name, value):
         """Set the value of a setting."""
-        self.debug_log("New value: {}={}".format(setting_name, value))
+        self.debug_log("New value: %s=%s", setting_name, value)
 
         if setting_name not in self._settings:
             raise AssertionError("Invalid setting {}".format(setting_name))
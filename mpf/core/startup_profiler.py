@@ -0,0 +1,82 @@
+"""Contains the StartupProfiler which measures the MPF boot path."""
+import time
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import List
+
+__api__ = ['StartupProfiler']
+
+StartupMeasurement = namedtuple("StartupMeasurement", ["category", "name", "seconds", "allocated_bytes"])
+
+
+class StartupProfiler:
+
+    """Records wall time and memory allocations of init steps.
+
+    Enabled with ``mpf game --profile-startup``. When disabled measure() is a
+    no-op so the boot path does not pay for it.
+    """
+
+    __slots__ = ["enabled", "measurements", "_start", "_started_tracing"]
+
+    def __init__(self, enabled: bool) -> None:
+        """Initialise startup profiler."""
+        self.enabled = enabled
+        self.measurements = []      # type: List[StartupMeasurement]
+        self._start = time.perf_counter()
+        self._started_tracing = False
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @contextmanager
+    def measure(self, category: str, name: str):
+        """Measure the block inside the with statement.
+
+        Args:
+            category: Kind of step (e.g. "init_phase", "platform" or "device_class").
+            name: Name of the step.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        allocated_before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.measurements.append(StartupMeasurement(category, name, time.perf_counter() - start,
+                                                        tracemalloc.get_traced_memory()[0] - allocated_before))
+
+    def get_report(self) -> str:
+        """Return a report of all measurements grouped by category."""
+        lines = ["MPF startup profile. Total: {:.3f}s".format(time.perf_counter() - self._start)]
+        categories = []
+        for measurement in self.measurements:
+            if measurement.category not in categories:
+                categories.append(measurement.category)
+
+        for category in categories:
+            measurements = [m for m in self.measurements if m.category == category]
+            lines.append("")
+            lines.append("{} (total: {:.3f}s)".format(category, sum(m.seconds for m in measurements)))
+            for measurement in sorted(measurements, key=lambda x: -x.seconds):
+                lines.append("  {:<50} {:>9.3f}s {:>12} bytes".format(measurement.name, measurement.seconds,
+                                                                      measurement.allocated_bytes))
+
+        return "\n".join(lines)
+
+    def write_report(self, file_name: str) -> None:
+        """Write report to file and stop tracing allocations."""
+        if not self.enabled:
+            return
+
+        with open(file_name, "w") as f:
+            f.write(self.get_report())
+            f.write("\n")
+
+        if self._started_tracing:
+            tracemalloc.stop()
+        self.enabled = False
@@ -10,6 +10,8 @@ import asyncio
 from functools import partial
 from typing import Any, Callable, Dict, List, Tuple
 
+from mpf.core.flight_recorder import FlightRecorder
+from mpf.core.handler_profiler import HandlerProfiler
 from mpf.core.platform import SwitchPlatform
 
 from mpf.core.machine import MachineController
@@ -34,6 +36,108 @@ class RegisteredSwitch:
         self.cancelled = False
 
 
+class SwitchWatch:
+
+    """Reusable wait for any switch in a list to change into a state.
+
+    The switch handlers are registered once when the watch is created and
+    return right away when no wait is pending. Every call to wait() only
+    creates a future. Changes while no wait is pending are ignored (same as
+    with wait_for_any_switch). Only one wait can be pending. A new wait
+    cancels the previous one. Call close() to remove the handlers.
+    """
+
+    __slots__ = ["switch_controller", "switches", "state", "ms", "_handlers", "_future", "_states"]
+
+    def __init__(self, switch_controller: "SwitchController", switches: List[Switch], state: int, ms) -> None:
+        """Register handlers for all switches.
+
+        Args:
+            switch_controller: The switch controller.
+            switches: Switches to watch.
+            state: The state to wait for. 0 = inactive, 1 = active, 2 = opposite to the state when wait is called.
+            ms: How long the switch needs to be in the new state.
+        """
+        self.switch_controller = switch_controller
+        self.switches = switches
+        self.state = state
+        self.ms = ms
+        self._future = None     # type: asyncio.Future
+        self._states = None     # type: Dict[Switch, int]
+        self._handlers = []     # type: List[SwitchHandler]
+        # handlers without ms. timed switch handlers would be scheduled on every change even without a wait
+        for switch in switches:
+            for handler_state in ((0, 1) if state == 2 else (state,)):
+                self._handlers.append(switch_controller.add_switch_handler_obj(
+                    switch, partial(self._switch_changed, switch, handler_state), handler_state))
+
+    def _is_target_state(self, switch: Switch, state: int) -> bool:
+        if self._states is not None:
+            # state 2 waits for a switch to leave its state at the time of the wait
+            return self._states[switch] != state
+        return state == self.state
+
+    def _switch_changed(self, switch: Switch, state: int) -> None:
+        if self._future is None or not self._is_target_state(switch, state):
+            return
+        if self.ms:
+            self._schedule_check(switch, state)
+        else:
+            self._resolve(switch, state)
+
+    def _schedule_check(self, switch: Switch, state: int) -> None:
+        self.switch_controller.machine.clock.loop.call_at(
+            switch.last_change + self.ms / 1000.0, self._check_switch, switch, state, switch.last_change)
+
+    def _check_switch(self, switch: Switch, state: int, last_change: float) -> None:
+        # only if the switch did not change again in the meantime
+        if self._future is not None and switch.last_change == last_change and switch.state == state:
+            self._resolve(switch, state)
+
+    def _resolve(self, switch: Switch, state: int) -> None:
+        future = self._future
+        self._future = None
+        if not future.done():
+            future.set_result({"switch_name": switch.name, "state": state, "ms": self.ms})
+
+    def wait(self, only_on_change=True) -> asyncio.Future:
+        """Return a future which is done when the next switch changes into the state.
+
+        Args:
+            only_on_change: Bool which controls whether this wait will be
+                triggered now if a switch is already in the state, or
+                whether it will wait until a switch changes into that state.
+        """
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+        future = asyncio.Future(loop=self.switch_controller.machine.clock.loop)   # type: asyncio.Future
+
+        if not only_on_change:
+            for switch in self.switches:
+                if self.switch_controller.is_state(switch.name, self.state, self.ms):
+                    future.set_result({"switch_name": switch.name, "state": self.state, "ms": self.ms})
+                    return future
+
+        if self.state == 2:
+            self._states = {switch: switch.state for switch in self.switches}
+        elif self.ms:
+            # switches which changed into the state recently but not long enough ago
+            for switch in self.switches:
+                if switch.state == self.state and \
+                        self.switch_controller.machine.clock.get_time() < switch.last_change + self.ms / 1000.0:
+                    self._schedule_check(switch, self.state)
+        self._future = future
+        return future
+
+    def close(self) -> None:
+        """Remove all handlers. A pending wait will not be done anymore."""
+        for handler in self._handlers:
+            self.switch_controller.remove_switch_handler_by_key(handler)
+        self._handlers = []
+        self._future = None
+
+
 class SwitchController(MpfController):
 
     """Tracks all switches in the machine, receives switch activity, and converts switch changes into events."""
@@ -375,6 +479,7 @@ class SwitchController(MpfController):
         # update the switch device
         obj.state = state
         obj.last_change = self.machine.clock.get_time()
+        self.machine.flight_recorder.record(FlightRecorder.SWITCH, obj.name, state)
 
         if state:
             self.info_log("<<<<<<< '%s' active >>>>>>>", obj.name)
@@ -439,6 +544,21 @@ class SwitchController(MpfController):
                                                                      switch_name=switch_name)))
         return future
 
+    def watch_any_switch(self, switch_names: List[str], state: int = 1, ms=0) -> SwitchWatch:
+        """Return a reusable watch for the first switch in the list to change into state.
+
+        Use this instead of wait_for_any_switch in loops which wait for the
+        same switches over and over again. Call close() on the watch when it
+        is no longer needed.
+
+        Args:
+            switch_names: Iterable of strings of switch names.
+            state: The state to wait for. 0 = inactive, 1 = active, 2 = opposite to current.
+            ms: How long the switch needs to be in the new state to trigger
+                the wait.
+        """
+        return SwitchWatch(self, [self.machine.switches[switch_name] for switch_name in switch_names], state, ms)
+
     def _future_done(self, handlers: List[SwitchHandler], future: asyncio.Future):
         del future
         for handler in handlers:
@@ -502,7 +622,10 @@ class SwitchController(MpfController):
             else:
                 # This entry doesn't have a timed delay, so do the action
                 # now
-                entry.callback()
+                if self.machine.handler_profiler.interval:
+                    self.machine.handler_profiler.call(HandlerProfiler.SWITCH, switch.name, entry.callback)
+                else:
+                    entry.callback()
 
     def add_monitor(self, monitor: Callable[[MonitoredSwitchChange], None]):
         """Add a monitor callback which is called on switch changes."""
@@ -663,7 +786,10 @@ class SwitchController(MpfController):
                             "Processing timed switch handler. Switch: %s "
                             " State: %s, ms: %s", entry.switch_name,
                             entry.state, entry.ms)
-                    entry.callback()
+                    if self.machine.handler_profiler.interval:
+                        self.machine.handler_profiler.call(HandlerProfiler.SWITCH, entry.switch_name, entry.callback)
+                    else:
+                        entry.callback()
                 del self.active_timed_switches[k]
             else:
                 if not next_event_time or next_event_time > k:
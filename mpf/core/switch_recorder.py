@@ -0,0 +1,236 @@
+"""Records switch changes and posted events to a compact binary log which can be replayed later."""
+import json
+import os
+import struct
+from datetime import datetime
+from typing import List, Dict, Any, Tuple, Optional
+
+from mpf.core.flight_recorder import FlightRecorder
+
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.core.machine import MachineController
+
+__api__ = ['SwitchRecorder', 'SwitchRecording']
+
+# machine vars which describe the host and not the game
+SYSTEM_MACHINE_VARS = {"mpf_version", "mpf_extended_version", "python_version", "platform", "platform_system",
+                       "platform_release", "platform_version", "platform_machine"}
+
+
+def get_machine_state(machine: "MachineController", players) -> Dict[str, Any]:
+    """Return machine vars and player vars in a form which can be stored as JSON."""
+    return {
+        "machine_vars": {name: var["value"] for name, var in machine.machine_vars.items()
+                         if name not in SYSTEM_MACHINE_VARS},
+        "players": [dict(player.vars) for player in players]
+    }
+
+
+class SwitchRecording:
+
+    """Binary switch log format.
+
+    The file starts with a magic string followed by records. Every record
+    starts with a type byte. Names of switches and events are stored once in
+    a NAME record and referenced by id afterwards. Timestamps are seconds
+    since the recording started. Records are written in the order they
+    happened so every switch change also knows how many events and coil
+    pulses came before it.
+    """
+
+    MAGIC = b"MPFSWREC\x01"
+
+    NAME = 0
+    SWITCH = 1
+    EVENT = 2
+    STATE = 3
+    PULSE = 4
+
+    name_record = struct.Struct("<BHH")         # type, id, length of utf-8 name
+    switch_record = struct.Struct("<BdHB")      # type, time, name id, state
+    event_record = struct.Struct("<BdH")        # type, time, name id
+    state_record = struct.Struct("<BdI")        # type, time, length of json
+    pulse_record = struct.Struct("<BdHi")       # type, time, name id, pulse ms
+
+    def __init__(self):
+        """Initialise empty recording."""
+        self.start_state = {}           # type: Dict[str, Any]
+        self.final_state = None         # type: Optional[Dict[str, Any]]
+        self.final_time = 0.0
+        self.switches = []              # type: List[Tuple[float, str, int, int]]
+        self.events = []                # type: List[Tuple[float, str]]
+        self.pulses = []                # type: List[Tuple[float, str, int]]
+
+    @classmethod
+    def load(cls, file_name) -> "SwitchRecording":
+        """Load a recording from a file."""
+        with open(file_name, "rb") as f:
+            data = f.read()
+
+        return cls.parse(data)
+
+    @classmethod
+    def parse(cls, data: bytes) -> "SwitchRecording":
+        """Parse a recording. A truncated last record (e.g. after a power loss) is ignored."""
+        if not data.startswith(cls.MAGIC):
+            raise AssertionError("Not a switch recording.")
+
+        recording = cls()
+        names = {}
+        position = len(cls.MAGIC)
+        try:
+            while position < len(data):
+                record_type = data[position]
+                if record_type == cls.SWITCH:
+                    _, timestamp, name_id, state = cls.switch_record.unpack_from(data, position)
+                    position += cls.switch_record.size
+                    recording.switches.append((timestamp, names[name_id], state,
+                                               len(recording.events) + len(recording.pulses)))
+                elif record_type == cls.EVENT:
+                    _, timestamp, name_id = cls.event_record.unpack_from(data, position)
+                    position += cls.event_record.size
+                    recording.events.append((timestamp, names[name_id]))
+                elif record_type == cls.PULSE:
+                    _, timestamp, name_id, pulse_ms = cls.pulse_record.unpack_from(data, position)
+                    position += cls.pulse_record.size
+                    recording.pulses.append((timestamp, names[name_id], pulse_ms))
+                elif record_type == cls.NAME:
+                    _, name_id, length = cls.name_record.unpack_from(data, position)
+                    position += cls.name_record.size
+                    names[name_id] = data[position:position + length].decode()
+                    position += length
+                elif record_type == cls.STATE:
+                    _, timestamp, length = cls.state_record.unpack_from(data, position)
+                    position += cls.state_record.size
+                    if position + length > len(data):
+                        break
+                    state = json.loads(data[position:position + length].decode())
+                    position += length
+                    if state["type"] == "start":
+                        recording.start_state = state
+                    else:
+                        recording.final_state = state
+                        recording.final_time = timestamp
+                else:
+                    raise AssertionError("Invalid record type {} at {}".format(record_type, position))
+        except struct.error:
+            pass
+
+        return recording
+
+
+class SwitchRecorder:
+
+    """Appends every switch change and posted event to a binary log.
+
+    The recorder receives records from the flight recorder and packs them into
+    an in-memory buffer which is written to disk once per second and on
+    shutdown. The log starts with all active switches and persisted machine
+    vars and ends with the final machine and player state. Use ``mpf replay``
+    to play it back.
+    """
+
+    __slots__ = ["machine", "file_name", "_file", "_buffer", "_name_ids", "start_time", "output_count", "_players",
+                 "_flush_handle"]
+
+    def __init__(self, machine: "MachineController", file_name: str) -> None:
+        """Initialise recorder and start recording when init is done."""
+        self.machine = machine
+        self.file_name = file_name
+        self._file = None
+        self._buffer = bytearray()
+        self._name_ids = {}     # type: Dict[str, int]
+        self.start_time = 0
+        self.output_count = 0
+        self._players = []
+        self._flush_handle = None
+
+        self.machine.events.add_handler('init_done', self._start, priority=10000)
+        self.machine.events.add_handler('game_will_end', self._remember_players)
+        self.machine.events.add_handler('shutdown', self.stop)
+
+    @staticmethod
+    def get_file_name(machine_path, file_name) -> str:
+        """Return full path of the recording. The name may contain strftime placeholders."""
+        return os.path.join(machine_path, "logs", datetime.now().strftime(file_name))
+
+    def _start(self, **kwargs):
+        """Write the start state and begin recording."""
+        del kwargs
+        os.makedirs(os.path.dirname(self.file_name), exist_ok=True)
+        self._file = open(self.file_name, "wb")
+        self._buffer.extend(SwitchRecording.MAGIC)
+        self.start_time = self.machine.clock.get_time()
+        self._write_state({
+            "type": "start",
+            "active_switches": [switch.name for switch in self.machine.switches if switch.state],
+            "machine_vars": {name: {"value": var["value"]} for name, var in self.machine.machine_vars.items()
+                             if var["persist"]}
+        })
+        self.machine.flight_recorder.stream = self
+        self._flush_handle = self.machine.clock.schedule_interval(self.flush, 1)
+
+    def _remember_players(self, **kwargs):
+        del kwargs
+        self._players = list(self.machine.game.player_list)
+
+    def _get_name_id(self, name) -> Optional[int]:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = len(self._name_ids)
+            if name_id > 0xFFFF:
+                # name table is full
+                return None
+            self._name_ids[name] = name_id
+            encoded_name = name.encode()
+            self._buffer.extend(SwitchRecording.name_record.pack(SwitchRecording.NAME, name_id, len(encoded_name)))
+            self._buffer.extend(encoded_name)
+        return name_id
+
+    def record(self, record_type: int, name: str, value: int, timestamp: float) -> None:
+        """Append a flight recorder record to the log."""
+        name_id = self._get_name_id(name)
+        if name_id is None:
+            return
+
+        if record_type == FlightRecorder.SWITCH:
+            self._buffer.extend(SwitchRecording.switch_record.pack(
+                SwitchRecording.SWITCH, timestamp - self.start_time, name_id, value))
+        elif record_type == FlightRecorder.PULSE:
+            self.output_count += 1
+            self._buffer.extend(SwitchRecording.pulse_record.pack(
+                SwitchRecording.PULSE, timestamp - self.start_time, name_id, value))
+        else:
+            self.output_count += 1
+            self._buffer.extend(SwitchRecording.event_record.pack(
+                SwitchRecording.EVENT, timestamp - self.start_time, name_id))
+
+    def _write_state(self, state):
+        data = json.dumps(state, default=str).encode()
+        self._buffer.extend(SwitchRecording.state_record.pack(
+            SwitchRecording.STATE, self.machine.clock.get_time() - self.start_time, len(data)))
+        self._buffer.extend(data)
+
+    def flush(self) -> None:
+        """Write buffered records to disk."""
+        if self._file and self._buffer:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self._buffer = bytearray()
+
+    def stop(self, **kwargs) -> None:
+        """Write final state and close the log."""
+        del kwargs
+        if not self._file:
+            return
+
+        self.machine.flight_recorder.stream = None
+        self.machine.clock.unschedule(self._flush_handle)
+        players = self.machine.game.player_list if self.machine.game else self._players
+        state = get_machine_state(self.machine, players)
+        state["type"] = "final"
+        self._write_state(state)
+        self.flush()
+        self._file.close()
+        self._file = None
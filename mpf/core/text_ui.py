@@ -26,9 +26,12 @@ class TextUi(MpfController):
 
     config_name = "text_ui"
 
+    # maximum screen refreshes per second
+    MAX_FPS = 20
+
     __slots__ = ["start_time", "machine", "_tick_task", "screen", "mpf_process", "ball_devices", "switches",
                  "player_start_row", "column_positions", "columns", "_pending_bcp_connection", "_asset_percent",
-                 "_bcp_status"]
+                 "_bcp_status", "_cells", "_refresh_handle", "_last_refresh"]
 
     def __init__(self, machine: "MachineController") -> None:
         """Initialize TextUi."""
@@ -47,6 +50,10 @@ class TextUi(MpfController):
         self.ball_devices = list()      # type: List[BallDevice]
 
         self.switches = OrderedDict()   # type: Dict[Switch, Tuple[str, int, int]]
+        # last text and colors printed at each position. used to skip unchanged prints
+        self._cells = {}                # type: Dict[Tuple[int, int], Tuple[str, int, int]]
+        self._refresh_handle = None     # type: asyncio.TimerHandle
+        self._last_refresh = 0
         self.player_start_row = 0
         self.column_positions = [0, .25, .5, .75]
         self.columns = [0] * len(self.column_positions)
@@ -74,6 +81,32 @@ class TextUi(MpfController):
         self._bcp_status = (0, 0, 0)  # type: Tuple[float, int, int]
 
         self._draw_screen()
+        self._refresh()
+
+    def _print_at(self, text, x, y, colour=7, bg=0):
+        """Print text at a position if it differs from what is already there."""
+        if self._cells.get((x, y)) == (text, colour, bg):
+            return
+        self._cells[(x, y)] = (text, colour, bg)
+        self.screen.print_at(text, x, y, colour=colour, bg=bg)
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Refresh the screen at most MAX_FPS times per second."""
+        if self._refresh_handle:
+            return
+        next_refresh = self._last_refresh + 1 / self.MAX_FPS
+        if next_refresh <= self.machine.clock.get_time():
+            self._refresh_handle = self.machine.clock.loop.call_soon(self._refresh)
+        else:
+            self._refresh_handle = self.machine.clock.loop.call_at(next_refresh, self._refresh)
+
+    def _refresh(self):
+        """Draw all changes to the terminal."""
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        self._last_refresh = self.machine.clock.get_time()
         self.screen.refresh()
 
     def _init(self, **kwargs):
@@ -205,15 +238,20 @@ class TextUi(MpfController):
 
         self._update_switches()
 
-    def _update_switches(self, *args, **kwargs):
-        del args, kwargs
-        for sw, info in self.switches.items():
+    def _update_switches(self, change=None, **kwargs):
+        del kwargs
+        if change:
+            # only redraw the switch which changed
+            switch = self.machine.switches.get(change.name)
+            switches = [switch] if switch in self.switches else []
+        else:
+            switches = self.switches
+
+        for sw in switches:
             if sw.state:
-                self.screen.print_at(*info, colour=0, bg=2)
+                self._print_at(*self.switches[sw], colour=0, bg=2)
             else:
-                self.screen.print_at(*info)
-
-        self.screen.refresh()
+                self._print_at(*self.switches[sw])
 
     def _mode_change(self, *args, **kwargs):
         # Have to call this on the next frame since the mode controller's
@@ -227,14 +265,13 @@ class TextUi(MpfController):
         del kwargs
         modes = self.machine.mode_controller.active_modes
 
+        width = int(self.screen.width * .25) - 1
         for i, mode in enumerate(modes):
-            self.screen.print_at(' ' * (self.columns[0] - 1),
-                                 self.columns[0], i + 4)
-            self.screen.print_at('{} ({})'.format(mode.name, mode.priority),
-                                 self.columns[0], i + 4)
+            # pad to overwrite the previous mode in this row
+            self._print_at('{} ({})'.format(mode.name, mode.priority).ljust(width),
+                           self.columns[0], i + 4)
 
-        self.screen.print_at(' ' * (int(self.screen.width * .25) - 1),
-                             self.columns[0], len(modes) + 4)
+        self._print_at(' ' * width, self.columns[0], len(modes) + 4)
 
     def _update_ball_devices(self, **kwargs):
         del kwargs
@@ -243,16 +280,16 @@ class TextUi(MpfController):
 
         try:
             for pf in self.machine.playfields:
-                self.screen.print_at('{}: {} '.format(pf.name, pf.balls),
-                                     self.columns[3], row,
-                                     colour=2 if pf.balls else 7)
+                self._print_at('{}: {} '.format(pf.name, pf.balls),
+                               self.columns[3], row,
+                               colour=2 if pf.balls else 7)
                 row += 1
         except AttributeError:
             pass
 
         for bd in self.ball_devices:
             # extra spaces to overwrite previous chars if the str shrinks
-            self.screen.print_at('{}: {} ({})                   '.format(
+            self._print_at('{}: {} ({})                   '.format(
                 bd.name, bd.balls, bd.state), self.columns[3], row,
                 colour=2 if bd.balls else 7)
             row += 1
@@ -291,6 +328,7 @@ class TextUi(MpfController):
     def _tick(self):
         if self.screen.has_resized():
             self.screen = Screen.open()
+            self._cells = {}
             self._update_switch_layout()
             self._update_modes()
             self._draw_screen()
@@ -300,7 +338,7 @@ class TextUi(MpfController):
                                                                 bcp_command="status_request")
         self._update_stats()
         self._update_ball_devices()
-        self.screen.refresh()
+        self._schedule_refresh()
 
     def _bcp_connection_attempt(self, name, host, port, **kwargs):
         del name
@@ -313,6 +351,8 @@ class TextUi(MpfController):
         self._pending_bcp_connection = None
         self.screen.print_at(' ' * self.screen.width,
                              0, int(self.screen.height / 2) - 1)
+        # the overlay covered other cells. redraw them
+        self._cells = {}
 
         self._update_modes()
         self._update_switches()
@@ -328,6 +368,8 @@ class TextUi(MpfController):
         self._asset_percent = 100
         self.screen.print_at(' ' * self.screen.width,
                              0, int(self.screen.height / 2) + 1)
+        # the overlay covered other cells. redraw them
+        self._cells = {}
 
         self._update_modes()
         self._update_switches()
@@ -339,6 +381,9 @@ class TextUi(MpfController):
 
         if self.screen:
             self.machine.clock.unschedule(self._tick_task)
+            if self._refresh_handle:
+                self._refresh_handle.cancel()
+                self._refresh_handle = None
             logger = logging.getLogger()
             logger.addHandler(logging.StreamHandler())
             self.screen.close(True)
@@ -33,7 +33,7 @@ class BallDevice(SystemWideDevice):
     collection = 'ball_devices'
     class_label = 'ball_device'
 
-    __slots__ = ["delay", "available_balls", "_target_on_unexpected_ball", "_source_devices", "_ball_requests",
+    __slots__ = ["delay", "_available_balls", "_target_on_unexpected_ball", "_ball_requests",
                  "ejector", "ball_count_handler", "incoming_balls_handler", "outgoing_balls_handler",
                  "counted_balls", "_state"]
 
@@ -43,15 +43,11 @@ class BallDevice(SystemWideDevice):
 
         self.delay = DelayManager(machine.delayRegistry)
 
-        self.available_balls = 0
-        """Number of balls that are available to be ejected. This differs from
-        `balls` since it's possible that this device could have balls that are
-        being used for some other eject, and thus not available."""
+        self._available_balls = 0
 
         self._target_on_unexpected_ball = None
         # Device will eject to this target when it captures an unexpected ball
 
-        self._source_devices = list()
         # Ball devices that have this device listed among their eject targets
 
         self._ball_requests = deque()
@@ -451,15 +447,6 @@ class BallDevice(SystemWideDevice):
                 self.config['ball_search_order'], self.ejector.ball_search,
                 self.name)
 
-        # Register events to watch for ejects targeted at this device
-        for device in self.machine.ball_devices:
-            if device.is_playfield():
-                continue
-            for target in device.config['eject_targets']:
-                if target.name == self.name:
-                    self._source_devices.append(device)
-                    break
-
         # register event handler for available balls at source devices
         self.machine.events.add_handler(
             'balldevice_balls_available',
@@ -544,30 +531,29 @@ class BallDevice(SystemWideDevice):
         '''
 
     @property
-    def state(self):
-        """Return the device state."""
-        return self._state
-
-    def find_one_available_ball(self, path=deque()):
-        """Find a path to a source device which has at least one available ball."""
-        # copy path
-        path = deque(path)
-
-        # prevent loops
-        if self in path:
-            return False
+    def available_balls(self):
+        """Number of balls that are available to be ejected.
 
-        path.appendleft(self)
+        This differs from `balls` since it's possible that this device could
+        have balls that are being used for some other eject, and thus not
+        available.
+        """
+        return self._available_balls
 
-        if self.available_balls > 0 and len(path) > 1:
-            return path
+    @available_balls.setter
+    def available_balls(self, value):
+        """Set available balls and update the ball routing graph."""
+        self._available_balls = value
+        self.machine.ball_controller.routing.update_available_balls(self, value)
 
-        for source in self._source_devices:
-            full_path = source.find_one_available_ball(path=path)
-            if full_path:
-                return full_path
+    @property
+    def state(self):
+        """Return the device state."""
+        return self._state
 
-        return False
+    def find_one_available_ball(self):
+        """Find the shortest path from a source device which has at least one available ball."""
+        return self.machine.ball_controller.routing.find_one_available_ball(self)
 
     def request_ball(self, balls=1, **kwargs):
         """Request that one or more balls is added to this device.
@@ -669,39 +655,11 @@ class BallDevice(SystemWideDevice):
 
     def find_next_trough(self):
         """Find next trough after device."""
-        # are we a trough?
-        if 'trough' in self.tags:
-            return self
-
-        # otherwise find any target which can
-        for target_device in self.config['eject_targets']:
-            if target_device.is_playfield():
-                continue
-            trough = target_device.find_next_trough()
-            if trough:
-                return trough
-
-        return False
+        return self.machine.ball_controller.routing.find_next_trough(self)
 
     def find_path_to_target(self, target):
-        """Find a path to this target."""
-        # if we can eject to target directly just do it
-        if target in self.config['eject_targets']:
-            path = deque()
-            path.appendleft(target)
-            path.appendleft(self)
-            return path
-        else:
-            # otherwise find any target which can
-            for target_device in self.config['eject_targets']:
-                if target_device.is_playfield():
-                    continue
-                path = target_device.find_path_to_target(target)
-                if path:
-                    path.appendleft(self)
-                    return path
-
-        return False
+        """Find the shortest path to this target."""
+        return self.machine.ball_controller.routing.find_path(self, target)
 
     def eject(self, balls=1, target=None, **kwargs) -> int:
         """Eject balls to target.
@@ -1,9 +1,11 @@
 """Contains the Driver parent class."""
 import asyncio
+from functools import partial
 from typing import Optional
 
 from mpf.core.delays import DelayManager
 from mpf.core.events import event_handler
+from mpf.core.flight_recorder import FlightRecorder
 from mpf.core.machine import MachineController
 from mpf.core.platform import DriverPlatform, DriverConfig
 from mpf.core.system_wide_device import SystemWideDevice
@@ -220,16 +222,9 @@ class Driver(SystemWideDevice):
         # inform bcp clients
         self.machine.bcp.interface.send_driver_event(action="disable", name=self.name, number=self.config['number'])
 
-    def _get_wait_ms(self, pulse_ms: int, max_wait_ms: Optional[int]) -> int:
-        """Determine if this pulse should be delayed."""
-        if max_wait_ms is None:
-            self.config['psu'].notify_about_instant_pulse(pulse_ms=pulse_ms)
-            return 0
-        else:
-            return self.config['psu'].get_wait_time_for_pulse(pulse_ms=pulse_ms, max_wait_ms=max_wait_ms)
-
     def _pulse_now(self, pulse_ms: int, pulse_power: float) -> None:
         """Pulse this driver now."""
+        self.machine.flight_recorder.record(FlightRecorder.PULSE, self.name, pulse_ms)
         if 0 < pulse_ms <= self.platform.features['max_pulse']:
             self.info_log("Pulsing Driver for %sms (%s pulse_power)", pulse_ms, pulse_power)
             self.hw_driver.pulse(PulseSettings(power=pulse_power, duration=pulse_ms))
@@ -253,17 +248,20 @@ class Driver(SystemWideDevice):
                 enabled for. If no value is provided, the driver will be
                 enabled for the value specified in the config dictionary.
             pulse_power: The pulse power. A float between 0.0 and 1.0.
+            max_wait_ms: Maximum time the PSU may delay this pulse. If None the
+                pulse will happen right away.
+
+        Returns the time in ms until the pulse is expected to start.
         """
         del kwargs
 
         pulse_ms = self.get_and_verify_pulse_ms(pulse_ms)
         pulse_power = self.get_and_verify_pulse_power(pulse_power)
-        wait_ms = self._get_wait_ms(pulse_ms, max_wait_ms)
+        wait_ms = self.config['psu'].schedule_pulse(pulse_ms, partial(self._pulse_now, pulse_ms, pulse_power),
+                                                    max_wait_ms=max_wait_ms, amps=self.config['psu_amps'],
+                                                    priority=self.config['psu_priority'])
 
         if wait_ms > 0:
             self.debug_log("Delaying pulse by %sms pulse_ms: %sms (%s pulse_power)", wait_ms, pulse_ms, pulse_power)
-            self.delay.add(wait_ms, self._pulse_now, pulse_ms=pulse_ms, pulse_power=pulse_power)
-        else:
-            self._pulse_now(pulse_ms, pulse_power)
 
         return wait_ms
@@ -37,6 +37,11 @@ class LightStackEntry:
         """Compare two stack entries."""
         return self.priority > other.priority or (self.priority == other.priority and self.key > other.key)
 
+    def get_start_color(self, index):
+        """Return start color. Index is only used by entries which are shared by multiple lights."""
+        del index
+        return self.start_color
+
 
 @DeviceMonitor(_color="color")
 class Light(SystemWideDevice, DevicePositionMixin):
@@ -57,7 +62,8 @@ class Light(SystemWideDevice, DevicePositionMixin):
         self.platforms = set()      # type: Set[LightsPlatform]
         super().__init__(machine, name)
         self.machine.light_controller.initialise_light_subsystem()
-        self.delay = DelayManager(self.machine.delayRegistry)
+        # only needed for fade outs. created on first use
+        self.delay = None
 
         self.default_fade_ms = None
 
@@ -302,14 +308,50 @@ class Light(SystemWideDevice, DevicePositionMixin):
         if fade_ms is None:
             fade_ms = self.default_fade_ms
 
-        start_time = self.machine.clock.get_time()
+        if self._add_color(color, fade_ms, priority, key, self.machine.clock.get_time()):
+            self._schedule_update()
+
+    @staticmethod
+    def color_lights(lights, color, fade_ms=None, priority=0, key=None):
+        """Set the same color on a list of lights.
+
+        This does the same as calling :meth:`color` on every light but the
+        color is parsed once and every platform is synced once at the end.
+
+        Args:
+            lights: List of lights.
+            color: RGBColor() instance, "on" or anything RGBColor() accepts.
+            fade_ms: Fade time or None for the default of every light.
+            priority: Priority on the stack.
+            key: Key for removal later on.
+        """
+        if not lights:
+            return
+
+        if not isinstance(color, RGBColor) and not (isinstance(color, str) and color == "on"):
+            color = RGBColor(color)
+
+        start_time = lights[0].machine.clock.get_time()
+        platforms = set()
+        for light in lights:
+            light_color = light.config['default_on_color'] if isinstance(color, str) else color
+            light_fade_ms = light.default_fade_ms if fade_ms is None else fade_ms
+            # pylint: disable-msg=protected-access
+            if light._add_color(light_color, light_fade_ms, priority, key, start_time):
+                light._set_fade_on_drivers()    # pylint: disable-msg=protected-access
+                platforms.update(light.platforms)
+
+        for platform in platforms:
+            platform.light_sync()
 
+    # pylint: disable-msg=too-many-arguments
+    def _add_color(self, color, fade_ms, priority, key, start_time) -> bool:
+        """Add color to stack and return True if the visible color may change."""
         color_changes = not self.stack or self.stack[0].priority <= priority or self.stack[0].dest_color is None
 
         self._add_to_stack(color, fade_ms, priority, key, start_time)
 
-        if color_changes:
-            self._schedule_update()
+        return color_changes
 
     def on(self, brightness=None, fade_ms=None, priority=0, key=None, **kwargs):
         """Turn light on.
@@ -437,6 +479,8 @@ class Light(SystemWideDevice, DevicePositionMixin):
                                               color_of_key,
                                               start_time + fade_ms / 1000.0,
                                               None))
+            if not self.delay:
+                self.delay = DelayManager(self.machine.delayRegistry)
             self.delay.reset(ms=fade_ms, callback=partial(self._remove_fade_out, key=key), name="remove_fade")
             if len(self.stack) > 1:
                 self.stack.sort(reverse=True)
@@ -478,10 +522,13 @@ class Light(SystemWideDevice, DevicePositionMixin):
         else:
             self.stack = [x for x in self.stack if x.key != key]
 
-    def _schedule_update(self):
+    def _set_fade_on_drivers(self):
         for hw_driver, function in self.hw_driver_functions:
             hw_driver.set_fade(function)
 
+    def _schedule_update(self):
+        self._set_fade_on_drivers()
+
         for platform in self.platforms:
             platform.light_sync()
 
@@ -493,6 +540,14 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
         self._schedule_update()
 
+    def _get_stack(self):
+        """Return the stack which defines the color of this light."""
+        return self.stack
+
+    def _get_start_color(self, entry):
+        """Return the start color of a stack entry for this light."""
+        return entry.start_color
+
     def _get_priority_from_key(self, key):
         if not self.stack:
             return 0
@@ -512,8 +567,8 @@ class Light(SystemWideDevice, DevicePositionMixin):
         Returns:
             An updated RGBColor() instance with gamma corrected.
         """
-        factor = self.machine.get_machine_var("brightness")
-        if not factor:
+        factor = self.machine.settings.snapshot.brightness
+        if not factor or factor == 1.0:
             return color
         else:
             return RGBColor([int(x * factor) for x in color])
@@ -586,10 +641,10 @@ class Light(SystemWideDevice, DevicePositionMixin):
         except ZeroDivisionError:
             ratio = 1.0
 
-        return RGBColor.blend(color_settings.start_color, dest_color, ratio), max_fade_ms
+        return RGBColor.blend(self._get_start_color(color_settings), dest_color, ratio), max_fade_ms
 
     def _get_brightness_and_fade(self, max_fade_ms: int, color: str) -> Tuple[float, int]:
-        uncorrected_color, fade_ms = self._get_color_and_fade(self.stack, max_fade_ms)
+        uncorrected_color, fade_ms = self._get_color_and_fade(self._get_stack(), max_fade_ms)
         corrected_color = self.gamma_correct(uncorrected_color)
         corrected_color = self.color_correct(corrected_color)
 
@@ -611,18 +666,19 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
         Similar to get_color.
         """
-        if not self.stack:
+        full_stack = self._get_stack()
+        if not full_stack:
             # no stack -> we are black
             return RGBColor("off")
 
-        if self.stack[0].key == key and self.stack[0].priority == priority:
+        if full_stack[0].key == key and full_stack[0].priority == priority:
             # fast path for resetting the top element
-            return self._get_color_and_fade(self.stack, 0)[0]
+            return self._get_color_and_fade(full_stack, 0)[0]
 
         stack = []
-        for i, entry in enumerate(self.stack):
+        for i, entry in enumerate(full_stack):
             if entry.priority <= priority and entry.key <= key:
-                stack = self.stack[i:]
+                stack = full_stack[i:]
                 break
         return self._get_color_and_fade(stack, 0)[0]
 
@@ -634,9 +690,10 @@ class Light(SystemWideDevice, DevicePositionMixin):
 
         Also note the color returned is the "raw" color that does has not had the color correction profile applied.
         """
-        return self._get_color_and_fade(self.stack, 0)[0]
+        return self._get_color_and_fade(self._get_stack(), 0)[0]
 
     @property
     def fade_in_progress(self) -> bool:
         """Return true if a fade is in progress."""
-        return bool(self.stack and self.stack[0].dest_time > self.machine.clock.get_time())
+        stack = self._get_stack()
+        return bool(stack and stack[0].dest_time > self.machine.clock.get_time())
@@ -4,26 +4,110 @@ import asyncio
 import copy
 
 import math
+from functools import partial
 
-from typing import List
+from typing import List, Set
 
+from mpf.core.delays import DelayManager
 from mpf.core.machine import MachineController
+from mpf.core.platform import LightsPlatform
+from mpf.core.rgb_color import RGBColor
 
 from mpf.core.system_wide_device import SystemWideDevice
-from mpf.devices.light import Light
+from mpf.devices.light import Light, LightStackEntry
+
+
+class LightGroupStackEntry(LightStackEntry):
+
+    """Stack entry which is shared by all lights in a group.
+
+    Start colors are packed into one bytearray with three bytes per light. If
+    all lights started from the same color start_colors is None and
+    start_color is used instead.
+    """
+
+    __slots__ = ["start_colors"]
+
+    # pylint: disable-msg=too-many-arguments
+    def __init__(self, priority, key, start_time, start_color, dest_time, dest_color, start_colors):
+        """Initialize group stack entry."""
+        super().__init__(priority, key, start_time, start_color, dest_time, dest_color)
+        self.start_colors = start_colors
+
+    def get_start_color(self, index):
+        """Return start color of the light at index."""
+        if self.start_colors is None:
+            return self.start_color
+        return RGBColor(self.start_colors[index * 3:index * 3 + 3])
+
+
+class LightGroupPixel(Light):
+
+    """A light in a light group.
+
+    The light has its own stack for colors set on the light (e.g. by shows).
+    Colors set on the group are stored once in the stack of the group and
+    merged into the stack of the light when its color is calculated.
+    """
+
+    __slots__ = ["group", "index"]
+
+    def __init__(self, machine, name, group, index):
+        """Initialise light in group."""
+        super().__init__(machine, name)
+        self.group = group
+        self.index = index
+
+    def _get_stack(self):
+        group_stack = self.group.stack
+        if not group_stack:
+            return self.stack
+        if not self.stack:
+            return group_stack
+        return sorted(self.stack + group_stack, reverse=True)
+
+    def _get_start_color(self, entry):
+        return entry.get_start_color(self.index)
+
+    # pylint: disable-msg=too-many-arguments
+    def _add_to_stack(self, color, fade_ms, priority, key, start_time):
+        # an entry with the same key on the group would hide this one
+        self.group.move_entry_to_lights("" if key is None else key)
+        super()._add_to_stack(color, fade_ms, priority, key, start_time)
+
+    def remove_from_stack_by_key(self, key, fade_ms=None):
+        """Remove key from the stack of this light and from the group stack for this light."""
+        self.group.move_entry_to_lights(str(key))
+        super().remove_from_stack_by_key(key, fade_ms)
+
+    def remove_key_without_fade(self, key):
+        """Remove key from the own stack of this light when the group replaces it."""
+        self._remove_from_stack_by_key(key)
 
 
 class LightGroup(SystemWideDevice):
 
-    """An abstract group of lights."""
+    """An abstract group of lights.
 
-    __slots__ = ["lights"]
+    All lights are created from one validated light_template. Colors set on
+    the group are stored in one stack for the whole group and sent to the
+    platforms in one batch.
+    """
+
+    __slots__ = ["lights", "stack", "delay", "default_fade_ms", "_light_config", "_hw_driver_functions",
+                 "_platforms"]
 
     def __init__(self, machine: MachineController, name) -> None:
         """Initialise light group."""
         super().__init__(machine, name)
 
-        self.lights = []        # type: List[Light]
+        self.lights = []        # type: List[LightGroupPixel]
+        self.stack = []         # type: List[LightGroupStackEntry]
+        self.delay = DelayManager(self.machine.delayRegistry)
+        self.default_fade_ms = 0
+        self._light_config = None
+        self._hw_driver_functions = []
+        self._platforms = set()     # type: Set[LightsPlatform]
 
     @classmethod
     def prepare_config(cls, config: dict, is_mode_config: bool):
@@ -51,24 +135,41 @@ class LightGroup(SystemWideDevice):
 
         for light in self.lights:
             yield from light.device_added_system_wide()
+            self._hw_driver_functions.extend(light.hw_driver_functions)
+            self._platforms.update(light.platforms)
+
+        if self.lights:
+            self.default_fade_ms = self.lights[0].default_fade_ms
 
     def get_token(self):
         """Return all lights in group as token."""
         return {'lights': self.lights}
 
     def _create_light_at_index(self, index, x, y, relative_index):
-        light = Light(self.machine, self.name + "_light_" + str(relative_index))
-        tags = [self.name]
-        tags.extend(self.config['tags'])
-        light_config = copy.deepcopy(self.config['light_template'])
+        light = LightGroupPixel(self.machine, self.name + "_light_" + str(relative_index), self, relative_index)
         if self.config['number_template']:
-            light_config['number'] = self.config['number_template'].format(index)
+            number = self.config['number_template'].format(index)
+        else:
+            number = index
+
+        if self._light_config is None:
+            # validate the template once and copy it for all other lights
+            light_config = copy.deepcopy(self.config['light_template'])
+            light_config['number'] = number
+            light_config['tags'].append(self.name)
+            light_config['x'] = x
+            light_config['y'] = y
+            light_config = light.validate_and_parse_config(light_config, False)
+            self._light_config = dict(light_config)
         else:
-            light_config['number'] = index
-        light_config['tags'].append(self.name)
-        light_config['x'] = x
-        light_config['y'] = y
-        light_config = light.validate_and_parse_config(light_config, False)
+            light_config = dict(self._light_config)
+            light_config['number'] = str(number)
+            light_config['tags'] = list(self._light_config['tags'])
+            light_config['x'] = float(x) if x is not None else None
+            light_config['y'] = float(y) if y is not None else None
+            # pylint: disable-msg=protected-access
+            light._configure_device_logging(light_config)
+
         light.load_config(light_config)
         self.lights.append(light)
         self.machine.lights[light.name] = light
@@ -77,10 +178,188 @@ class LightGroup(SystemWideDevice):
     def _create_lights(self):
         raise NotImplementedError("Implement")
 
+    def _get_colors(self, get_color):
+        """Return colors of all lights packed into a bytearray or a single color if all are the same."""
+        colors = bytearray()
+        for light in self.lights:
+            colors.extend(get_color(light).rgb)
+
+        if colors[0:3] * len(self.lights) == colors:
+            return RGBColor(colors[0:3]), None
+        return None, colors
+
+    def _get_colors_below(self, priority, key):
+        if not any(light.stack for light in self.lights) and \
+                all(entry.start_colors is None for entry in self.stack):
+            # all lights are in the same state
+            return self.lights[0].get_color_below(priority, key), None
+
+        return self._get_colors(lambda light: light.get_color_below(priority, key))
+
+    def _get_priority_from_key(self, key):
+        for entry in self.stack:
+            if entry.key == key:
+                return entry.priority
+        return 0
+
     def color(self, color, fade_ms=None, priority=0, key=None):
-        """Call color on all lights in this group."""
+        """Add or update a color entry for all lights in this group.
+
+        The entry is stored once in the stack of the group. See
+        :meth:`Light.color` for the arguments.
+        """
+        if isinstance(color, str) and color == "on":
+            color = self.lights[0].config['default_on_color']
+        if not isinstance(color, RGBColor):
+            color = RGBColor(color)
+
+        if fade_ms is None:
+            fade_ms = self.default_fade_ms
+
+        # handle None to make keys sortable
+        if key is None:
+            key = ""
+        elif not isinstance(key, str):
+            raise AssertionError("Key should be string")
+
+        if priority < self._get_priority_from_key(key):
+            return
+
+        start_time = self.machine.clock.get_time()
+        if fade_ms:
+            dest_time = start_time + (fade_ms / 1000)
+        else:
+            dest_time = 0
+
+        start_color, start_colors = self._get_colors_below(priority, key)
+        self._remove_from_stack_by_key(key)
+        # the new entry replaces entries with the same key on single lights
+        for light in self.lights:
+            if light.stack:
+                light.remove_key_without_fade(key)
+        self.stack.append(LightGroupStackEntry(priority, key, start_time, start_color, dest_time, color,
+                                               start_colors))
+        if len(self.stack) > 1:
+            self.stack.sort(reverse=True)
+
+        self._schedule_update()
+
+    def on(self, fade_ms=None, priority=0, key=None, **kwargs):
+        """Turn all lights in this group on."""
+        del kwargs
+        self.color("on", fade_ms=fade_ms, priority=priority, key=key)
+
+    def off(self, fade_ms=None, priority=0, key=None, **kwargs):
+        """Turn all lights in this group off."""
+        del kwargs
+        self.color(RGBColor(), fade_ms=fade_ms, priority=priority, key=key)
+
+    def remove_from_stack_by_key(self, key, fade_ms=None):
+        """Remove an entry from the stack of the group and entries with the same key from all lights."""
+        if fade_ms is None:
+            fade_ms = self.default_fade_ms
+
+        key = str(key)
+        self._remove_group_entry(key, fade_ms)
+
+        for light in self.lights:
+            if light.stack:
+                light.remove_from_stack_by_key(key, fade_ms)
+
+    def _remove_group_entry(self, key, fade_ms):
+
+        entry = None
+        color_changes = True
+        for stack_entry in self.stack:
+            if stack_entry.key == key:
+                entry = stack_entry
+                break
+            elif stack_entry.dest_color is not None:
+                # no transparency above key
+                color_changes = False
+
+        # key not in stack
+        if not entry:
+            return
+
+        # this is already a fade out. do not fade out the fade out.
+        if entry.dest_color is None:
+            fade_ms = None
+
+        if fade_ms:
+            start_color, start_colors = self._get_colors(partial(self._get_color_of_entry, entry=entry))
+
+        self._remove_from_stack_by_key(key)
+        if fade_ms:
+            start_time = self.machine.clock.get_time()
+            self.stack.append(LightGroupStackEntry(entry.priority, key, start_time, start_color,
+                                                   start_time + fade_ms / 1000.0, None, start_colors))
+            self.delay.reset(ms=fade_ms, callback=partial(self._remove_fade_out, key=key),
+                             name="remove_fade_{}".format(key))
+            if len(self.stack) > 1:
+                self.stack.sort(reverse=True)
+
+        if color_changes:
+            self._schedule_update()
+
+    def move_entry_to_lights(self, key):
+        """Move the entry with key from the stack of the group into the stacks of all lights.
+
+        This is used when a single light in the group changes or removes key.
+        Fade outs stay in the group stack until they are done.
+        """
+        entries = [entry for entry in self.stack if entry.key == key and entry.dest_color is not None]
+        if not entries:
+            return
+
+        self.stack = [entry for entry in self.stack if entry not in entries]
         for light in self.lights:
-            light.color(color, fade_ms, priority, key)
+            for entry in entries:
+                light.stack.append(LightStackEntry(entry.priority, key, entry.start_time,
+                                                   entry.get_start_color(light.index), entry.dest_time,
+                                                   entry.dest_color))
+            if len(light.stack) > 1:
+                light.stack.sort(reverse=True)
+
+    @staticmethod
+    def _get_color_of_entry(light, entry):
+        """Return the color of the stack of light starting at entry."""
+        stack = light._get_stack()      # pylint: disable-msg=protected-access
+        stack = stack[next(i for i, stack_entry in enumerate(stack) if stack_entry is entry):]
+        return light._get_color_and_fade(stack, 0)[0]      # pylint: disable-msg=protected-access
+
+    def _remove_fade_out(self, key):
+        """Remove a timed out fade out."""
+        color_changes = True
+        for entry in self.stack:
+            if entry.key == key and entry.dest_color is None:
+                break
+            elif entry.dest_color is not None:
+                # found entry above the removed which is non-transparent
+                color_changes = False
+        else:
+            return
+
+        self.stack = [x for x in self.stack if x.key != key or x.dest_color is not None]
+        if color_changes:
+            self._schedule_update()
+
+    def _remove_from_stack_by_key(self, key):
+        if self.stack:
+            self.stack = [x for x in self.stack if x.key != key]
+
+    def clear_stack(self):
+        """Remove all entries from the stack of the group."""
+        self.stack = []
+        self._schedule_update()
+
+    def _schedule_update(self):
+        """Update all lights in this group and sync every platform once."""
+        for hw_driver, function in self._hw_driver_functions:
+            hw_driver.set_fade(function)
+
+        for platform in self._platforms:
+            platform.light_sync()
 
 
 class LightStrip(LightGroup):
@@ -1,51 +1,155 @@
 """A Power Supply Unit (PSU) in a pinball machine."""
+from collections import namedtuple
+from typing import Callable, Dict, List, Optional, Tuple
+
 from mpf.core.system_wide_device import SystemWideDevice
 
+PulseRequest = namedtuple("PulseRequest", ["priority", "sequence", "pulse_ms", "draw", "deadline", "callback"])
+
 
 class PowerSupplyUnit(SystemWideDevice):
 
-    """Represents a power supply in a pinball machine."""
+    """Represents a power supply in a pinball machine.
+
+    Every pulse draws current from the PSU until the pulse ended plus
+    release_wait_ms. Pulses of coils with psu_amps run concurrently as long
+    as their combined draw stays within max_amps. Coils without psu_amps (or
+    PSUs without max_amps) use the whole PSU so those pulses are serialised.
+
+    Pulses which cannot run right away are queued by psu_priority (higher
+    first) and then in order of arrival. They are released from one scheduler
+    callback when enough current is available or when max_wait_ms passed.
+    """
 
     config_section = 'psus'
     collection = 'psus'
     class_label = 'psu'
 
-    __slots__ = ["_busy_until"]
+    __slots__ = ["_active", "_queue", "_sequence", "_scheduler_handle"]
 
     def __init__(self, machine, name):
         """Initialise PSU."""
         super().__init__(machine, name)
-        self._busy_until = None
+        self._active = []               # type: List[Tuple[float, float]]
+        self._queue = []                # type: List[PulseRequest]
+        self._sequence = 0
+        self._scheduler_handle = None
 
-    def get_wait_time_for_pulse(self, pulse_ms, max_wait_ms) -> int:
-        """Return a wait time for a pulse or 0."""
-        current_time = self.machine.clock.get_time()
+    def _get_draw(self, amps: Optional[float]) -> float:
+        """Return the current used by a pulse. Infinite means exclusive use of the PSU."""
+        if not amps or not self.config['max_amps']:
+            return float("inf")
+        return amps
+
+    def _fits(self, active, draw) -> bool:
+        """Return true if a pulse with draw can run in addition to active pulses."""
+        if not active:
+            return True
+        if not self.config['max_amps']:
+            return False
+        return sum(active_draw for _, active_draw in active) + draw <= self.config['max_amps']
+
+    def _get_pulse_end(self, start, pulse_ms) -> float:
+        return start + (pulse_ms + self.config['release_wait_ms']) / 1000.0
 
-        if self._busy_until and self._busy_until < current_time:
-            # prevent negative times
-            self._busy_until = None
+    def schedule_pulse(self, pulse_ms: int, callback: Callable[[], None], max_wait_ms: Optional[int] = None,
+                       amps: Optional[float] = None, priority: int = 0) -> float:
+        """Run callback to pulse a coil now or when the PSU can drive it.
 
-        if not self._busy_until or not max_wait_ms:
-            # if we are not busy. do pulse now
-            self.notify_about_instant_pulse(pulse_ms)
+        Returns the expected wait time in ms (0 if the pulse ran right away).
+        Pulses without max_wait_ms and pulses which would wait longer than
+        max_wait_ms run right away.
+        """
+        current_time = self.machine.clock.get_time()
+        # release pulses which are due first to keep their order
+        self._release(current_time)
+
+        draw = self._get_draw(amps)
+        if not max_wait_ms or (self._fits(self._active, draw) and
+                               not any(request.priority >= priority for request in self._queue)):
+            self._start_pulse(current_time, pulse_ms, draw, callback)
             return 0
 
-        if self._busy_until > current_time + (max_wait_ms / 1000.0) or max_wait_ms is None:
+        self._sequence += 1
+        deadline = current_time + max_wait_ms / 1000.0
+        request = PulseRequest(priority, self._sequence, pulse_ms, draw, float("inf"), callback)
+        release_time = self._simulate_release(self._queue + [request], current_time)[request]
+        if release_time > deadline:
             # if we are busy for longer than possible. do pulse now
-            self.notify_about_instant_pulse(pulse_ms)
+            self._start_pulse(current_time, pulse_ms, draw, callback)
             return 0
-        else:
-
-            # calculate wait time and return it
-            wait_ms = (self._busy_until - current_time) * 1000
-            self._busy_until += (pulse_ms + self.config['release_wait_ms']) / 1000.0
-            return wait_ms
-
-    def notify_about_instant_pulse(self, pulse_ms):
-        """Notify PSU about pulse."""
-        if self._busy_until:
-            self._busy_until = max(
-                self._busy_until,
-                self.machine.clock.get_time() + (pulse_ms + self.config['release_wait_ms']) / 1000.0)
-        else:
-            self._busy_until = self.machine.clock.get_time() + ((pulse_ms + self.config['release_wait_ms']) / 1000.0)
+
+        self._queue.append(request._replace(deadline=deadline))
+        self._queue.sort(key=lambda x: (-x.priority, x.sequence))
+        self._reschedule()
+        return (release_time - current_time) * 1000
+
+    def notify_about_instant_pulse(self, pulse_ms: int, amps: Optional[float] = None):
+        """Notify PSU about a pulse which did not go through the scheduler."""
+        current_time = self.machine.clock.get_time()
+        self._active.append((self._get_pulse_end(current_time, pulse_ms), self._get_draw(amps)))
+
+    def _start_pulse(self, current_time, pulse_ms, draw, callback):
+        self._active.append((self._get_pulse_end(current_time, pulse_ms), draw))
+        callback()
+
+    def _get_releasable(self, active, queue, current_time):
+        """Yield queued requests which can start now.
+
+        Requests start in priority order until one does not fit. Requests which
+        reached their deadline always start.
+        """
+        blocked = False
+        active = list(active)
+        for request in list(queue):
+            if request.deadline <= current_time or (not blocked and self._fits(active, request.draw)):
+                active.append((self._get_pulse_end(current_time, request.pulse_ms), request.draw))
+                yield request
+            else:
+                blocked = True
+
+    def _simulate_release(self, queue: List[PulseRequest], current_time) -> Dict[PulseRequest, float]:
+        """Return the time when every request in queue will be released."""
+        active = list(self._active)
+        pending = sorted(queue, key=lambda x: (-x.priority, x.sequence))
+        release_times = {}
+        now = current_time
+        while True:
+            active = [pulse for pulse in active if pulse[0] > now]
+            for request in self._get_releasable(active, pending, now):
+                release_times[request] = now
+                active.append((self._get_pulse_end(now, request.pulse_ms), request.draw))
+                pending.remove(request)
+
+            if not pending:
+                return release_times
+
+            now = min([end for end, _ in active] + [request.deadline for request in pending])
+
+    def _release(self, current_time):
+        """Expire finished pulses and start queued pulses which can run now."""
+        self._active = [pulse for pulse in self._active if pulse[0] > current_time]
+        if not self._queue:
+            return
+
+        for request in self._get_releasable(self._active, self._queue, current_time):
+            self._queue.remove(request)
+            self._start_pulse(current_time, request.pulse_ms, request.draw, request.callback)
+
+        self._reschedule()
+
+    def _reschedule(self):
+        """Schedule the scheduler callback for the next pulse end or deadline."""
+        if self._scheduler_handle:
+            self._scheduler_handle.cancel()
+            self._scheduler_handle = None
+
+        if not self._queue:
+            return
+
+        next_time = min([end for end, _ in self._active] + [request.deadline for request in self._queue])
+        self._scheduler_handle = self.machine.clock.loop.call_at(next_time, self._run_scheduler)
+
+    def _run_scheduler(self):
+        self._scheduler_handle = None
+        self._release(self.machine.clock.get_time())
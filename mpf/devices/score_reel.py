@@ -137,18 +137,24 @@ class ScoreReel(SystemWideDevice):
     def _run(self):
         yield from self.machine.events.wait_for_event("init_phase_3")
         self.check_hw_switches()
-        while True:
-            # wait for either a new value or a switch change
-            switch_change_future = self.machine.switch_controller.wait_for_any_switch(
-                switch_names=[switch.name for switch in self.value_switches if switch is not None], state=2,
-                ms=self.config['hw_confirm_time'])
-            result = yield from Util.first([switch_change_future, self._busy.wait()], loop=self.machine.clock.loop)
-            if result == switch_change_future:
-                self.check_hw_switches()
-                continue
-
-            # advance the reel until we reached our destination position
-            yield from self._advance_reel_if_position_does_not_match()
+        # register the switch handlers once instead of on every wait
+        switch_watch = self.machine.switch_controller.watch_any_switch(
+            switch_names=[switch.name for switch in self.value_switches if switch is not None], state=2,
+            ms=self.config['hw_confirm_time'])
+        try:
+            while True:
+                # wait for either a new value or a switch change
+                switch_change_future = switch_watch.wait()
+                result = yield from Util.first([switch_change_future, self._busy.wait()],
+                                               loop=self.machine.clock.loop)
+                if result == switch_change_future:
+                    self.check_hw_switches()
+                    continue
+
+                # advance the reel until we reached our destination position
+                yield from self._advance_reel_if_position_does_not_match()
+        finally:
+            switch_watch.close()
 
     @asyncio.coroutine
     def _advance_reel_if_position_does_not_match(self):
@@ -28,7 +28,7 @@ class Shot(EnableDisableMixin, ModeDevice):
     to track shots.
     """
 
-    __slots__ = ["delay", "active_sequences", "active_delays", "running_show", "_handlers"]
+    __slots__ = ["delay", "active_sequences", "active_delays", "running_show", "_handlers", "_state_listeners"]
 
     def __init__(self, machine, name):
         """Initialise shot."""
@@ -43,6 +43,21 @@ class Shot(EnableDisableMixin, ModeDevice):
         self.active_delays = set()
         self.running_show = None
         self._handlers = []
+        self._state_listeners = []
+
+    def add_state_listener(self, callback):
+        """Call callback(shot) whenever the state name of this shot may have changed."""
+        if callback not in self._state_listeners:
+            self._state_listeners.append(callback)
+
+    def remove_state_listener(self, callback):
+        """Remove a state listener."""
+        if callback in self._state_listeners:
+            self._state_listeners.remove(callback)
+
+    def _notify_state_listeners(self):
+        for callback in self._state_listeners:
+            callback(self)
 
     def device_loaded_in_mode(self, mode: Mode, player: Player):
         """Add device to a mode that was already started.
@@ -52,6 +67,7 @@ class Shot(EnableDisableMixin, ModeDevice):
         since the mode started after that.
         """
         super().device_loaded_in_mode(mode, player)
+        self._notify_state_listeners()
         self._update_show()
 
     @asyncio.coroutine
@@ -155,6 +171,7 @@ class Shot(EnableDisableMixin, ModeDevice):
 
     def _set_state(self, state):
         self.player["shot_{}".format(self.name)] = state
+        self._notify_state_listeners()
 
     def _get_profile_settings(self):
         state = self._get_state()
@@ -214,6 +231,7 @@ class Shot(EnableDisableMixin, ModeDevice):
         Destroys it and removes it from the shots collection.
         """
         super().device_removed_from_mode(mode)
+        self._notify_state_listeners()
         self._remove_switch_handlers()
         if self.running_show:
             self.running_show.stop()
@@ -1,6 +1,7 @@
 """Contains the ShotGroup base class."""
 
 from collections import deque
+from typing import Dict
 
 from mpf.core.device_monitor import DeviceMonitor
 
@@ -11,6 +12,10 @@ from mpf.core.player import Player
 from mpf.core.system_wide_device import SystemWideDevice
 from mpf.core.utility_functions import Util
 
+MYPY = False
+if MYPY:   # pragma: no cover
+    from mpf.devices.shot import Shot
+
 
 @DeviceMonitor("common_state")
 class ShotGroup(ModeDevice):
@@ -27,7 +32,7 @@ class ShotGroup(ModeDevice):
     collection = 'shot_groups'
     class_label = 'shot_group'
 
-    __slots__ = ["rotation_enabled", "profile", "rotation_pattern"]
+    __slots__ = ["rotation_enabled", "profile", "rotation_pattern", "_shot_states", "_state_counts"]
 
     def __init__(self, machine, name):
         """Initialise shot group."""
@@ -36,6 +41,8 @@ class ShotGroup(ModeDevice):
         self.rotation_enabled = None
         self.profile = None
         self.rotation_pattern = None
+        self._shot_states = {}      # type: Dict[Shot, str]
+        self._state_counts = {}     # type: Dict[str, int]
 
     def add_control_events_in_mode(self, mode) -> None:
         """Remove enable here."""
@@ -44,6 +51,11 @@ class ShotGroup(ModeDevice):
     def device_loaded_in_mode(self, mode: Mode, player: Player):
         """Add device in mode."""
         super().device_loaded_in_mode(mode, player)
+        self._shot_states = {}
+        self._state_counts = {}
+        for shot in self.config['shots']:
+            shot.add_state_listener(self._shot_state_changed)
+            self._shot_state_changed(shot)
         self._check_for_complete()
         self.profile = self.config['shots'][0].profile
         self.rotation_pattern = deque(self.profile.config['rotation_pattern'])
@@ -55,6 +67,24 @@ class ShotGroup(ModeDevice):
         """Disable device when mode stops."""
         super().device_removed_from_mode(mode)
         self.machine.events.remove_handler(self._hit)
+        for shot in self.config['shots']:
+            shot.remove_state_listener(self._shot_state_changed)
+        self._shot_states = {}
+        self._state_counts = {}
+
+    def _shot_state_changed(self, shot):
+        """Update the per-state member counts for one shot."""
+        state = shot.state_name
+        old_state = self._shot_states.get(shot)
+        if old_state == state:
+            return
+
+        self._shot_states[shot] = state
+        self._state_counts[state] = self._state_counts.get(state, 0) + 1
+        if old_state is not None:
+            self._state_counts[old_state] -= 1
+            if not self._state_counts[old_state]:
+                del self._state_counts[old_state]
 
     @property
     def common_state(self):
@@ -62,13 +92,19 @@ class ShotGroup(ModeDevice):
 
         Will return None otherwise.
         """
-        state = self.config['shots'][0].state_name
-        for shot in self.config['shots']:
-            if state != shot.state_name:
-                # shots do not have a common state
-                return None
+        if not self._shot_states:
+            # not active in a mode. compare the shots directly
+            state = self.config['shots'][0].state_name
+            for shot in self.config['shots']:
+                if state != shot.state_name:
+                    return None
+            return state
+
+        if len(self._state_counts) != 1:
+            # shots do not have a common state
+            return None
 
-        return state
+        return next(iter(self._state_counts))
 
     def _check_for_complete(self):
         """Check if all shots in this group are in the same state."""
@@ -212,11 +248,8 @@ class ShotGroup(ModeDevice):
 
             return
 
-        # shot_state_list is deque of tuples (state num, show step num)
-        shot_state_list = deque()
-
-        for shot in self.config['shots']:
-            shot_state_list.append(shot.state)
+        # shot_state_list is deque of state numbers
+        shot_state_list = deque(shot.state for shot in self.config['shots'])
 
         # figure out which direction we're going to rotate
         if not direction:
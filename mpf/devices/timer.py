@@ -11,7 +11,7 @@ from mpf.core.mode import Mode
 MYPY = False
 if MYPY:   # pragma: no cover
     from mpf.core.machine import MachineController
-    from mpf.core.clock import PeriodicTask
+    from mpf.core.clock import SharedIntervalTask
     from mpf.core.events import EventHandlerKey
 
 
@@ -47,7 +47,7 @@ class Timer(ModeDevice):
         self.max_value = None               # type: int
         self.ticks_remaining = None         # type: int
         self.direction = None               # type: str
-        self.timer = None                   # type: PeriodicTask
+        self.timer = None                   # type: SharedIntervalTask
         self.event_keys = list()            # type: List[EventHandlerKey]
         self.delay = None                   # type: DelayManager
 
@@ -171,8 +171,8 @@ class Timer(ModeDevice):
     def _remove_control_events(self):
         self.debug_log("Removing control events")
 
-        for key in self.event_keys:
-            self.machine.events.remove_handler_by_key(key)
+        self.machine.events.remove_handlers_by_keys(self.event_keys)
+        self.event_keys = list()
 
     def reset(self, **kwargs):
         """Reset this timer based to the starting value that's already been configured.
@@ -494,9 +494,12 @@ class Timer(ModeDevice):
 
     def _create_system_timer(self):
         # Creates the clock event which drives this mode timer's tick method.
+        # Timers with the same interval which started in phase share one tick
+        # and send their monitor updates together.
         self._remove_system_timer()
-        self.timer = self.machine.clock.schedule_interval(self._timer_tick,
-                                                          self.tick_secs)
+        self.timer = self.machine.clock.schedule_shared_interval(self._timer_tick,
+                                                                 self.tick_secs,
+                                                                 self.machine.device_manager.batch_device_changes)
 
     def _remove_system_timer(self):
         # Removes the clock event associated with this mode timer.
@@ -99,6 +99,20 @@ class V4Migrator(VersionMigrator):
         cls.log.debug("Detected display '%s' (%sx%s)", name, w, h)
         cls.displays[name] = (w, h)
 
+    @classmethod
+    def get_shared_state(cls):
+        """Return displays and slide numbers."""
+        return dict(slides=dict(cls.slides), displays=dict(cls.displays),
+                    default_display=cls.default_display, color_dmd=cls.color_dmd)
+
+    @classmethod
+    def set_shared_state(cls, state):
+        """Restore displays and slide numbers."""
+        V4Migrator.slides = dict(state['slides'])
+        V4Migrator.displays = dict(state['displays'])
+        V4Migrator.default_display = state['default_display']
+        V4Migrator.color_dmd = state['color_dmd']
+
     def _do_custom(self):
         self._set_dmd_type()
         self._migrate_window()
@@ -1198,3 +1212,13 @@ class V4Migrator(VersionMigrator):
 def migrate_file(file_name, file_content):
     """Migrate file."""
     return V4Migrator(file_name, file_content).migrate()
+
+
+def get_shared_state():
+    """Return state which other files depend on."""
+    return V4Migrator.get_shared_state()
+
+
+def set_shared_state(state):
+    """Set state which other files depend on."""
+    V4Migrator.set_shared_state(state)
@@ -1,11 +1,13 @@
 """Migrates YAML configuration files for MPF from one version to another."""
 
 import os
+import re
 import shutil
 import time
 import datetime
 import logging
 import importlib
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 
 from ruamel import yaml
@@ -13,7 +15,6 @@ from ruamel.yaml.comments import CommentedSeq, CommentedMap
 
 from mpf.file_interfaces.yaml_roundtrip import YamlRoundtrip
 from mpf._version import version
-from mpf.core.file_manager import FileManager
 from mpf.core.utility_functions import Util
 
 EXTENSION = '.yaml'
@@ -22,17 +23,84 @@ TARGET_CONFIG_VERSION = 4  # todo change to dynamic param
 REPROCESS_CURRENT_VERSION = False
 INDENTATION_SPACES = 4
 
+# config_version=x or show_version=x in the header of a file
+VERSION_HEADER = re.compile(r'^#\s*(config|show)_version\s*=\s*(\d+)')
+# top level sections which change state shared between files (displays and slide names)
+SHARED_STATE_SECTIONS = re.compile(r'^(window|dmd|displays|slide_player)\s*:', re.MULTILINE | re.IGNORECASE)
+
+
+class _LogCollector(logging.Handler):
+
+    """Collects log records of a worker so the parent can log them in order."""
+
+    def __init__(self):
+        """Initialise empty collector."""
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        """Store record."""
+        self.records.append((record.name, record.levelno, record.getMessage()))
+
+
+def migrate_and_save(migrator, file_name):
+    """Load, migrate and save one file.
+
+    Returns "config" or "show" if the file changed (or None) and the time it took.
+    """
+    start = time.perf_counter()
+    file_content = YamlRoundtrip().load(file_name)
+    migrated_content = migrator.migrate_file(file_name, file_content)
+    file_type = None
+    if migrated_content:
+        file_type = "config" if isinstance(file_content, CommentedMap) else "show"
+        logging.getLogger('Migrator').info("Writing file: %s", file_name)
+        # save to temp file and move afterwards. prevents broken files
+        temp_file = os.path.join(os.path.dirname(file_name), "_" + os.path.basename(file_name))
+        YamlRoundtrip().save(temp_file, migrated_content)
+        os.replace(temp_file, file_name)
+
+    return file_type, time.perf_counter() - start
+
+
+def _migrate_in_worker(args):
+    """Migrate one file in a worker process and return its result and log records."""
+    migrator_name, shared_state, file_name = args
+    migrator = importlib.import_module(migrator_name)
+    migrator.set_shared_state(shared_state)
+
+    root_logger = logging.getLogger()
+    old_handlers, old_level = root_logger.handlers, root_logger.level
+    collector = _LogCollector()
+    root_logger.handlers = [collector]
+    root_logger.setLevel(logging.DEBUG)
+    try:
+        file_type, seconds = migrate_and_save(migrator, file_name)
+    finally:
+        root_logger.handlers = old_handlers
+        root_logger.setLevel(old_level)
+
+    return file_type, seconds, collector.records
+
 
 class Migrator:
 
     """Migrates a config."""
 
-    def __init__(self, mpf_path, machine_path):
-        """Initialise migrator."""
+    def __init__(self, mpf_path, machine_path, jobs=1):
+        """Initialise migrator.
+
+        Args:
+            mpf_path: Path of MPF.
+            machine_path: Path of the machine folder to migrate.
+            jobs: Number of processes which migrate files. 1 migrates all
+                files in this process.
+        """
         self.log = logging.getLogger('Migrator')
         self.start_time = time.time()
         self.num_config_files = 0
         self.num_show_files = 0
+        self.num_skipped_files = 0
         self.log.info("MPF Migrator: %s", version)
         self.log.info("Migrating config and show files from: %s",
                       machine_path)
@@ -47,15 +115,14 @@ class Migrator:
         self.log.info("New config version will be v%s",
                       self.target_config_version)
 
-        self.migrator = importlib.import_module(
-            'mpf.migrator.config_version_{}'.format(TARGET_CONFIG_VERSION))
+        self.migrator = importlib.import_module('mpf.migrator.config_version_{}'.format(TARGET_CONFIG_VERSION))
 
         self.log.debug("Found Migrator for config files v%s",
                        TARGET_CONFIG_VERSION)
 
         self.build_file_list()
         self.backup_files()
-        self.migrate_files()
+        self.migrate_files(jobs)
 
     def build_file_list(self):
         """Build file list for machine."""
@@ -66,6 +133,8 @@ class Migrator:
                     self.log.debug("Found file: %s", os.path.join(root, file))
                     self.file_list.append(os.path.join(root, file))
 
+        # sort to get the same output (e.g. slide names) on every run
+        self.file_list.sort()
         self.base_folder = (os.path.commonprefix(self.file_list))
         self.log.debug("Detected base folder: %s", self.base_folder)
 
@@ -105,42 +174,100 @@ class Migrator:
 
         return return_list
 
-    def migrate_files(self):
-        """Migrate files in machine."""
-        # We need to migrate show files after config files since we need
-        # to pull some things out of the configs for the shows.
-        round2_files = list()
+    def _get_header_version(self, file_name, file_data):
+        """Return the config or show version from the header of a file or None if it has none."""
+        for line in file_data.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if not line.startswith('#'):
+                break
+            match = VERSION_HEADER.match(line)
+            if match:
+                return int(match.group(2))
+
+        self.log.debug("No version in header of %s", file_name)
+        return None
+
+    def _needs_migration(self, file_name, file_data):
+        """Check the raw file if it can contain anything to migrate."""
+        file_version = self._get_header_version(file_name, file_data)
+        if file_version is None:
+            # configs without version are ignored. old shows have no version but tocks
+            return 'tocks' in file_data
+
+        if file_version > self.target_config_version:
+            self.log.warning("MPF version mismatch. File %s is version %s, but this version of MPF is for "
+                             "version %s. Skipping...", file_name, file_version, self.target_config_version)
+            return False
+
+        return file_version < self.target_config_version or REPROCESS_CURRENT_VERSION
+
+    def _add_result(self, file_name, file_type, seconds):
+        if file_type == "config":
+            self.num_config_files += 1
+        elif file_type == "show":
+            self.num_show_files += 1
+        else:
+            self.num_skipped_files += 1
+        self.log.info("%s %s in %.3fs", "Migrated" if file_type else "Checked", file_name, seconds)
+
+    def migrate_files(self, jobs=1):
+        """Migrate files in machine.
+
+        Files which already have the target version in their header are
+        skipped without parsing them. Files which define displays or slides
+        change state which other files (e.g. shows) use. They are migrated
+        first and in order. All other files are independent and are migrated
+        in parallel by jobs processes with the state of the first step.
+        """
+        ordered_files = list()
+        parallel_files = list()
 
         for file in self.file_list:
-            file_content = FileManager.load(file)
-
-            if isinstance(file_content, CommentedMap):
-                migrated_content = self.migrator.migrate_file(file,
-                                                              file_content)
-                if migrated_content:
-                    self.num_config_files += 1
-                    self.save_file(file, migrated_content)
+            with open(file, encoding='utf8') as f:
+                file_data = f.read()
+
+            if not self._needs_migration(file, file_data):
+                self.log.debug("Skipping %s which needs no migration", file)
+                self.num_skipped_files += 1
+            elif SHARED_STATE_SECTIONS.search(file_data):
+                ordered_files.append(file)
             else:
-                round2_files.append(file)
+                parallel_files.append(file)
 
-        for file in round2_files:
-            file_content = FileManager.load(file)
-            migrated_content = self.migrator.migrate_file(file, file_content)
-            if migrated_content:
-                self.num_show_files += 1
-                self.save_file(file, migrated_content)
+        for file in ordered_files:
+            self._add_result(file, *migrate_and_save(self.migrator, file))
+
+        if jobs <= 1 or len(parallel_files) < 2:
+            for file in parallel_files:
+                self._add_result(file, *migrate_and_save(self.migrator, file))
+        else:
+            self._migrate_in_processes(parallel_files, jobs)
 
         self.log.info("DONE! Migrated %s config file(s) and %s show file(s) in"
-                      " %ss", self.num_config_files, self.num_show_files,
-                      round(time.time() - self.start_time, 2))
+                      " %ss. %s file(s) needed no changes.", self.num_config_files, self.num_show_files,
+                      round(time.time() - self.start_time, 2), self.num_skipped_files)
         self.log.info("Detailed log file is in %s.", os.path.join(
             self.machine_path, 'logs'))
         self.log.info("Original YAML files are in %s", self.backup_folder)
 
+    def _migrate_in_processes(self, files, jobs):
+        """Migrate independent files in a pool of jobs processes."""
+        shared_state = self.migrator.get_shared_state()
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # map returns results in order of the files
+            results = executor.map(_migrate_in_worker,
+                                   [(self.migrator.__name__, shared_state, file) for file in files])
+            for file, (file_type, seconds, records) in zip(files, results):
+                for name, level, message in records:
+                    logging.getLogger(name).log(level, message)
+                self._add_result(file, file_type, seconds)
+
     def save_file(self, file_name, file_contents):
         """Save file."""
         self.log.info("Writing file: %s", file_name)
-        FileManager.save(file_name, file_contents)
+        YamlRoundtrip().save(file_name, file_contents)
 
 
 class VersionMigrator:
@@ -225,6 +352,16 @@ class VersionMigrator:
 
         cls.initialized = True
 
+    @classmethod
+    def get_shared_state(cls):
+        """Return state which files of a machine share (e.g. displays) so worker processes can use it."""
+        return dict()
+
+    @classmethod
+    def set_shared_state(cls, state):
+        """Restore state from get_shared_state in a worker process."""
+        del state
+
     def migrate(self):
         """Migrate configs and shows."""
         if isinstance(self.fc, CommentedMap):
@@ -1,8 +1,10 @@
 """I2C servo controller platform."""
 import asyncio
 import logging
+from typing import Dict
 
 from mpf.exceptions.ConfigFileError import ConfigFileError
+from mpf.platforms.interfaces.i2c_platform_interface import I2cPlatformInterface
 from mpf.platforms.interfaces.servo_platform_interface import ServoPlatformInterface
 
 from mpf.core.platform import ServoPlatform
@@ -10,7 +12,15 @@ from mpf.core.platform import ServoPlatform
 
 class I2CServoControllerHardwarePlatform(ServoPlatform):
 
-    """Supports the PCA9685/PCA9635 chip via I2C."""
+    """Supports the PCA9685/PCA9635 chip via I2C.
+
+    Servo moves are collected per controller and written at the end of the
+    loop iteration. Moves of neighbouring servos are combined into one
+    auto-increment block write.
+    """
+
+    # four registers per servo and at most 32 bytes per SMBus block write
+    MAX_SERVOS_PER_BLOCK = 8
 
     def __init__(self, machine):
         """Initialise I2C servo platform."""
@@ -21,6 +31,8 @@ class I2CServoControllerHardwarePlatform(ServoPlatform):
         self.platform = None
         self.i2c_devices = {}
         self.features['tickless'] = True
+        self._pending_values = {}   # type: Dict[I2cPlatformInterface, Dict[int, int]]
+        self._flush_handle = None
 
     def __repr__(self):
         """Return string representation."""
@@ -48,11 +60,11 @@ class I2CServoControllerHardwarePlatform(ServoPlatform):
         self.i2c_devices[address] = i2c_device
 
         # initialise PCA9685/PCA9635
-        i2c_device.i2c_write8(0x00, 0x11)  # set sleep
+        i2c_device.i2c_write8(0x00, 0x31)  # set sleep + auto increment
         i2c_device.i2c_write8(0x01, 0x04)  # configure output
         i2c_device.i2c_write8(0xFE, 130)   # set approx 50Hz
         yield from asyncio.sleep(.01, loop=self.machine.clock.loop)     # needed according to datasheet to sync PLL
-        i2c_device.i2c_write8(0x00, 0x01)  # no more sleep
+        i2c_device.i2c_write8(0x00, 0x21)  # no more sleep + auto increment
         yield from asyncio.sleep(.01, loop=self.machine.clock.loop)     # needed to end sleep according to datasheet
         return i2c_device
 
@@ -77,23 +89,54 @@ class I2CServoControllerHardwarePlatform(ServoPlatform):
             raise ConfigFileError("Invalid number {} in {}. The controller only supports servos 0 to 15.".format(
                 number_int, number), 1, self.log.name)
 
-        return I2cServo(number_int, self.config, i2c_device)
+        return I2cServo(number_int, self.config, i2c_device, self)
+
+    def set_servo_value(self, i2c_device, number, value):
+        """Queue a new value for a servo. It will be written at the end of the loop iteration."""
+        self._pending_values.setdefault(i2c_device, {})[number] = value
+        if not self._flush_handle:
+            self._flush_handle = self.machine.clock.loop.call_soon(self._flush)
+
+    def _flush(self):
+        """Write all pending servo values with one block write per run of neighbouring servos."""
+        self._flush_handle = None
+        pending_values = self._pending_values
+        self._pending_values = {}
+        for i2c_device, values in pending_values.items():
+            run = []
+            for number in sorted(values):
+                if run and (number != run[-1] + 1 or len(run) >= self.MAX_SERVOS_PER_BLOCK):
+                    self._write_servos(i2c_device, run, values)
+                    run = []
+                run.append(number)
+            self._write_servos(i2c_device, run, values)
+
+    @staticmethod
+    def _write_servos(i2c_device, numbers, values):
+        """Write ON and OFF registers of consecutive servos."""
+        data = []
+        for number in numbers:
+            data.extend((0, 0, values[number] & 0xFF, values[number] >> 8))
+        i2c_device.i2c_write_block(0x06 + numbers[0] * 4, data)
 
     def stop(self):
         """Stop platform."""
-        pass
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
 
 
 class I2cServo(ServoPlatformInterface):
 
     """A servo hw device."""
 
-    def __init__(self, number, config, i2c_device):
+    def __init__(self, number, config, i2c_device, platform):
         """Initialise I2C hw servo."""
         self.log = logging.getLogger('I2cServo')
         self.number = number
         self.config = config
         self.i2c_device = i2c_device
+        self.platform = platform
 
     def go_to_position(self, position):
         """Move servo to position.
@@ -112,11 +155,8 @@ class I2cServo(ServoPlatformInterface):
         servo_max = self.config['servo_max']
         value = int(servo_min + position * (servo_max - servo_min))
 
-        # set servo via i2c
-        self.i2c_device.i2c_write8(0x06 + self.number * 4, 0)
-        self.i2c_device.i2c_write8(0x07 + self.number * 4, 0)
-        self.i2c_device.i2c_write8(0x08 + self.number * 4, value & 0xFF)
-        self.i2c_device.i2c_write8(0x09 + self.number * 4, value >> 8)
+        # set servo via i2c at the end of this loop iteration
+        self.platform.set_servo_value(self.i2c_device, self.number, value)
 
     @classmethod
     def set_speed_limit(cls, speed_limit):
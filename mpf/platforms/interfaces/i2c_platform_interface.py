@@ -24,6 +24,20 @@ class I2cPlatformInterface(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    def i2c_write_block(self, register, data):
+        """Write a block of 8-bit values to consecutive registers via I2C.
+
+        The device has to auto-increment its register pointer. Platforms which
+        support block writes should overwrite this. The default writes one byte
+        after another.
+
+        Args:
+            register (int): First register
+            data (list[int]): Values to write
+        """
+        for offset, value in enumerate(data):
+            self.i2c_write8(register + offset, value)
+
     @abc.abstractmethod
     @asyncio.coroutine
     def i2c_read_block(self, register, count):
@@ -39,6 +39,15 @@ class StepperPlatformInterface(metaclass=abc.ABCMeta):
         """Move axis to a certain relative position."""
         raise NotImplementedError
 
+    def move_step_train(self, steps, high_time, low_time) -> asyncio.Future:
+        """Generate a train of steps and return a future which is done after the last step.
+
+        The sign of steps sets the direction. high_time and low_time are the
+        durations of both parts of a step in seconds. Only platforms which
+        drive the step input of a stepper driver implement this.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def move_vel_mode(self, velocity):
         """Move at a specific velocity (pos = clockwise, neg = counterclockwise)."""
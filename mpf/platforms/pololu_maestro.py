@@ -2,7 +2,8 @@
 import math
 import asyncio
 import logging
-import serial
+from typing import Dict
+
 from mpf.platforms.interfaces.servo_platform_interface import ServoPlatformInterface
 
 from mpf.core.platform import ServoPlatform
@@ -10,9 +11,14 @@ from mpf.core.platform import ServoPlatform
 
 class PololuMaestroHardwarePlatform(ServoPlatform):
 
-    """Supports the Pololu Maestro servo controllers via PySerial.
+    """Supports the Pololu Maestro servo controllers via asyncio serial.
 
     Works with Micro Maestro 6, and Mini Maestro 12, 18, and 24.
+
+    Targets are collected during a loop iteration and only the latest target
+    per channel is sent. On the Mini Maestro set multiple_targets to True to
+    combine targets of neighbouring channels into one "Set Multiple Targets"
+    command. The Micro Maestro does not support that command.
     """
 
     def __init__(self, machine):
@@ -22,7 +28,11 @@ class PololuMaestroHardwarePlatform(ServoPlatform):
         self.log.debug("Configuring template hardware interface.")
         self.config = self.machine.config['pololu_maestro']
         self.platform = None
-        self.serial = None
+        self.reader = None      # type: asyncio.StreamReader
+        self.writer = None      # type: asyncio.StreamWriter
+        self.cmd_header = bytes([0xaa, 0xc])
+        self._pending_targets = {}  # type: Dict[int, int]
+        self._flush_handle = None
         self.features['tickless'] = True
 
     def __repr__(self):
@@ -37,11 +47,66 @@ class PololuMaestroHardwarePlatform(ServoPlatform):
         # validate our config (has to be in intialize since config_processor
         # is not read in __init__)
         self.config = self.machine.config_validator.validate_config("pololu_maestro", self.config)
-        self.serial = serial.Serial(self.config['port'])
+        connector = self.machine.clock.open_serial_connection(url=self.config['port'], baudrate=self.config['baud'])
+        self.reader, self.writer = yield from connector
 
     def stop(self):
         """Close serial."""
-        self.serial.close()
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+
+    def send_command(self, command, number, value):
+        """Send a command with a 14 bit value for one channel.
+
+        Pending targets are sent first to keep the order of commands.
+        """
+        self._flush_targets()
+        self._write(bytes([command, number, value & 0x7f, (value >> 7) & 0x7f]))
+
+    def set_target(self, number, value):
+        """Set the target of a channel at the end of the current loop iteration."""
+        self._pending_targets[number] = value
+        if not self._flush_handle:
+            self._flush_handle = self.machine.clock.loop.call_soon(self._flush_targets)
+
+    def _flush_targets(self):
+        """Send all pending targets."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending_targets:
+            return
+
+        pending_targets = self._pending_targets
+        self._pending_targets = {}
+        run = []
+        for number in sorted(pending_targets):
+            if run and (number != run[-1] + 1 or not self.config['multiple_targets']):
+                self._write_targets(run, pending_targets)
+                run = []
+            run.append(number)
+        self._write_targets(run, pending_targets)
+
+    def _write_targets(self, numbers, targets):
+        """Send Set Target for one channel or Set Multiple Targets for consecutive channels."""
+        if len(numbers) == 1:
+            cmd = bytes([0x04, numbers[0]])
+        else:
+            cmd = bytes([0x1f, len(numbers), numbers[0]])
+        for number in numbers:
+            cmd += bytes([targets[number] & 0x7f, (targets[number] >> 7) & 0x7f])
+        self._write(cmd)
+
+    def _write(self, cmd):
+        # Send Pololu intro, device number and the command
+        cmd = self.cmd_header + cmd
+        if self.config['debug']:
+            self.log.debug("Sending cmd: %s", "".join(" 0x%02x" % b for b in cmd))
+        self.writer.write(cmd)
 
     @asyncio.coroutine
     def configure_servo(self, number: str):
@@ -50,20 +115,19 @@ class PololuMaestroHardwarePlatform(ServoPlatform):
         Args:
             config (dict): Configuration of device
         """
-        return PololuServo(int(number), self.config, self.serial)
+        return PololuServo(int(number), self.config, self)
 
 
 class PololuServo(ServoPlatformInterface):
 
     """A servo on the pololu servo controller."""
 
-    def __init__(self, number, config, serial_port):
+    def __init__(self, number, config, platform):
         """Initialise Pololu servo."""
         self.log = logging.getLogger('PololuServo')
         self.number = number
         self.config = config
-        self.serial = serial_port
-        self.cmd_header = bytes([0xaa, 0xc])
+        self.platform = platform
 
     def go_to_position(self, position):
         """Set channel to a specified target value.
@@ -93,14 +157,8 @@ class PololuServo(ServoPlatformInterface):
         if 0 < self.config['servo_max'] < value:
             value = self.config['servo_max']
 
-        lsb = value & 0x7f  # 7 bits for least significant byte
-        msb = (value >> 7) & 0x7f  # shift 7 and take next 7 bits for msb
-        # Send Pololu intro, device number, command, channel, and target
-        # lsb/msb
-        cmd = self.cmd_header + bytes([0x04, self.number, lsb, msb])
-        if self.config['debug']:
-            self.log.debug("Sending cmd: %s", "".join(" 0x%02x" % b for b in cmd))
-        self.serial.write(cmd)
+        # only the latest target in this loop iteration will be sent
+        self.platform.set_target(self.number, value)
 
     def set_speed_limit(self, speed_limit):
         """Set the speed of the channel.
@@ -125,10 +183,7 @@ class PololuServo(ServoPlatformInterface):
             max_pos_change_per_second = speed_limit * self.config['servo_max']  # change normalized values for maestro
             maestro_speed_limit = int(max_pos_change_per_second / 1000 / 0.25)
 
-        lsb = maestro_speed_limit & 0x7f  # 7 bits for least significant byte
-        msb = (maestro_speed_limit >> 7) & 0x7f  # shift 7 and take next 7 bits for msb
-        cmd = self.cmd_header + bytes([0x07, self.number, lsb, msb])
-        self.serial.write(cmd)
+        self.platform.send_command(0x07, self.number, maestro_speed_limit)
 
     def set_acceleration_limit(self, acceleration_limit):
         """Set acceleration of channel.
@@ -151,10 +206,7 @@ class PololuServo(ServoPlatformInterface):
             max_limit_value = calculate_maestro_acceleration(math.sqrt(1.0 * self.config['servo_max']))
             maestro_acceleration_normalized = int(255 / max_limit_value * maestro_acceleration_limit)
 
-        lsb = maestro_acceleration_normalized & 0x7f  # 7 bits for least significant byte
-        msb = (maestro_acceleration_normalized >> 7) & 0x7f  # shift 7 and take next 7 bits for msb
-        cmd = self.cmd_header + bytes([0x09, self.number, lsb, msb])
-        self.serial.write(cmd)
+        self.platform.send_command(0x09, self.number, maestro_acceleration_normalized)
 
 
 def calculate_maestro_acceleration(normalized_limit):
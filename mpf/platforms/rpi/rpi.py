@@ -21,6 +21,9 @@ try:
 except ImportError:
     apigpio = None
 
+# pigpio command for i2c_write_i2c_block_data. apigpio has no wrapper for it
+PI_CMD_I2CWI = 68
+
 
 class RpiSwitch(SwitchPlatformInterface):
 
@@ -141,6 +144,16 @@ class RpiI2cDevice(I2cPlatformInterface):
     def _i2c_write8_async(self, register, value):
         yield from self.pi.i2c_write_byte_data(self.handle, register, value)
 
+    def i2c_write_block(self, register, data):
+        """Write a block (up to 32 bytes) to i2c in one pigpio command."""
+        self.platform.send_command(self._i2c_write_block_async(register, bytes(data)))
+
+    @asyncio.coroutine
+    def _i2c_write_block_async(self, register, data):
+        # send I2CWI through the generic command API like the i2c methods of apigpio do
+        # pylint: disable-msg=protected-access
+        yield from self.pi._pigpio_aio_command_ext(PI_CMD_I2CWI, self.handle, int(register), len(data), [data])
+
     @asyncio.coroutine
     def i2c_read8(self, register):
         """Read from i2c via pigpio."""
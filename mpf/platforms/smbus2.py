@@ -75,6 +75,11 @@ class Smbus2I2cDevice(I2cPlatformInterface):
         Util.ensure_future(self.smbus.write_byte_data(self.address, int(register), int(value)), loop=self.loop)
         # this does not return
 
+    def i2c_write_block(self, register, data):
+        """Write a block to I2C."""
+        Util.ensure_future(self.smbus.write_i2c_block_data(self.address, int(register), [int(x) for x in data]),
+                           loop=self.loop)
+
     @asyncio.coroutine
     def i2c_read_block(self, register, count):
         """Read a block from I2C."""
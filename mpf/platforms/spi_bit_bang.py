@@ -1,10 +1,24 @@
 """Bit bang SPI to read switches."""
+import abc
 import asyncio
 import logging
+import threading
+import time
 
 from mpf.platforms.interfaces.switch_platform_interface import SwitchPlatformInterface
 from mpf.core.platform import SwitchPlatform, SwitchConfig
 
+# RPi.GPIO and spidev are only needed for the threaded backends
+try:
+    import RPi.GPIO as GPIO
+except ImportError:     # pragma: no cover
+    GPIO = None
+
+try:
+    import spidev
+except ImportError:     # pragma: no cover
+    spidev = None
+
 
 class SpiBitBangSwitch(SwitchPlatformInterface):
 
@@ -15,9 +29,148 @@ class SpiBitBangSwitch(SwitchPlatformInterface):
         return "SPI Big Bang"
 
 
+class ThreadedSpiReader(metaclass=abc.ABCMeta):
+
+    """Reads whole frames in a worker thread and passes changed frames to the loop."""
+
+    def __init__(self, config, loop, callback):
+        """Initialise reader."""
+        self.config = config
+        self.loop = loop
+        self.callback = callback
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start worker thread."""
+        self._thread = threading.Thread(target=self._run, name="spi_bit_bang", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop worker thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(1)
+            self._thread = None
+
+    @abc.abstractmethod
+    def open(self):
+        """Open the hardware."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def close(self):
+        """Close the hardware."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def read_frame(self, bits) -> int:
+        """Read one frame with the first bit as MSB."""
+        raise NotImplementedError
+
+    def _run(self):
+        last_frame = None
+        try:
+            self.open()
+            while not self._stop.is_set():
+                frame = self.read_frame(self.config['inputs'])
+                if frame != last_frame:
+                    last_frame = frame
+                    self.loop.call_soon_threadsafe(self.callback, frame)
+                self._stop.wait(self.config['poll_interval'])
+        except Exception as e:     # pylint: disable-msg=broad-except
+            self.loop.call_soon_threadsafe(self._raise, e)
+        finally:
+            self.close()
+
+    @staticmethod
+    def _raise(exception):
+        raise exception
+
+
+class GpioSpiReader(ThreadedSpiReader):
+
+    """Bit bangs SPI with RPi.GPIO and precise timing in a worker thread."""
+
+    def open(self):
+        """Set up pins."""
+        GPIO.setmode(GPIO.BCM)
+        GPIO.setup(self.config['miso_gpio'], GPIO.IN)
+        GPIO.setup(self.config['clock_gpio'], GPIO.OUT, initial=GPIO.LOW)
+        GPIO.setup(self.config['cs_gpio'], GPIO.OUT, initial=GPIO.LOW)
+
+    def close(self):
+        """Release pins."""
+        GPIO.cleanup([self.config['miso_gpio'], self.config['clock_gpio'], self.config['cs_gpio']])
+
+    def read_frame(self, bits):
+        """Read frame by toggling clock and chip select."""
+        GPIO.output(self.config['cs_gpio'], GPIO.LOW)
+        time.sleep(self.config['bit_time'])
+        GPIO.output(self.config['cs_gpio'], GPIO.HIGH)
+        time.sleep(self.config['bit_time'])
+
+        read_bits = 0
+        for _ in range(bits):
+            # read in bits on clk high
+            read_bits <<= 1
+            if GPIO.input(self.config['miso_gpio']):
+                read_bits |= 0x1
+
+            GPIO.output(self.config['clock_gpio'], GPIO.HIGH)
+            time.sleep(self.config['clock_time'] / 1000)
+            GPIO.output(self.config['clock_gpio'], GPIO.LOW)
+            time.sleep(self.config['bit_time'])
+
+        GPIO.output(self.config['cs_gpio'], GPIO.LOW)
+        return read_bits
+
+
+class SpidevSpiReader(ThreadedSpiReader):
+
+    """Reads the whole chain in one transfer via the kernel SPI driver.
+
+    The bit bang backends drive chip select high while shifting and sample
+    before the rising clock edge. By default, spidev uses the same wiring
+    (mode 0 with an active high chip select). Use spi_mode and spi_cs_high for
+    chains which need something else.
+    """
+
+    def __init__(self, config, loop, callback):
+        """Initialise reader."""
+        super().__init__(config, loop, callback)
+        self.spi = None
+
+    def open(self):
+        """Open spidev device."""
+        self.spi = spidev.SpiDev()
+        self.spi.open(self.config['spi_bus'], self.config['spi_device'])
+        self.spi.max_speed_hz = self.config['spi_speed_hz']
+        self.spi.mode = self.config['spi_mode']
+        self.spi.cshigh = self.config['spi_cs_high']
+
+    def close(self):
+        """Close spidev device."""
+        if self.spi:
+            self.spi.close()
+            self.spi = None
+
+    def read_frame(self, bits):
+        """Read all bytes of the chain and strip trailing bits."""
+        num_bytes = (bits + 7) // 8
+        data = self.spi.readbytes(num_bytes)
+        return int.from_bytes(bytes(data), byteorder="big") >> (num_bytes * 8 - bits)
+
+
 class SpiBitBangPlatform(SwitchPlatform):
 
-    """Platform which reads switch via SPI using bit banging."""
+    """Platform which reads switch via SPI using bit banging.
+
+    The event_loop backend toggles digital outputs from the event loop. The
+    gpio_thread backend bit bangs RPi GPIOs in a worker thread and the spidev
+    backend reads the chain with one kernel SPI transfer. All backends pass
+    frames to the platform which only reports changed inputs.
+    """
 
     def configure_switch(self, number: str, config: SwitchConfig, platform_config: dict) -> "SwitchPlatformInterface":
         """Configure switch."""
@@ -38,6 +191,8 @@ class SpiBitBangPlatform(SwitchPlatform):
         self.log = logging.getLogger('SPI Bit Bang')
         self.log.debug("Configuring SPI Bit Bang.")
         self._read_task = None
+        self._reader = None
+        self._frame = 0
         self.config = {}
         self._switch_states = {}
 
@@ -58,8 +213,32 @@ class SpiBitBangPlatform(SwitchPlatform):
         self.config = self.machine.config_validator.validate_config("spi_bit_bang",
                                                                     self.machine.config.get('spi_bit_bang', {}))
 
-        self._read_task = self.machine.clock.loop.create_task(self._run())
-        self._read_task.add_done_callback(self._done)
+        if self.config['backend'] == "gpio_thread":
+            if not GPIO:
+                raise AssertionError("To use the gpio_thread backend you need to install RPi.GPIO.")
+            if None in (self.config['miso_gpio'], self.config['clock_gpio'], self.config['cs_gpio']):
+                raise AssertionError("The gpio_thread backend needs miso_gpio, clock_gpio and cs_gpio.")
+            self._reader = GpioSpiReader(self.config, self.machine.clock.loop, self.process_frame)
+            self._reader.start()
+        elif self.config['backend'] == "spidev":
+            if not spidev:
+                raise AssertionError("To use the spidev backend you need to install spidev.")
+            self._reader = SpidevSpiReader(self.config, self.machine.clock.loop, self.process_frame)
+            self._reader.start()
+        else:
+            if None in (self.config['miso_pin'], self.config['clock_pin'], self.config['cs_pin']):
+                raise AssertionError("The event_loop backend needs miso_pin, clock_pin and cs_pin.")
+            self._read_task = self.machine.clock.loop.create_task(self._run())
+            self._read_task.add_done_callback(self._done)
+
+    def stop(self):
+        """Stop reading."""
+        if self._read_task:
+            self._read_task.cancel()
+            self._read_task = None
+        if self._reader:
+            self._reader.stop()
+            self._reader = None
 
     @staticmethod
     def _done(future):
@@ -90,12 +269,20 @@ class SpiBitBangPlatform(SwitchPlatform):
         self._disable_chip_select()
         return read_bits
 
+    def process_frame(self, frame):
+        """Report all inputs which changed since the last frame."""
+        changed = frame ^ self._frame
+        self._frame = frame
+        while changed:
+            bit = changed & -changed
+            changed ^= bit
+            num = str(bit.bit_length() - 1)
+            if num in self._switch_states:
+                self._switch_states[num] = bool(frame & bit)
+                self.machine.switch_controller.process_switch_by_num(num, self._switch_states[num], self)
+
     @asyncio.coroutine
     def _run(self):
         while True:
             inputs = yield from self.read_spi(self.config['inputs'])
-            for i in range(self.config['inputs']):
-                num = str(i)
-                if num in self._switch_states and self._switch_states[num] != bool(inputs & (1 << i)):
-                    self._switch_states[num] = bool(inputs & (1 << i))
-                    self.machine.switch_controller.process_switch_by_num(str(i), bool(inputs & (1 << i)), self)
+            self.process_frame(inputs)
@@ -1,15 +1,105 @@
 """StepStick or similar stepper driver connected to a digital output."""
+import abc
 import asyncio
-from typing import Optional
+from typing import Callable, Optional
 
 import logging
 
 from mpf.devices.digital_output import DigitalOutput
 
 from mpf.core.platform import StepperPlatform
+from mpf.platforms.interfaces.driver_platform_interface import PulseSettings, HoldSettings
 from mpf.platforms.interfaces.stepper_platform_interface import StepperPlatformInterface
 
 
+class StepTrain(metaclass=abc.ABCMeta):
+
+    """A train of step pulses which is generated by a timing backend.
+
+    Steps are counted on the rising edge. A train with steps set to None runs
+    until it is cancelled. The future is done after the last step or when
+    the train got cancelled.
+    """
+
+    __slots__ = ["loop", "enable", "disable", "steps", "high_time", "low_time", "future", "steps_done"]
+
+    # pylint: disable-msg=too-many-arguments
+    def __init__(self, loop, enable: Callable[[], None], disable: Callable[[], None], steps: Optional[int],
+                 high_time: float, low_time: float) -> None:
+        """Initialise step train."""
+        self.loop = loop
+        self.enable = enable
+        self.disable = disable
+        self.steps = steps
+        self.high_time = high_time
+        self.low_time = low_time
+        self.future = asyncio.Future(loop=loop)
+        self.steps_done = 0
+
+    @abc.abstractmethod
+    def start(self):
+        """Start generating steps."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def cancel(self):
+        """Stop generating steps after the current step."""
+        raise NotImplementedError
+
+    def _finished(self):
+        if not self.future.done():
+            self.future.set_result(self.steps_done)
+
+
+class LoopStepTrain(StepTrain):
+
+    """Generates steps with loop callbacks at absolute deadlines.
+
+    Edges are scheduled relative to the start of the train instead of the
+    previous edge so late callbacks do not add up. If the loop falls behind
+    by more than one edge the schedule restarts at the current time instead
+    of sending a burst of short steps. Outputs are not thread-safe and
+    cannot run a pulse train on their own so every edge is one callback.
+    """
+
+    __slots__ = ["_handle", "_next_edge"]
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialise step train."""
+        super().__init__(*args, **kwargs)
+        self._handle = None
+        self._next_edge = None
+
+    def start(self):
+        """Schedule the first step."""
+        self._next_edge = self.loop.time()
+        self._rising_edge()
+
+    def _schedule(self, callback, duration):
+        self._next_edge = max(self._next_edge + duration, self.loop.time())
+        self._handle = self.loop.call_at(self._next_edge, callback)
+
+    def _rising_edge(self):
+        if self.steps is not None and self.steps_done >= self.steps:
+            self._handle = None
+            self._finished()
+            return
+        self.enable()
+        self.steps_done += 1
+        self._schedule(self._falling_edge, self.high_time)
+
+    def _falling_edge(self):
+        self.disable()
+        self._schedule(self._rising_edge, self.low_time)
+
+    def cancel(self):
+        """Cancel the next edge."""
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+        self._finished()
+
+
 class DigitalOutputStepStickStepper(StepperPlatformInterface):
 
     """Stepper on a digital output driven by a StepStick."""
@@ -19,9 +109,7 @@ class DigitalOutputStepStickStepper(StepperPlatformInterface):
         """Initialize stepper."""
         self.platform = platform
         self.number = number
-        self._move_complete = asyncio.Event(loop=self.platform.machine.clock.loop)
-        self._move_complete.set()
-        self._move_task = None
+        self._step_train = None     # type: Optional[StepTrain]
         self.config = config
         self.direction_output = direction_output    # type: DigitalOutput
         self.step_output = step_output              # type: DigitalOutput
@@ -30,74 +118,66 @@ class DigitalOutputStepStickStepper(StepperPlatformInterface):
         if self.enable_output:
             self.enable_output.enable()
 
-    @staticmethod
-    def _done(future):
-        try:
-            future.result()
-        except asyncio.CancelledError:
-            pass
+    def _step_enable(self):
+        # call the hardware directly to skip the state handling of the digital output
+        self.step_output.hw_driver.enable(PulseSettings(power=1.0, duration=0), HoldSettings(power=1.0))
 
-    def move_rel_pos(self, position):
-        """Move a number of steps in one direction."""
-        if self._move_task and not self._move_task.done():
-            raise AssertionError("Last move has not been completed. Calls stop first.")
-        self._move_complete.clear()
-        self._move_task = self.platform.machine.clock.loop.create_task(self._move_pos(position))
-        self._move_task.add_done_callback(self._done)
+    def _step_disable(self):
+        self.step_output.hw_driver.disable()
 
-    @asyncio.coroutine
-    def _move_pos(self, steps):
-        if steps > 0:
+    def _start_step_train(self, clockwise, steps, high_time, low_time) -> asyncio.Future:
+        if clockwise:
             self.direction_output.enable()
         else:
             self.direction_output.disable()
-        for _ in range(int(abs(steps))):
-            self.step_output.enable()
-            yield from asyncio.sleep(self.config['high_time'], loop=self.platform.machine.clock.loop)
-            self.step_output.disable()
-            yield from asyncio.sleep(self.config['low_time'], loop=self.platform.machine.clock.loop)
 
-        self._move_complete.set()
+        if self.step_output.type == "driver":
+            enable, disable = self._step_enable, self._step_disable
+        else:
+            enable, disable = self.step_output.enable, self.step_output.disable
+
+        self._step_train = LoopStepTrain(self.platform.machine.clock.loop, enable, disable,
+                                         steps, high_time, low_time)
+        self._step_train.start()
+        return self._step_train.future
+
+    def move_step_train(self, steps, high_time, low_time) -> asyncio.Future:
+        """Generate steps in the timing backend."""
+        if self._step_train and not self._step_train.future.done():
+            raise AssertionError("Last move has not been completed. Calls stop first.")
+        return self._start_step_train(steps > 0, int(abs(steps)), high_time, low_time)
+
+    def move_rel_pos(self, position):
+        """Move a number of steps in one direction."""
+        self.move_step_train(position, self.config['high_time'], self.config['low_time'])
 
     def move_vel_mode(self, velocity):
         """Move at a certain speed."""
         if velocity == 0:
             self.stop()
         else:
-            if self._move_task and not self._move_task.done():
-                self._move_task.cancel()
-            self._move_complete.clear()
-            self._move_task = self.platform.machine.clock.loop.create_task(self._move_rel(velocity))
-            self._move_task.add_done_callback(self._done)
-
-    @asyncio.coroutine
-    def _move_rel(self, velocity):
-        if velocity > 0:
-            self.direction_output.enable()
-        else:
-            self.direction_output.disable()
-        while True:
-            self.step_output.enable()
-            yield from asyncio.sleep(self.config['high_time'] * abs(velocity), loop=self.platform.machine.clock.loop)
-            self.step_output.disable()
-            yield from asyncio.sleep(self.config['low_time'] * abs(velocity), loop=self.platform.machine.clock.loop)
-        # this will never complete. you need to call stop
+            if self._step_train:
+                self._step_train.cancel()
+            # this will never complete. you need to call stop
+            self._start_step_train(velocity > 0, None, self.config['high_time'] * abs(velocity),
+                                   self.config['low_time'] * abs(velocity))
 
     def stop(self):
         """Stop movements."""
-        if self._move_task:
-            self._move_task.cancel()
-            self._move_task = None
+        if self._step_train:
+            self._step_train.cancel()
+            self._step_train = None
         self.step_output.disable()
-        self._move_complete.set()
 
     def home(self, direction):
         """Not implemented."""
         self.platform.raise_config_error("Please use homing_mode switch", 5, context=self.number)
 
+    @asyncio.coroutine
     def wait_for_move_completed(self):
-        """Wait for move complete."""
-        return self._move_complete.wait()
+        """Wait for the step train to complete."""
+        if self._step_train:
+            yield from asyncio.shield(self._step_train.future, loop=self.platform.machine.clock.loop)
 
 
 class StepStickDigitalOutputPlatform(StepperPlatform):
@@ -118,11 +198,11 @@ class StepStickDigitalOutputPlatform(StepperPlatform):
         """Configure a stepper driven by StepStick on a digital output."""
         try:
             direction_output_str, step_output_str, enable_output_str = number.split(":")
-        except IndexError:
+        except ValueError:
             enable_output_str = False
             try:
                 direction_output_str, step_output_str = number.split(":")
-            except IndexError:
+            except ValueError:
                 return self.raise_config_error("Number for step_stick steppers needs to be "
                                                "direction_output:step_output or "
                                                "direction_output:step_output:enable_output but is {}".format(number),
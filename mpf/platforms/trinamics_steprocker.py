@@ -1,18 +1,188 @@
 """Trinamics StepRocker controller platform."""
 import asyncio
 import logging
+from collections import deque
+
+from typing import Dict, List
 
 from mpf.platforms.trinamics import TMCL
 
-from mpf.platforms.trinamics.TMCL import TMCLDevice
 from mpf.platforms.interfaces.stepper_platform_interface import StepperPlatformInterface
 
 from mpf.core.platform import StepperPlatform
 
 
+class TrinamicsTMCLCommunicator:
+
+    """Non-blocking TMCL transport via asyncio serial.
+
+    Every TMCL request is answered by exactly one 9 byte reply from the
+    addressed module in order. Requests are written without waiting for
+    previous replies and replies are matched to requests with a FIFO per
+    module address.
+
+    Requests without a reply within timeout fail with a TMCLError. Replies
+    only carry the command number so a late reply could be taken for a later
+    request with the same command (e.g. the two GAP requests of a poll cycle).
+    Therefore, a timeout fails all outstanding requests of that module and
+    new requests to it are held back until no reply arrived for one timeout
+    period. Replies with a wrong checksum are skipped byte by byte until the
+    stream is in sync again.
+    """
+
+    __slots__ = ["machine", "log", "debug", "timeout", "reader", "writer", "read_task", "_pending",
+                 "_resyncing", "_last_receive", "_resync_handles"]
+
+    def __init__(self, machine, log, debug=False, timeout=.1) -> None:
+        """Initialise communicator."""
+        self.machine = machine
+        self.log = log
+        self.debug = debug
+        self.timeout = timeout
+        self.reader = None      # type: asyncio.StreamReader
+        self.writer = None      # type: asyncio.StreamWriter
+        self.read_task = None   # type: asyncio.Task
+        self._pending = {}      # type: Dict[int, deque]
+        self._resyncing = {}    # type: Dict[int, List]
+        self._last_receive = {}     # type: Dict[int, float]
+        self._resync_handles = {}   # type: Dict[int, asyncio.TimerHandle]
+
+    @asyncio.coroutine
+    def connect(self, port, baud):
+        """Connect to serial and start the read loop."""
+        self.log.info("Connecting to %s at %sbps", port, baud)
+        connector = self.machine.clock.open_serial_connection(url=port, baudrate=baud)
+        self.reader, self.writer = yield from connector
+        self.read_task = self.machine.clock.loop.create_task(self._read_loop())
+        self.read_task.add_done_callback(self._done)
+
+    @staticmethod
+    def _done(future):
+        """Raise exceptions from the read loop."""
+        try:
+            future.result()
+        except asyncio.CancelledError:
+            pass
+
+    def stop(self):
+        """Stop read loop and close serial."""
+        if self.read_task:
+            self.read_task.cancel()
+            self.read_task = None
+        for pending in self._pending.values():
+            for _, _, timeout_handle in pending:
+                timeout_handle.cancel()
+        self._pending = {}
+        for resync_handle in self._resync_handles.values():
+            resync_handle.cancel()
+        self._resync_handles = {}
+        self._resyncing = {}
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+
+    # pylint: disable-msg=too-many-arguments
+    def send(self, command: int, cmd_type: int, motor: int, value: int, address: int = 1) -> asyncio.Future:
+        """Send a request and return a future for the value of the reply."""
+        request = bytes(map(ord, TMCL.encodeRequestCommand(address, command, cmd_type, motor, value)))
+        future = asyncio.Future(loop=self.machine.clock.loop)
+        if address in self._resyncing:
+            # wait until late replies of the module stopped
+            self._resyncing[address].append((request, command, address, future))
+        else:
+            self._write(request, command, address, future)
+        return future
+
+    def _write(self, request, command, address, future):
+        if self.debug:
+            self.log.debug("Sending %s", "".join("\\x%02x" % b for b in request))
+        timeout_handle = self.machine.clock.loop.call_later(self.timeout, self._timeout, address, command, future)
+        self._pending.setdefault(address, deque()).append((command, future, timeout_handle))
+        self.writer.write(request)
+
+    def _timeout(self, address, command, future):
+        """Fail all outstanding requests of a module when one of them did not get a reply in time."""
+        for pending_command, pending_future, timeout_handle in self._pending.pop(address, []):
+            timeout_handle.cancel()
+            if pending_future.done():
+                continue
+            if pending_future is future:
+                error = "{}: no reply within {}s".format(TMCL.COMMAND_NUMBERS.get(command, command), self.timeout)
+            else:
+                error = "{}: aborted after timeout of {}".format(
+                    TMCL.COMMAND_NUMBERS.get(pending_command, pending_command),
+                    TMCL.COMMAND_NUMBERS.get(command, command))
+            pending_future.set_exception(TMCL.TMCLError(error))
+
+        if address not in self._resyncing:
+            self.log.warning("Reply timeout for module %s. Waiting for the line to become quiet.", address)
+            self._resyncing[address] = []
+            self._last_receive[address] = self.machine.clock.loop.time()
+            self._resync_handles[address] = self.machine.clock.loop.call_later(
+                self.timeout, self._check_resync, address)
+
+    def _check_resync(self, address):
+        """Send held requests once no reply arrived from the module for one timeout period."""
+        quiet = self.machine.clock.loop.time() - self._last_receive[address]
+        if quiet < self.timeout:
+            self._resync_handles[address] = self.machine.clock.loop.call_later(
+                self.timeout - quiet, self._check_resync, address)
+            return
+
+        del self._resync_handles[address]
+        for request in self._resyncing.pop(address):
+            self._write(*request)
+
+    @asyncio.coroutine
+    def _read_frame(self):
+        """Read one reply with a valid checksum."""
+        frame = yield from self.reader.readexactly(9)
+        skipped = 0
+        while frame[8] != sum(frame[:8]) % (1 << 8):
+            # a byte got lost or corrupted. move on by one byte until the checksum matches again
+            frame = frame[1:] + (yield from self.reader.readexactly(1))
+            skipped += 1
+        if skipped:
+            self.log.warning("Checksum error in reply. Skipped %s bytes to resync.", skipped)
+        return frame
+
+    @asyncio.coroutine
+    def _read_loop(self):
+        while True:
+            data = yield from self._read_frame()
+            reply = TMCL.decodeReplyCommand(data)
+            if self.debug:
+                self.log.debug("Received %s", reply)
+            if reply['module-address'] in self._resyncing:
+                # drop late replies of requests which already failed
+                self._last_receive[reply['module-address']] = self.machine.clock.loop.time()
+                self.log.debug("Dropped reply during resync: %s", reply)
+                continue
+
+            pending = self._pending.get(reply['module-address'])
+            if not pending or pending[0][0] != reply['command-number']:
+                self.log.warning("Received unexpected reply: %s", reply)
+                continue
+
+            command, future, timeout_handle = pending.popleft()
+            timeout_handle.cancel()
+            if future.done():
+                continue
+            if reply['status'] != TMCL.STAT_OK:
+                future.set_exception(TMCL.TMCLError("{}: got status {}".format(
+                    TMCL.COMMAND_NUMBERS.get(command, command),
+                    TMCL.STATUSCODES.get(reply['status'], reply['status']))))
+            else:
+                value = reply['value']
+                # values are signed 32 bit
+                if value >= 1 << 31:
+                    value -= 1 << 32
+                future.set_result(value)
+
+
 class TrinamicsStepRocker(StepperPlatform):
 
-    """Supports the Trinamics Step Rocker via PySerial.
+    """Supports the Trinamics Step Rocker via asyncio serial.
 
     Works with Trinamics Step Rocker.  TBD other 'TMCL' based steppers eval boards
     """
@@ -25,7 +195,9 @@ class TrinamicsStepRocker(StepperPlatform):
         self.config = self.machine.config['trinamics_steprocker']
         self.platform = None
         self.features['tickless'] = True
-        self.TMCL = None
+        self.communicator = None    # type: TrinamicsTMCLCommunicator
+        self._waiting_steppers = {}     # type: Dict[TrinamicsTMCLStepper, List[asyncio.Future]]
+        self._poll_task = None
 
     def __repr__(self):
         """Return string representation."""
@@ -39,11 +211,69 @@ class TrinamicsStepRocker(StepperPlatform):
         # validate our config (has to be in intialize since config_processor
         # is not read in __init__)
         self.config = self.machine.config_validator.validate_config("trinamics_steprocker", self.config)
-        self.TMCL = TMCLDevice(self.config['port'], False)
+        self.communicator = TrinamicsTMCLCommunicator(self.machine, self.log, self.config['debug'],
+                                                      self.config['reply_timeout'])
+        yield from self.communicator.connect(self.config['port'], self.config['baud'])
 
     def stop(self):
-        """Close serial."""
-        self.TMCL.stop()
+        """Stop polling and close serial."""
+        if self._poll_task:
+            self._poll_task.cancel()
+            self._poll_task = None
+        if self.communicator:
+            self.communicator.stop()
+
+    def send_command(self, command: str, cmd_type: int, motor: int, value: int = 0) -> asyncio.Future:
+        """Send a TMCL command and return a future for the reply value."""
+        return self.communicator.send(TMCL.NUMBER_COMMANDS[command], cmd_type, motor, value)
+
+    def execute_command(self, command: str, cmd_type: int, motor: int, value: int = 0) -> None:
+        """Send a TMCL command without waiting for the reply.
+
+        Errors are raised in the loop exception handler when the reply arrives.
+        """
+        self.send_command(command, cmd_type, motor, value).add_done_callback(self._check_command_result)
+
+    @staticmethod
+    def _check_command_result(future):
+        future.result()
+
+    def wait_for_move_completed(self, stepper: "TrinamicsTMCLStepper") -> asyncio.Future:
+        """Return a future which is done when the poll cycle found the move of stepper completed."""
+        future = asyncio.Future(loop=self.machine.clock.loop)
+        self._waiting_steppers.setdefault(stepper, []).append(future)
+        if not self._poll_task:
+            self._poll_task = self.machine.clock.loop.create_task(self._poll())
+            self._poll_task.add_done_callback(self._poll_done)
+        return future
+
+    def _poll_done(self, future):
+        self._poll_task = None
+        try:
+            future.result()
+        except asyncio.CancelledError:
+            pass
+
+    @asyncio.coroutine
+    def _poll(self):
+        """Poll all steppers which wait for a move in one batch per cycle."""
+        while self._waiting_steppers:
+            steppers = list(self._waiting_steppers.keys())
+            # all requests of this cycle are written before the first reply is read
+            results = yield from asyncio.gather(*[stepper.poll_status() for stepper in steppers],
+                                                loop=self.machine.clock.loop)
+            for stepper, complete in zip(steppers, results):
+                if not complete:
+                    continue
+                for future in self._waiting_steppers.pop(stepper, []):
+                    if not future.done():
+                        future.set_result(True)
+
+            if not self._waiting_steppers:
+                break
+
+            poll_ms = min(stepper.config['poll_ms'] for stepper in self._waiting_steppers)
+            yield from asyncio.sleep(poll_ms / 1000, loop=self.machine.clock.loop)
 
     def configure_stepper(self, number: str, config: dict) -> "TrinamicsTMCLStepper":
         """Configure a smart stepper device in platform.
@@ -51,7 +281,7 @@ class TrinamicsStepRocker(StepperPlatform):
         Args:
             config (dict): Configuration of device
         """
-        return TrinamicsTMCLStepper(number, config, self.TMCL, self.machine)
+        return TrinamicsTMCLStepper(number, config, self, self.machine)
 
     @classmethod
     def get_stepper_config_section(cls):
@@ -64,7 +294,7 @@ class TrinamicsTMCLStepper(StepperPlatformInterface):
 
     """A stepper on a TMCL based controller such as Trinamics StepRocker."""
 
-    def __init__(self, number, config, tmcl_device, machine):
+    def __init__(self, number, config, platform, machine):
         """Initialise stepper."""
         self._pulse_div = 5     # tbd add to config
         self._ramp_div = 9      # tbd add to config
@@ -72,7 +302,7 @@ class TrinamicsTMCLStepper(StepperPlatformInterface):
         self.config = config
         self.log = logging.getLogger('TMCL Stepper')
         self._mn = int(number)
-        self.TMCL = tmcl_device
+        self.platform = platform    # type: TrinamicsStepRocker
         self._move_current = int(2.55 * self.config['move_current'])    # percent to 0...255(100%)
         self._hold_current = int(2.55 * self.config['hold_current'])    # percent to 0...255(100%)
         self._microstep_per_fullstep = self.config['microstep_per_fullstep']
@@ -81,68 +311,84 @@ class TrinamicsTMCLStepper(StepperPlatformInterface):
         self._acceleration_limit = self._uu_to_accel_cmd(self.config['acceleration_limit'])
         self.machine = machine
         self._homing_speed = self._uu_to_velocity_cmd(self.config['homing_speed'])
+        self._position = 0          # in microsteps. updated by the poll cycle
+        self._move_complete = True  # updated by the poll cycle
 
         self._set_important_parameters(self._velocity_limit, self._acceleration_limit,
                                        self._move_current, self._hold_current,
                                        self._get_micro_step_mode(self._microstep_per_fullstep), False)
         # apply pulse and ramp divisors as well
-        self.TMCL.sap(self._mn, 154, self._pulse_div)
-        self.TMCL.sap(self._mn, 153, self._ramp_div)
+        self._sap(154, self._pulse_div)
+        self._sap(153, self._ramp_div)
         self._homingActive = False
 
     # Public Stepper Platform Interface
     def home(self, direction):
         """Home an axis, resetting 0 position."""
-        self.TMCL.rfs(self._mn, 'STOP')  # in case in progress
+        self.platform.execute_command('RFS', TMCL.CMD_RFS_TYPES['STOP'], self._mn)  # in case in progress
         self._set_home_parameters(direction)
-        self.TMCL.rfs(self._mn, 'START')
+        self.platform.execute_command('RFS', TMCL.CMD_RFS_TYPES['START'], self._mn)
         self._homingActive = True
+        self._move_complete = False
 
     def move_abs_pos(self, position):
         """Move axis to a certain absolute position."""
         microstep_pos = self._uu_to_microsteps(position)
-        self.TMCL.mvp(self._mn, "ABS", microstep_pos)
+        self._mvp('ABS', microstep_pos)
 
     def move_rel_pos(self, position):
         """Move axis to a relative position."""
         microstep_rel = self._uu_to_microsteps(position)
-        self.TMCL.mvp(self._mn, "REL", microstep_rel)
+        self._mvp('REL', microstep_rel)
 
     def move_vel_mode(self, velocity):
         """Move at a specific velocity and direction (pos = clockwise, neg = counterclockwise)."""
         self._rotate(velocity)
 
     def current_position(self):
-        """Return current position."""
-        microsteps = self.TMCL.gap(self._mn, 1)
-        return self._microsteps_to_uu(microsteps)
+        """Return the position of the last poll cycle."""
+        return self._microsteps_to_uu(self._position)
 
     def stop(self) -> None:
         """Stop stepper."""
-        self.TMCL.mst(self._mn)
+        self.platform.execute_command('MST', 0, self._mn)
 
     @asyncio.coroutine
     def wait_for_move_completed(self):
-        """Wait until move completed."""
-        while not self.is_move_complete():
-            yield from asyncio.sleep(1 / self.config['poll_ms'], loop=self.machine.clock.loop)
+        """Wait until the poll cycle of the platform reports the move as completed."""
+        yield from self.platform.wait_for_move_completed(self)
 
     def is_move_complete(self) -> bool:
-        """Return true if move is complete."""
+        """Return true if move was complete in the last poll cycle."""
+        return self._move_complete
+
+    @asyncio.coroutine
+    def poll_status(self):
+        """Query move status and position and return true if the move is complete.
+
+        Both requests are sent before waiting for the first reply.
+        """
         if self._homingActive:
-            ret = self.TMCL.rfs(self._mn, 'STATUS')
-            if ret != 0:  # This is reversed from manual but is how it works
+            status_future = self.platform.send_command('RFS', TMCL.CMD_RFS_TYPES['STATUS'], self._mn)
+        else:
+            status_future = self.platform.send_command('GAP', 8, self._mn)
+        position_future = self.platform.send_command('GAP', 1, self._mn)
+
+        status = yield from status_future
+        self._position = yield from position_future
+
+        if self._homingActive:
+            if status != 0:  # This is reversed from manual but is how it works
+                self._move_complete = False
                 return False
 
             self._homingActive = False
+            self._move_complete = True
             return True
 
         # check normal move status
-        ret = self.TMCL.gap(self._mn, 8)
-        if ret == 1:
-            return True
-
-        return False
+        self._move_complete = status == 1
+        return self._move_complete
 
     # Private Utility Functions
     @staticmethod
@@ -189,63 +435,62 @@ class TrinamicsTMCLStepper(StepperPlatformInterface):
         microsteps_per_sec = user_unit * self._fullstep_per_userunit * self._microstep_per_fullstep
         return self._to_acceleration_cmd(microsteps_per_sec)
 
-    def _get_globals(self):
-        ret = {}
-        for key, value in TMCL.GLOBAL_PARAMETER.iteritems():
-            bank, par, name, _, _ = key + value
-            ret[name] = self.TMCL.ggp(bank, par)
-        return ret
-
-    def _get_parameters(self):
-        retmotor = [{}, {}, {}]
-        retsingle = {}
-        for mn in range(3):
-            for key, value in TMCL.AXIS_PARAMETER.iteritems():
-                par, name, _, _ = (key,) + value
-                if par not in TMCL.SINGLE_AXIS_PARAMETERS:
-                    retmotor[mn][name] = self.TMCL.gap(mn, par)
-                elif mn == 0:
-                    retsingle[name] = self.TMCL.gap(mn, par)
-        return retmotor, retsingle
-
     # pylint: disable-msg=too-many-arguments
     def _set_important_parameters(self, maxspeed=2000, maxaccel=2000,
                                   maxcurrent=72, standbycurrent=32,
                                   microstep_resolution=1, store=False):
-        self.TMCL.sap(self._mn, 140, int(microstep_resolution))
-        self.TMCL.sap(self._mn, 4, int(maxspeed))
-        self.TMCL.sap(self._mn, 5, int(maxaccel))
-        self.TMCL.sap(self._mn, 6, int(maxcurrent))
-        self.TMCL.sap(self._mn, 7, int(standbycurrent))
+        self._sap(140, int(microstep_resolution))
+        self._sap(4, int(maxspeed))
+        self._sap(5, int(maxaccel))
+        self._sap(6, int(maxcurrent))
+        self._sap(7, int(standbycurrent))
         if not bool(store):
             return
-        self.TMCL.stap(self._mn, 140)
-        self.TMCL.stap(self._mn, 4)
-        self.TMCL.stap(self._mn, 5)
-        self.TMCL.stap(self._mn, 6)
-        self.TMCL.stap(self._mn, 7)
+        self._stap(140)
+        self._stap(4)
+        self._stap(5)
+        self._stap(6)
+        self._stap(7)
+
+    def _sap(self, parameter_number, value):
+        name, ranges, _ = TMCL.AXIS_PARAMETER[parameter_number]
+        value = int(value)
+        for low, high in ranges:
+            if not low <= value < high:
+                raise TMCL.TMCLError("SAP: parameter {} needs range({}, {})".format(name, low, high))
+        self.platform.execute_command('SAP', parameter_number, self._mn, value)
+
+    def _stap(self, parameter_number):
+        self.platform.execute_command('STAP', parameter_number, self._mn)
+
+    def _mvp(self, cmdtype, value):
+        value = int(value)
+        if cmdtype == 'ABS' and not -2 ** 23 <= value <= 2 ** 23:
+            raise TMCL.TMCLError("MVP: ABS: value not in range(-2**23,2**23)")
+        self._move_complete = False
+        self.platform.execute_command('MVP', TMCL.CMD_MVP_TYPES[cmdtype], self._mn, value)
 
     def _set_home_parameters(self, direction):
-        # self.TMCL.sap(self._mn, 9,  ) #ref. switch status
-        # self.TMCL.sap(self._mn, 10, ) #right limit switch status
-        # self.TMCL.sap(self._mn, 11, ) #left limit switch status
-        # self.TMCL.sap(self._mn, 12, ) #right limit switch disable
-        # self.TMCL.sap(self._mn, 13, ) #left limit switch disable
-        # self.TMCL.sap(self._mn, 141, ) #ref. switch tolerance
-        # self.TMCL.sap(self._mn, 149, ) #soft stop flag
-        self.TMCL.sap(self._mn, 194, self._homing_speed)    # referencing search speed
+        # self._sap(9,  ) #ref. switch status
+        # self._sap(10, ) #right limit switch status
+        # self._sap(11, ) #left limit switch status
+        # self._sap(12, ) #right limit switch disable
+        # self._sap(13, ) #left limit switch disable
+        # self._sap(141, ) #ref. switch tolerance
+        # self._sap(149, ) #soft stop flag
+        self._sap(194, self._homing_speed)    # referencing search speed
         if direction == 'clockwise':
-            self.TMCL.sap(self._mn, 193, 8)     # ref. search mode
+            self._sap(193, 8)     # ref. search mode
         elif direction == 'counterclockwise':
-            self.TMCL.sap(self._mn, 193, 7)
-        # self.TMCL.sap(self._mn, 195, ) #referencing switch speed
-        # self.TMCL.sap(self._mn, 196, ) # distance end switches
+            self._sap(193, 7)
+        # self._sap(195, ) #referencing switch speed
+        # self._sap(196, ) # distance end switches
 
     def _rotate(self, velocity):
         if velocity == 0:
-            self.TMCL.mst(self._mn)     # motor stop
+            self.platform.execute_command('MST', 0, self._mn)     # motor stop
         if velocity > 0:
-            self.TMCL.ror(self._mn, self._uu_to_velocity_cmd(velocity))
+            self.platform.execute_command('ROR', 0, self._mn, self._uu_to_velocity_cmd(velocity))
         else:
-            self.TMCL.rol(self._mn, self._uu_to_velocity_cmd(abs(velocity)))
+            self.platform.execute_command('ROL', 0, self._mn, self._uu_to_velocity_cmd(abs(velocity)))
         return velocity
@@ -275,6 +275,11 @@ class VirtualI2cDevice(I2cPlatformInterface):
         """Write data."""
         self.data[int(register)] = value
 
+    def i2c_write_block(self, register, data):
+        """Write data block."""
+        for offset, value in enumerate(data):
+            self.data[int(register) + offset] = value
+
     @asyncio.coroutine
     def i2c_read_block(self, register, count):
         """Read data block."""
@@ -1,6 +1,7 @@
 """VPX platform."""
 import asyncio
-from typing import Callable, Tuple, Dict
+from collections import OrderedDict
+from typing import Callable, Tuple, Dict, Set, List
 
 import logging
 
@@ -32,12 +33,13 @@ class VirtualPinballLight(LightPlatformInterface):
 
     """A light in VPX."""
 
-    def __init__(self, number, subtype, hw_number):
+    def __init__(self, number, subtype, hw_number, dirty_lights):
         """Initialise LED."""
         super().__init__(number)
         self.color_and_fade_callback = None
         self.subtype = subtype
         self.hw_number = hw_number
+        self._dirty_lights = dirty_lights
 
     @property
     def current_brightness(self) -> float:
@@ -50,6 +52,16 @@ class VirtualPinballLight(LightPlatformInterface):
     def set_fade(self, color_and_fade_callback: Callable[[int], Tuple[float, int]]):
         """Store CB function."""
         self.color_and_fade_callback = color_and_fade_callback
+        self._dirty_lights.add(self)
+
+    def get_state_and_fading(self) -> Tuple[bool, bool]:
+        """Return the current on/off state and if the light is still fading."""
+        if not self.color_and_fade_callback:
+            return False, False
+
+        brightness, fade_ms = self.color_and_fade_callback(0)
+        # fade_ms is -1 unless there is a fade in progress
+        return bool(brightness > 0.5), fade_ms >= 0
 
     def get_board_name(self):
         """Return the name of the board of this light."""
@@ -60,11 +72,12 @@ class VirtualPinballDriver(DriverPlatformInterface):
 
     """A driver in VPX."""
 
-    def __init__(self, config, number, clock):
+    def __init__(self, config, number, clock, dirty_drivers):
         """Initialise virtual driver to disabled."""
         super().__init__(config, number)
         self.clock = clock
         self._state = False
+        self._dirty_drivers = dirty_drivers
 
     def get_board_name(self):
         """Return the name of the board of this driver."""
@@ -73,15 +86,18 @@ class VirtualPinballDriver(DriverPlatformInterface):
     def disable(self):
         """Disable virtual coil."""
         self._state = False
+        self._dirty_drivers.add(self)
 
     def enable(self, pulse_settings: PulseSettings, hold_settings: HoldSettings):
         """Enable virtual coil."""
         del pulse_settings, hold_settings
         self._state = True
+        self._dirty_drivers.add(self)
 
     def pulse(self, pulse_settings: PulseSettings):
         """Pulse virtual coil."""
         self._state = self.clock.get_time() + (pulse_settings.duration / 1000.0)
+        self._dirty_drivers.add(self)
 
     @property
     def state(self) -> bool:
@@ -91,6 +107,11 @@ class VirtualPinballDriver(DriverPlatformInterface):
         else:
             return bool(self.clock.get_time() < self._state)
 
+    @property
+    def is_pulsing(self) -> bool:
+        """Return true if the driver is in a pulse which has not ended yet."""
+        return not isinstance(self._state, bool) and self.clock.get_time() < self._state
+
 
 class VirtualPinballPlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
 
@@ -104,6 +125,18 @@ class VirtualPinballPlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
         self._drivers = {}      # type: Dict[str, VirtualPinballDriver]
         self._last_drivers = {} # type: Dict[str, bool]
         self._last_lights = {}  # type: Dict[str, bool]
+        # drivers and lights add themselves here when their state may have changed
+        self._dirty_drivers = set()     # type: Set[VirtualPinballDriver]
+        self._dirty_lights = set()      # type: Set[VirtualPinballLight]
+        # change log per type. number -> (sequence, state) ordered by sequence
+        self._sequence = 0
+        self._changes = {
+            "solenoids": OrderedDict(),
+            "lamps": OrderedDict(),
+            "gi": OrderedDict(),
+            "switches": OrderedDict(),
+        }   # type: Dict[str, OrderedDict]
+        self._polled_sequence = {"solenoids": 0, "lamps": 0, "gi": 0}   # type: Dict[str, int]
         self._started = asyncio.Event(loop=self.machine.clock.loop)
         self.log = logging.getLogger("VPX Platform")
         self.log.debug("Configuring VPX hardware interface.")
@@ -155,43 +188,93 @@ class VirtualPinballPlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
 
     def vpx_set_switch(self, number, value):
         """Update switch from VPX."""
-        self._switches[str(number)].state = value
+        switch = self._switches[str(number)]
+        if bool(switch.state) != bool(value):
+            self._add_change("switches", int(number), bool(value))
+        switch.state = value
         self.machine.switch_controller.process_switch_by_num(state=1 if value else 0,
                                                              num=str(number),
                                                              platform=self)
         return True
 
+    def _add_change(self, change_type, number, state):
+        """Append a change to the log of its type."""
+        self._sequence += 1
+        changes = self._changes[change_type]
+        changes.pop(number, None)
+        changes[number] = (self._sequence, state)
+
+    def _update_changes(self):
+        """Log state changes of all dirty drivers and lights.
+
+        Only drivers and lights which changed since the last update are
+        checked. Pulsed drivers and fading lights stay dirty until they
+        settled.
+        """
+        dirty_drivers = list(self._dirty_drivers)
+        self._dirty_drivers.clear()
+        for driver in dirty_drivers:
+            state = driver.state
+            if state != self._last_drivers[driver.number]:
+                self._last_drivers[driver.number] = state
+                self._add_change("solenoids", int(driver.number), state)
+            if driver.is_pulsing:
+                self._dirty_drivers.add(driver)
+
+        dirty_lights = list(self._dirty_lights)
+        self._dirty_lights.clear()
+        for light in dirty_lights:
+            state, fading = light.get_state_and_fading()
+            if state != self._last_lights[light.number]:
+                self._last_lights[light.number] = state
+                self._add_change("gi" if light.subtype == "gi" else "lamps", int(light.hw_number), state)
+            if fading:
+                self._dirty_lights.add(light)
+
+    def _get_changes_since(self, change_type, sequence) -> List[Tuple[int, bool]]:
+        """Return all changes of a type which happened after sequence."""
+        log = self._changes[change_type]
+        changes = []
+        for number in reversed(log):
+            change_sequence, state = log[number]
+            if change_sequence <= sequence:
+                break
+            changes.append((number, state))
+
+        changes.reverse()
+        return changes
+
+    def _get_changes_since_last_poll(self, change_type):
+        """Return changes of a type since last call."""
+        self._update_changes()
+        changes = self._get_changes_since(change_type, self._polled_sequence[change_type])
+        self._polled_sequence[change_type] = self._sequence
+        return changes
+
     def vpx_changed_solenoids(self):
         """Return changed solenoids since last call."""
-        changed_drivers = []
-        for number, driver in self._drivers.items():
-            if driver.state != self._last_drivers[number]:
-                changed_drivers.append((int(number), driver.state))
-                self._last_drivers[number] = driver.state
-
-        return changed_drivers
-
-    def _get_changed_lights_by_subtype(self, subtype):
-        """Return changed lights since last call."""
-        changed_lamps = []
-        for number, light in self._lights.items():
-            if light.subtype != subtype:
-                continue
-            brightness = light.current_brightness
-            state = bool(brightness > 0.5)
-            if state != self._last_lights[number]:
-                changed_lamps.append((int(light.hw_number), state))
-                self._last_lights[number] = state
-
-        return changed_lamps
+        return self._get_changes_since_last_poll("solenoids")
 
     def vpx_changed_lamps(self):
         """Return changed lamps since last call."""
-        return self._get_changed_lights_by_subtype("matrix")
+        return self._get_changes_since_last_poll("lamps")
 
     def vpx_changed_gi_strings(self):
         """Return changed lamps since last call."""
-        return self._get_changed_lights_by_subtype("gi")
+        return self._get_changes_since_last_poll("gi")
+
+    def vpx_changes(self, sequence=0):
+        """Return all solenoids, lamps, GI strings and switches which changed after sequence.
+
+        Pass the returned sequence on the next call to get only new changes.
+        Does not affect the changed_* calls.
+        """
+        self._update_changes()
+        sequence = int(sequence)
+        result = {"sequence": self._sequence}
+        for change_type in self._changes:
+            result[change_type] = self._get_changes_since(change_type, sequence)
+        return result
 
     def vpx_mech(self, number):
         """Not implemented."""
@@ -218,7 +301,7 @@ class VirtualPinballPlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
     def configure_driver(self, config: DriverConfig, number: str, platform_settings: dict) -> "DriverPlatformInterface":
         """Configure VPX driver."""
         number = str(number)
-        driver = VirtualPinballDriver(config, number, self.machine.clock)
+        driver = VirtualPinballDriver(config, number, self.machine.clock, self._dirty_drivers)
         self._drivers[number] = driver
         self._last_drivers[number] = False
         return driver
@@ -260,7 +343,7 @@ class VirtualPinballPlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
             subtype = "matrix"
         number = str(number)
         key = number + "-" + subtype
-        light = VirtualPinballLight(key, subtype, number)
+        light = VirtualPinballLight(key, subtype, number, self._dirty_lights)
         self._lights[key] = light
         self._last_lights[key] = False
         return light
@@ -1,8 +1,12 @@
 """MPF plugin to control the machine via OSC."""
 import asyncio
 import logging
+import time
 
+from mpf.core.player import Player
+from mpf.core.rgb_color import RGBColor
 from mpf.core.switch_controller import MonitoredSwitchChange
+from mpf.core.utility_functions import Util
 
 MYPY = False
 if MYPY:   # pragma: no cover
@@ -11,18 +15,30 @@ if MYPY:   # pragma: no cover
 # pythonosc is not a requirement for MPF so we fail with a nice error when loading
 try:
     from pythonosc.dispatcher import Dispatcher
+    from pythonosc.osc_bundle_builder import OscBundleBuilder
+    from pythonosc.osc_message_builder import OscMessageBuilder
     from pythonosc.osc_server import AsyncIOOSCUDPServer
     from pythonosc.udp_client import SimpleUDPClient
 
 except ImportError:
     Dispatcher = None
+    OscBundleBuilder = None
+    OscMessageBuilder = None
     AsyncIOOSCUDPServer = None
     SimpleUDPClient = None
 
 
 class Osc:
 
-    """Control switches via OSC."""
+    """Control switches via OSC.
+
+    Switch changes (and optionally light and player variable changes) are
+    collected during a loop iteration and sent as one OSC bundle. Bundles are
+    sent at most max_update_hz times per second.
+    """
+
+    # keep datagrams well below the UDP size limit
+    MAX_MESSAGES_PER_BUNDLE = 200
 
     def __init__(self, machine):
         """Initialise switch player."""
@@ -43,6 +59,14 @@ class Osc:
         if not self.config['enabled']:
             return
 
+        self._pending = []
+        self._flush_handle = None
+        self._last_flush = 0
+        if self.config['max_update_hz']:
+            self._min_flush_interval = 1 / self.config['max_update_hz']
+        else:
+            self._min_flush_interval = 0
+
         self.dispatcher = Dispatcher()
         self.dispatcher.map("/sw/*", self.handle_switch)
         self.server = AsyncIOOSCUDPServer((self.config['server_ip'], self.config['server_port']), self.dispatcher,
@@ -57,6 +81,14 @@ class Osc:
         yield from self.server.create_serve_endpoint()
         self.machine.switch_controller.add_monitor(self._notify_switch_changes)
 
+        if self.config['send_lights']:
+            self.machine.register_monitor("devices", self._notify_device_changes)
+            self.machine.light_controller.monitor_lights()
+
+        if self.config['send_player_vars']:
+            Player.enable_monitor()
+            self.machine.register_monitor("player", self._notify_player_var_changes)
+
     def __repr__(self):
         """Return string representation."""
         return '<Osc>'
@@ -67,7 +99,63 @@ class Osc:
 
     def _notify_switch_changes(self, change: MonitoredSwitchChange):
         """Send switch change to OSC client."""
-        self.client.send_message("/sw/{}".format(change.name), change.state)
+        self._add_message("/sw/{}".format(change.name), change.state)
+
+    def _notify_device_changes(self, device, attribute, old, value):
+        """Send light color changes to OSC client."""
+        del old
+        if device.class_label == "light" and attribute == "color":
+            self._add_message("/light/{}".format(device.name), value)
+
+    # pylint: disable-msg=too-many-arguments
+    def _notify_player_var_changes(self, name, value, prev_value, change, player_num):
+        """Send player variable changes to OSC client."""
+        del prev_value, change
+        self._add_message("/player/{}/{}".format(player_num, name), value)
+
+    def _add_message(self, address, value):
+        """Queue a message for the next bundle."""
+        self._pending.append((address, value))
+        if self._flush_handle:
+            return
+
+        next_flush = self._last_flush + self._min_flush_interval
+        if next_flush <= self.machine.clock.get_time():
+            # send at the end of the current loop iteration
+            self._flush_handle = self.machine.clock.loop.call_soon(self._flush)
+        else:
+            self._flush_handle = self.machine.clock.loop.call_at(next_flush, self._flush)
+
+    def _flush(self):
+        """Send all queued messages in as few bundles as possible."""
+        self._flush_handle = None
+        self._last_flush = self.machine.clock.get_time()
+        pending = self._pending
+        self._pending = []
+
+        for start in range(0, len(pending), self.MAX_MESSAGES_PER_BUNDLE):
+            bundle = OscBundleBuilder(time.time())
+            for address, value in pending[start:start + self.MAX_MESSAGES_PER_BUNDLE]:
+                message = OscMessageBuilder(address=address)
+                for arg in self._to_osc_args(value):
+                    message.add_arg(arg)
+                bundle.add_content(message.build())
+
+            self.client.send(bundle.build())
+
+    @staticmethod
+    def _to_osc_args(value):
+        """Convert a value to a list of OSC arguments."""
+        if isinstance(value, RGBColor):
+            return list(value.rgb)
+        value = Util.convert_to_simply_type(value)
+        if value is None:
+            return []
+        if isinstance(value, list):
+            return value
+        if isinstance(value, (bool, int, float, str)):
+            return [value]
+        return [str(value)]
 
 
 plugin_class = Osc
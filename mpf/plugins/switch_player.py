@@ -70,6 +70,9 @@ class SwitchPlayer:
             self.delay.add(name='switch_player_next_step',
                            ms=Util.string_to_ms(self.step_list[self.current_step]['time']),
                            callback=self._do_step)
+        else:
+            # script finished. the next start event plays it again (e.g. in every game)
+            self.current_step = 0
 
     def _hit(self, switch):
         self.machine.switch_controller.process_switch(
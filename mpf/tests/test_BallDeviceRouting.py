@@ -22,6 +22,43 @@ class TestBallDeviceRouting(MpfTestCase):
         del kwargs
         self._captured += balls
 
+    def test_routing_graph(self):
+        routing = self.machine.ball_controller.routing
+        trough1 = self.machine.ball_devices['test_trough1']
+        trough2 = self.machine.ball_devices['test_trough2']
+        launcher = self.machine.ball_devices['test_launcher']
+        target1 = self.machine.ball_devices['test_target1']
+        drain = self.machine.ball_devices['test_drain']
+        playfield = self.machine.ball_devices['playfield']
+
+        self.assertEqual([trough1, launcher, target1, trough2, drain], routing.devices)
+
+        # shortest paths
+        self.assertEqual([trough1, launcher, target1], list(trough1.find_path_to_target(target1)))
+        self.assertEqual([drain, trough2], list(drain.find_path_to_target(trough2)))
+        self.assertEqual([drain, playfield], list(drain.find_path_to_target(playfield)))
+        self.assertFalse(target1.find_path_to_target(trough1))
+
+        # paths are copies which can be changed by the caller
+        trough1.find_path_to_target(target1).popleft()
+        self.assertEqual([trough1, launcher, target1], list(trough1.find_path_to_target(target1)))
+
+        # nearest troughs
+        self.assertEqual(trough1, trough1.find_next_trough())
+        self.assertEqual(trough2, launcher.find_next_trough())
+        self.assertEqual(trough2, drain.find_next_trough())
+        self.assertFalse(target1.find_next_trough())
+
+        # devices with available balls are indexed incrementally
+        self.assertFalse(target1.find_one_available_ball())
+        trough1.available_balls = 1
+        self.assertEqual([trough1, launcher, target1], list(target1.find_one_available_ball()))
+        launcher.available_balls = 1
+        self.assertEqual([launcher, target1], list(target1.find_one_available_ball()))
+        trough1.available_balls = 0
+        launcher.available_balls = 0
+        self.assertFalse(target1.find_one_available_ball())
+
     def test_routing_to_pf_on_capture(self):
         c_launcher = self.machine.coils['c_launcher']
         c_launcher.pulse = MagicMock()
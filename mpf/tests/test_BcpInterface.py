@@ -430,3 +430,27 @@ class TestBcpInterface(MpfBcpTestCase):
         self.advance_time_and_run()
         queue = self._bcp_external_client.reset_and_return_queue()
         self.assertFalse(queue)
+
+    def test_flight_recorder(self):
+        self.hit_switch_and_run("s_test", .1)
+        self._bcp_external_client.reset_and_return_queue()
+        self._bcp_external_client.send('flight_recorder', {})
+        self.advance_time_and_run()
+
+        queue = self._bcp_external_client.reset_and_return_queue()
+        self.assertEqual("flight_recorder", queue[0][0])
+        records = [(record_type, name, value) for _, record_type, name, value in queue[0][1]["records"]]
+        self.assertIn(("switch", "s_test", 1), records)
+
+    def test_handler_profile(self):
+        self.machine.handler_profiler.interval = 1
+        self.hit_switch_and_run("s_test", .1)
+        self._bcp_external_client.reset_and_return_queue()
+        self._bcp_external_client.send('handler_profile', {"count": 5})
+        self.advance_time_and_run()
+
+        queue = self._bcp_external_client.reset_and_return_queue()
+        self.assertEqual("handler_profile", queue[0][0])
+        self.assertEqual(1, queue[0][1]["interval"])
+        self.assertTrue(0 < len(queue[0][1]["handlers"]) <= 5)
+        self.assertIn("switch", [handler["category"] for handler in queue[0][1]["handlers"]])
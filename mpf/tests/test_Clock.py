@@ -64,3 +64,79 @@ class ClockTestCase(unittest.TestCase):
         self.clock.unschedule(cb1)
         self.advance_time_and_run(0.001)
         self.assertEqual(counter, 1)
+
+    def test_schedule_deadline(self):
+        timer = self.clock.schedule_deadline(callback, .01)
+        self.advance_time_and_run(.005)
+        self.assertEqual(counter, 0)
+
+        # push back the deadline. the loop callback stays in place
+        timer.reset(.01)
+        self.assertEqual(1, len(self.loop._scheduled))
+        self.advance_time_and_run(.007)
+        self.assertEqual(counter, 0)
+        self.advance_time_and_run(.005)
+        self.assertEqual(counter, 1)
+
+        # timer can be reused after it fired
+        timer.reset(.002)
+        self.advance_time_and_run(.004)
+        self.assertEqual(counter, 2)
+
+        # move deadline forward
+        timer.reset(1)
+        timer.reset(.002)
+        self.advance_time_and_run(.004)
+        self.assertEqual(counter, 3)
+
+        # cancel
+        timer.reset(.002)
+        timer.cancel()
+        self.advance_time_and_run(.004)
+        self.assertEqual(counter, 3)
+
+    def _active_handles(self):
+        return [handle for handle in self.loop._scheduled if not handle._cancelled]
+
+    def test_schedule_shared_interval(self):
+        task1 = self.clock.schedule_shared_interval(partial(self.callback1, 1), .1)
+        task2 = self.clock.schedule_shared_interval(partial(self.callback1, 2), .1)
+        # both tasks share one loop callback
+        self.assertEqual(1, len(self._active_handles()))
+        self.assertEqual(task1.get_next_call_time(), task2.get_next_call_time())
+
+        self.advance_time_and_run(.15)
+        self.assertEqual([1, 2], self.callback_order)
+
+        # out of phase. will create a second group but still tick after one interval
+        task3 = self.clock.schedule_shared_interval(partial(self.callback1, 3), .1)
+        self.assertEqual(2, len(self._active_handles()))
+        self.advance_time_and_run(.07)
+        self.assertEqual([1, 2, 1, 2], self.callback_order)
+        self.advance_time_and_run(.05)
+        self.assertEqual([1, 2, 1, 2, 3], self.callback_order)
+
+        task1.cancel()
+        task3.cancel()
+        self.assertEqual(1, len(self._active_handles()))
+        self.advance_time_and_run(.1)
+        self.assertEqual([1, 2, 1, 2, 3, 2], self.callback_order)
+
+        task2.cancel()
+        self.assertEqual(0, len(self._active_handles()))
+
+    def _failing_callback(self):
+        self.callback_order.append("fail")
+        raise AssertionError("task failed")
+
+    def test_shared_interval_exception(self):
+        errors = []
+        self.loop.set_exception_handler(lambda loop, context: errors.append(context))
+        self.clock.schedule_shared_interval(self._failing_callback, .1)
+        self.clock.schedule_shared_interval(partial(self.callback1, 2), .1)
+
+        # the second task still runs in every tick
+        self.advance_time_and_run(.25)
+        self.assertEqual(["fail", 2, "fail", 2], self.callback_order)
+        self.assertEqual(2, len(errors))
+        self.assertIsInstance(errors[0]['exception'], AssertionError)
@@ -23,5 +23,5 @@ class TestCommands(TestCase):
         with patch("mpf.commands.migrate.logging"):
             with patch("mpf.commands.migrate.os"):
                 with patch("mpf.commands.migrate.Migrator") as cmd:
-                    migrate.Command("test", "machine", "")
-                    cmd.assert_called_with("test", "machine")
+                    migrate.Command("test", "machine", ["-j", "3"])
+                    cmd.assert_called_with("test", "machine", 3)
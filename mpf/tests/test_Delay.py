@@ -121,3 +121,31 @@ class TestDelay(MpfTestCase):
         self.callback = MagicMock()
         self.advance_time_and_run(1)
         self.callback.assert_not_called()
+
+    def test_reset_moves_deadline(self):
+        self.callback = MagicMock()
+        self.machine.delay.reset(1000, self.callback, "delay_test")
+        delay = self.machine.delay.delays["delay_test"]
+
+        for _ in range(10):
+            self.advance_time_and_run(.5)
+            self.machine.delay.reset(1000, self.callback, "delay_test", value=1)
+
+        # still the same timer and the callback did not run
+        self.assertIs(delay, self.machine.delay.delays["delay_test"])
+        self.callback.assert_not_called()
+
+        self.advance_time_and_run(.9)
+        self.callback.assert_not_called()
+        self.advance_time_and_run(.2)
+        self.callback.assert_called_once_with(value=1)
+        self.assertNotIn("delay_test", self.machine.delay.delays)
+
+        # run_now and remove work with reset delays
+        self.machine.delay.reset(1000, self.callback, "delay_test", value=2)
+        self.machine.delay.run_now("delay_test")
+        self.callback.assert_called_with(value=2)
+        self.machine.delay.reset(1000, self.callback, "delay_test", value=3)
+        self.machine.delay.remove("delay_test")
+        self.advance_time_and_run(2)
+        self.assertEqual(2, self.callback.call_count)
@@ -415,6 +415,7 @@ class TestDeviceLight(MpfTestCase):
         self.assertEqual(100 / 255.0, led.hw_drivers["blue"][0].current_brightness)
 
         self.machine.set_machine_var("brightness", 0.8)
+        self.assertEqual(0.8, self.machine.settings.snapshot.brightness)
         led.color(RGBColor((100, 100, 100)))
         self.advance_time_and_run(1)
 
@@ -33,3 +33,22 @@ class TestDeviceManager(MpfTestCase):
                 self.assertEqual(sig.parameters['kwargs'].kind, inspect._VAR_KEYWORD,
                     "Method {}.{} kwargs param is missing '**'".format(
                     device_type, method_name))
+
+    def test_lazy_device_modules(self):
+        # null config does not use timers. the collection exists but the class is never loaded
+        self.assertNotIn("timers", self.machine.config)
+        self.assertNotIn("timers", self.machine.device_manager.device_classes)
+        self.assertNotIn("timers", self.machine.device_manager.collections)
+        self.assertEqual({}, self.machine.timers)
+
+        # psus are always in the config
+        self.assertIn("psus", self.machine.device_manager.device_classes)
+        self.assertIn("default", self.machine.psus)
+
+    def test_device_module_config_sections(self):
+        # the config section in mpfconfig is used as collection name of unused modules
+        for device_type, config_section in self.machine.config['mpf']['device_modules'].items():
+            if not config_section:
+                continue
+            device_cls = Util.string_to_class(device_type)
+            self.assertEqual((config_section, config_section), device_cls.get_config_info(), device_type)
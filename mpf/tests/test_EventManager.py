@@ -341,6 +341,31 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.assertEqual(tuple(), self._handler2_args)
         self.assertEqual(dict(), self._handler2_kwargs)
 
+    def test_planned_handlers(self):
+        # plan handlers once and register them in bulk with a priority offset
+        planned = [self.machine.events.plan_handler('test_event', self.event_handler1, priority=1),
+                   self.machine.events.plan_handler('test_event', self.event_handler2, priority=2)]
+
+        with self.assertRaises(AssertionError):
+            self.machine.events.plan_handler('test_event', lambda: None)
+
+        for _ in range(2):
+            self._handlers_called = list()
+            keys = self.machine.events.add_planned_handlers(planned, 100)
+            self.assertEqual(2, len(keys))
+            self.assertEqual([101, 102], sorted(handler.priority for handler in
+                                                self.machine.events.registered_handlers['test_event']))
+
+            self.machine.events.post('test_event')
+            self.advance_time_and_run(1)
+            self.assertEqual([self.event_handler2, self.event_handler1], self._handlers_called)
+
+            self.machine.events.remove_handlers_by_keys(keys)
+            self.assertFalse(self.machine.events.does_event_exist('test_event'))
+
+        self.assertEqual(2, self._handler1_called)
+        self.assertEqual(2, self._handler2_called)
+
     def test_does_event_exist(self):
         self.machine.events.add_handler('test_event', self.event_handler1)
 
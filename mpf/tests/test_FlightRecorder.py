@@ -0,0 +1,51 @@
+"""Test the flight recorder."""
+from unittest.mock import patch, MagicMock
+
+from mpf.core.flight_recorder import FlightRecorder
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestFlightRecorder(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/flight_recorder/'
+
+    def _get_records(self):
+        return [(record_type, name, value) for _, record_type, name, value in
+                self.machine.flight_recorder.get_records()]
+
+    def test_record(self):
+        self.machine.flight_recorder.clear()
+        self.assertEqual([], self._get_records())
+
+        self.hit_switch_and_run("s_test", 1)
+        self.machine.coils["c_test"].pulse()
+        self.post_event("test_event")
+
+        records = self._get_records()
+        self.assertIn(("switch", "s_test", 1), records)
+        self.assertIn(("pulse", "c_test", 20), records)
+        self.assertEqual(("event", "test_event", 0), records[-1])
+
+    def test_ring_buffer(self):
+        recorder = FlightRecorder(self.machine, 5)
+        for i in range(8):
+            recorder.record(FlightRecorder.SWITCH, "s_test", i)
+
+        # only the last five records are kept. oldest first
+        self.assertEqual([("switch", "s_test", i) for i in range(3, 8)],
+                         [(record_type, name, value) for _, record_type, name, value in recorder.get_records()])
+
+    def test_debug_dump_stats(self):
+        with patch("mpf.core.flight_recorder.FlightRecorder.dump_to_log") as dump_to_log:
+            self.post_event("debug_dump_stats", .1)
+        dump_to_log.assert_called_once_with(self.machine.log)
+
+    def test_dump_to_log(self):
+        self.post_event("test_event")
+        log = MagicMock()
+        self.machine.flight_recorder.dump_to_log(log)
+        self.assertIn("test_event", [call[0][3] for call in log.info.call_args_list if len(call[0]) > 3])
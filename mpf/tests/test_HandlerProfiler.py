@@ -0,0 +1,127 @@
+"""Test the handler profiler."""
+from unittest.mock import patch, MagicMock
+
+from mpf.core.handler_profiler import HandlerProfiler
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestHandlerProfiler(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/handler_profiler/'
+
+    def _handler(self, **kwargs):
+        del kwargs
+        self.machine.events.post("nested_event")
+
+    def _nested_handler(self, **kwargs):
+        del kwargs
+
+    def _switch_handler(self):
+        pass
+
+    def _delay_callback(self):
+        pass
+
+    def test_profile(self):
+        self.machine.handler_profiler.clear()
+        self.machine.events.add_handler("test_event", self._handler)
+        self.machine.events.add_handler("nested_event", self._nested_handler)
+        self.machine.switch_controller.add_switch_handler("s_test", self._switch_handler)
+        self.machine.delay.add(100, self._delay_callback)
+
+        self.post_event("test_event")
+        self.post_event("test_event")
+        self.hit_switch_and_run("s_test", 1)
+
+        self.assertEqual(2, self.machine.handler_profiler.stats[
+            ("event", "test_event", "TestHandlerProfiler._handler")].calls)
+        self.assertEqual(2, self.machine.handler_profiler.stats[
+            ("event", "nested_event", "TestHandlerProfiler._nested_handler")].calls)
+        self.assertEqual(1, self.machine.handler_profiler.stats[
+            ("switch", "s_test", "TestHandlerProfiler._switch_handler")].calls)
+        self.assertEqual(1, self.machine.handler_profiler.stats[
+            ("delay", "TestHandlerProfiler._delay_callback", "TestHandlerProfiler._delay_callback")].calls)
+
+        top = self.machine.handler_profiler.get_top(100)
+        self.assertEqual(sorted(top, key=lambda x: -x["total"]), top)
+        self.assertIn("event test_event -> TestHandlerProfiler._handler", self.machine.handler_profiler.get_report())
+
+        # events are queued. nested_event runs after the handler of test_event finished
+        stacks = self.machine.handler_profiler.get_collapsed_stacks().split("\n")
+        self.assertIn("event:test_event;TestHandlerProfiler._handler",
+                      [line.rsplit(" ", 1)[0] for line in stacks])
+
+    def test_nested_stacks(self):
+        profiler = HandlerProfiler(self.machine, 1)
+        start = profiler.start(HandlerProfiler.EVENT, "outer", self._handler)
+        inner_start = profiler.start(HandlerProfiler.SWITCH, "s_test", self._switch_handler)
+        profiler.stop(inner_start)
+        profiler.stop(start)
+
+        self.assertEqual({("event:outer;TestHandlerProfiler._handler", ),
+                          ("event:outer;TestHandlerProfiler._handler",
+                           "switch:s_test;TestHandlerProfiler._switch_handler")},
+                         set(profiler.stacks))
+        # the time of the inner handler is not counted twice
+        self.assertAlmostEqual(profiler.stats[("event", "outer", "TestHandlerProfiler._handler")].total,
+                               sum(profiler.stacks.values()))
+
+    def _failing_callback(self, **kwargs):
+        del kwargs
+        raise AssertionError("handler failed")
+
+    def test_failing_handlers(self):
+        # a crashing handler must not leave its sample on the stack
+        self.machine.switch_controller.add_switch_handler("s_test", self._failing_callback)
+        with self.assertRaises(AssertionError):
+            self.machine.switch_controller.process_switch("s_test", 1, True)
+        self.assertEqual([], self.machine.handler_profiler._running)
+
+        with self.assertRaises(AssertionError):
+            self.machine.delay._process_delay_callback("test", self._failing_callback)
+        self.assertEqual([], self.machine.handler_profiler._running)
+
+    def test_disabled(self):
+        self.machine.handler_profiler.interval = 0
+        self.machine.events.add_handler("test_event", self._handler)
+        self.machine.switch_controller.add_switch_handler("s_test", self._switch_handler)
+        self.machine.delay.add(100, self._delay_callback)
+        with patch.object(HandlerProfiler, "start") as start:
+            self.post_event("test_event")
+            self.hit_switch_and_run("s_test", 1)
+        self.assertFalse(start.called)
+
+    def test_sampling(self):
+        profiler = HandlerProfiler(self.machine, 3)
+        for _ in range(9):
+            start = profiler.start(HandlerProfiler.EVENT, "test_event", self._handler)
+            if start:
+                profiler.stop(start)
+
+        self.assertEqual(3, profiler.stats[("event", "test_event", "TestHandlerProfiler._handler")].calls)
+        # counts are extrapolated
+        self.assertEqual(9, profiler.get_top()[0]["calls"])
+
+        profiler = HandlerProfiler(self.machine, 0)
+        self.assertFalse(profiler.start(HandlerProfiler.EVENT, "test_event", self._handler))
+        self.assertEqual([], profiler.get_top())
+
+    def test_debug_dump_stats(self):
+        self.post_event("test_event")
+        with patch("mpf.core.handler_profiler.HandlerProfiler.write_collapsed_stacks") as write_collapsed_stacks, \
+                patch("mpf.core.handler_profiler.HandlerProfiler.dump_to_log") as dump_to_log, \
+                patch.dict(self.machine.config['mpf'], {"handler_profiler_file": "handler_profile.txt"}):
+            self.post_event("debug_dump_stats", .1)
+        dump_to_log.assert_called_once_with(self.machine.log, 20)
+        self.assertTrue(write_collapsed_stacks.call_args[0][0].endswith("handler_profile.txt"))
+
+    def test_dump_to_log(self):
+        self.post_event("test_event")
+        log = MagicMock()
+        self.machine.handler_profiler.dump_to_log(log)
+        self.assertTrue(any("EventManager" in call[0][0] or "DelayManager" in call[0][0] or "Switch" in call[0][0]
+                            for call in log.info.call_args_list))
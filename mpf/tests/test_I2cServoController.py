@@ -1,6 +1,26 @@
+from unittest.mock import patch
+
+from mpf.platforms.virtual import VirtualI2cDevice
 from mpf.tests.MpfTestCase import MpfTestCase
 
 
+class CountingI2cDevice(VirtualI2cDevice):
+
+    __slots__ = ["transactions"]
+
+    def __init__(self, number, initial_layout):
+        super().__init__(number, initial_layout)
+        self.transactions = []
+
+    def i2c_write8(self, register, value):
+        self.transactions.append((register, [value]))
+        super().i2c_write8(register, value)
+
+    def i2c_write_block(self, register, data):
+        self.transactions.append((register, list(data)))
+        super().i2c_write_block(register, data)
+
+
 class TestI2cServoController(MpfTestCase):
 
     def getConfigFile(self):
@@ -12,6 +32,12 @@ class TestI2cServoController(MpfTestCase):
     def get_platform(self):
         return False
 
+    def setUp(self):
+        patcher = patch("mpf.platforms.virtual.VirtualI2cDevice", CountingI2cDevice)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
     def test_servo_move(self):
         self.assertEqual(0x40, self.machine.servos["servo1"].hw_servo.i2c_device.number)
         self.assertEqual(3, self.machine.servos["servo1"].hw_servo.number)
@@ -26,6 +52,7 @@ class TestI2cServoController(MpfTestCase):
         self.assertEqual(119, self.machine.servos["servo1"].hw_servo.i2c_device.data[0x08 + 3 * 4])
         self.assertEqual(1, self.machine.servos["servo1"].hw_servo.i2c_device.data[0x09 + 3 * 4])
         self.machine.servos["servo1"].go_to_position(1.0)
+        self.machine_run()
         self.assertEqual(88, self.machine.servos["servo1"].hw_servo.i2c_device.data[0x08 + 3 * 4])
         self.assertEqual(2, self.machine.servos["servo1"].hw_servo.i2c_device.data[0x09 + 3 * 4])
 
@@ -33,5 +60,26 @@ class TestI2cServoController(MpfTestCase):
         self.assertEqual(119, self.machine.servos["servo2"].hw_servo.i2c_device.data[0x08 + 7 * 4])
         self.assertEqual(1, self.machine.servos["servo2"].hw_servo.i2c_device.data[0x09 + 7 * 4])
         self.machine.servos["servo2"].go_to_position(1.0)
+        self.machine_run()
         self.assertEqual(88, self.machine.servos["servo2"].hw_servo.i2c_device.data[0x08 + 7 * 4])
         self.assertEqual(2, self.machine.servos["servo2"].hw_servo.i2c_device.data[0x09 + 7 * 4])
+
+    def test_batched_writes(self):
+        device1 = self.machine.servos["servo1"].hw_servo.i2c_device
+        device2 = self.machine.servos["servo2"].hw_servo.i2c_device
+        # auto increment is enabled on init
+        self.assertEqual(0x21, device1.data[0x00])
+        device1.transactions = []
+        device2.transactions = []
+
+        # nothing is written until the end of the loop iteration
+        self.machine.servos["servo1"].hw_servo.go_to_position(0.5)
+        self.machine.servos["servo1"].hw_servo.go_to_position(1.0)
+        self.machine.servos["servo3"].hw_servo.go_to_position(0.0)
+        self.machine.servos["servo2"].hw_servo.go_to_position(1.0)
+        self.assertEqual([], device1.transactions)
+
+        # servo 3 and 4 on the same controller are written in one block. only the last value counts
+        self.machine_run()
+        self.assertEqual([(0x06 + 3 * 4, [0, 0, 88, 2, 0, 0, 150, 0])], device1.transactions)
+        self.assertEqual([(0x06 + 7 * 4, [0, 0, 88, 2])], device2.transactions)
@@ -1,4 +1,6 @@
 """Test led groups."""
+from unittest.mock import MagicMock
+
 from mpf.core.rgb_color import RGBColor
 from mpf.tests.MpfTestCase import MpfTestCase
 
@@ -56,3 +58,134 @@ class TestLightGroups(MpfTestCase):
         # 360/0 degree
         self.assertEqual(100, self.machine.lights["ring1_light_9"].config['x'])
         self.assertEqual(53, self.machine.lights["ring1_light_9"].config['y'])
+
+    def test_group_stack(self):
+        stripe = self.machine.light_stripes['stripe1']
+        stripe.color("red", key="group")
+        self.advance_time_and_run(1)
+        # one entry for the whole group
+        self.assertEqual(1, len(stripe.stack))
+        self.assertFalse(self.machine.lights["stripe1_light_0"].stack)
+        self.assertIsNone(stripe.stack[0].start_colors)
+
+        # colors on single lights are merged with the group stack by priority
+        self.machine.lights["stripe1_light_1"].color("blue", priority=2, key="show")
+        self.machine.lights["stripe1_light_3"].color("yellow", key="show")
+        self.advance_time_and_run(1)
+        self.assertLightColor("stripe1_light_0", "red")
+        self.assertLightColor("stripe1_light_1", "blue")
+        self.assertLightColor("stripe1_light_2", "red")
+        self.assertLightColor("stripe1_light_3", "yellow")
+
+        # fade from the individual colors to white
+        stripe.color("white", fade_ms=1000, priority=1, key="wash")
+        self.assertEqual(2, len(stripe.stack))
+        self.assertIsNotNone(stripe.stack[0].start_colors)
+        self.advance_time_and_run(.5)
+        self.assertLightColor("stripe1_light_0", [255, 127, 127])
+        self.assertLightColor("stripe1_light_1", "blue")
+        self.assertLightColor("stripe1_light_2", [255, 127, 127])
+        self.assertLightColor("stripe1_light_3", [255, 255, 127])
+        self.advance_time_and_run(1)
+        self.assertLightColor("stripe1_light_0", "white")
+        self.assertLightColor("stripe1_light_2", "white")
+
+        # fade out the upper group entry
+        stripe.remove_from_stack_by_key("wash", fade_ms=1000)
+        self.advance_time_and_run(.5)
+        self.assertLightColor("stripe1_light_0", [255, 128, 128])
+        self.assertLightColor("stripe1_light_3", [255, 255, 128])
+        self.advance_time_and_run(1)
+        self.assertLightColor("stripe1_light_0", "red")
+        self.assertLightColor("stripe1_light_3", "yellow")
+        self.assertEqual(1, len(stripe.stack))
+
+        self.machine.lights["stripe1_light_1"].remove_from_stack_by_key("show")
+        self.advance_time_and_run(1)
+        self.assertLightColor("stripe1_light_1", "red")
+
+        # a lower priority with the same key is ignored
+        stripe.color("blue", priority=-1, key="group")
+        self.advance_time_and_run(1)
+        self.assertLightColor("stripe1_light_1", "red")
+
+        stripe.off(key="group")
+        self.advance_time_and_run(1)
+        self.assertLightColor("stripe1_light_1", "off")
+        self.assertLightColor("stripe1_light_2", "off")
+
+        stripe.on(key="group")
+        self.advance_time_and_run(1)
+        self.assertLightColor("stripe1_light_2", "white")
+
+        stripe.clear_stack()
+        self.advance_time_and_run(1)
+        self.assertLightColor("stripe1_light_2", "off")
+        self.assertLightColor("stripe1_light_3", "yellow")
+
+    def test_same_key_on_group_and_light(self):
+        player = self.machine.light_player
+        stripe = self.machine.light_stripes['stripe1']
+        # the group entry replaces the entry of the single light with the same key
+        player.play({"stripe1_light_0": {"color": "red", "fade": None}}, "show1", None)
+        player.play({"test": {"color": "blue", "fade": None}}, "show1", None)
+        self.advance_time_and_run(1)
+        self.assertLightColor("stripe1_light_0", "blue")
+        self.assertLightColor("stripe1_light_1", "blue")
+        self.assertEqual([], self.machine.lights["stripe1_light_0"].stack)
+
+        # and the other way around. the other lights keep the color of the group
+        player.play({"stripe1_light_0": {"color": "red", "fade": None}}, "show1", None)
+        self.advance_time_and_run(1)
+        self.assertLightColor("stripe1_light_0", "red")
+        self.assertLightColor("stripe1_light_1", "blue")
+        self.assertEqual([], stripe.stack)
+
+        # removing the key from a single light does not leave the group color behind
+        player.play({"test": {"color": "green", "fade": None}}, "show1", None)
+        self.machine.lights["stripe1_light_0"].remove_from_stack_by_key("show1.light_player")
+        self.advance_time_and_run(1)
+        self.assertLightColor("stripe1_light_0", "off")
+        self.assertLightColor("stripe1_light_1", "green")
+
+        # removing the key from the group removes it from all lights
+        player.play({"stripe1_light_2": {"color": "red", "fade": None}}, "show1", None)
+        stripe.remove_from_stack_by_key("show1.light_player")
+        self.advance_time_and_run(1)
+        for index in range(5):
+            self.assertLightColor("stripe1_light_{}".format(index), "off")
+
+    def test_hw_update(self):
+        self.machine.light_stripes['stripe2'].color("blue")
+        self.advance_time_and_run(.1)
+        self.assertEqual(1.0, self.machine.lights["stripe2_light_4"].hw_drivers["blue"][0].current_brightness)
+        self.assertEqual(0.0, self.machine.lights["stripe2_light_4"].hw_drivers["red"][0].current_brightness)
+
+    def test_light_player_tag(self):
+        self.machine.default_platform.light_sync = MagicMock()
+        self.post_event("play_test_tag")
+        # the whole stripe is tagged. its color is stored once in the group
+        self.assertEqual(1, len(self.machine.light_stripes['stripe1'].stack))
+        self.assertEqual([], self.machine.lights["stripe1_light_0"].stack)
+        self.assertEqual(1, len(self.machine.lights["l_single"].stack))
+        self.assertEqual(0, len(self.machine.light_stripes['stripe2'].stack))
+        # one sync for the group and one for all other lights
+        self.assertEqual(2, self.machine.default_platform.light_sync.call_count)
+        self.assertLightColor("stripe1_light_0", "white")
+        self.assertLightColor("stripe1_light_4", "white")
+        self.assertLightColor("l_single", "white")
+        self.assertLightColor("stripe2_light_0", "off")
+
+        self.post_event("stop_test_tag")
+        self.assertEqual([], self.machine.light_stripes['stripe1'].stack)
+        self.assertEqual([], self.machine.lights["l_single"].stack)
+        self.assertLightColor("stripe1_light_0", "off")
+        self.assertLightColor("l_single", "off")
+
+        # a tag which covers only part of a group is applied to the lights
+        self.machine.lights["stripe1_light_0"].config['tags'].append("partial")
+        self.machine.lights._tag_cache = {}
+        self.machine.light_player.play({"partial": {"color": "red", "fade": None}}, "mode1", None)
+        self.assertEqual([], self.machine.light_stripes['stripe1'].stack)
+        self.assertLightColor("stripe1_light_0", "red")
+        self.assertLightColor("stripe1_light_1", "off")
@@ -0,0 +1,62 @@
+import logging
+from queue import Queue
+from unittest import TestCase
+
+from mpf.core.logging import DeferredQueueHandler, LevelQueueListener
+
+
+class ListHandler(logging.Handler):
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+        self.setFormatter(logging.Formatter('%(levelname)s:%(message)s'))
+
+    def emit(self, record):
+        self.records.append(self.format(record))
+
+
+class TestDeferredQueueHandler(TestCase):
+
+    def setUp(self):
+        self.queue = Queue()
+        self.log = logging.getLogger("test_deferred_queue")
+        self.log.propagate = False
+        self.log.setLevel(logging.DEBUG)
+        self.handler = DeferredQueueHandler(self.queue)
+        self.log.addHandler(self.handler)
+
+    def tearDown(self):
+        self.log.removeHandler(self.handler)
+
+    def test_message_is_not_rendered_when_logged(self):
+        self.log.info("value: %s", 7)
+
+        record = self.queue.get_nowait()
+        self.assertEqual("value: %s", record.msg)
+        self.assertEqual((7, ), record.args)
+        self.assertFalse(hasattr(record, "message"))
+
+        handler = ListHandler()
+        listener = LevelQueueListener(self.queue, handler)
+        listener.handle(record)
+        self.assertEqual(["INFO:value: 7"], handler.records)
+
+    def test_exception_is_formatted_in_listener(self):
+        try:
+            raise AssertionError("broken")
+        except AssertionError:
+            self.log.exception("failed")
+
+        record = self.queue.get_nowait()
+        self.assertIsNotNone(record.exc_info)
+        self.assertIsNone(record.exc_text)
+
+        # handlers of the listener render the exception
+        debug_handler = ListHandler()
+        error_handler = ListHandler(logging.CRITICAL)
+        listener = LevelQueueListener(self.queue, debug_handler, error_handler)
+        listener.handle(record)
+        self.assertTrue(debug_handler.records[0].startswith("ERROR:failed\nTraceback"))
+        self.assertIn("AssertionError: broken", debug_handler.records[0])
+        self.assertEqual([], error_handler.records)
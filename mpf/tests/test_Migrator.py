@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+import mpf
+from mpf.migrator.config_version_4 import V4Migrator
+from mpf.migrator.migrator import Migrator
+
+
+class TestMigrator(TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.mpf_path = os.path.abspath(os.path.dirname(mpf.__file__))
+        self.source = os.path.join(self.mpf_path, "tests/machine_files/migrator")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _migrate(self, name, jobs):
+        # slide names and displays are collected per run
+        V4Migrator.set_shared_state(dict(slides={}, displays={}, default_display=None, color_dmd=False))
+        machine_path = os.path.join(self.temp_dir.name, name)
+        shutil.copytree(self.source, machine_path)
+        migrator = Migrator(self.mpf_path, machine_path, jobs)
+        return migrator, machine_path
+
+    @staticmethod
+    def _read(machine_path, file_name):
+        with open(os.path.join(machine_path, file_name)) as f:
+            return f.read()
+
+    def test_migrate(self):
+        migrator, machine_path = self._migrate("sequential", 1)
+        self.assertEqual(3, migrator.num_config_files)
+        self.assertEqual(1, migrator.num_show_files)
+        # new.yaml and current.yaml are already at the latest version
+        self.assertEqual(2, migrator.num_skipped_files)
+        self.assertEqual(self._read(self.source, "modes/new/config/new.yaml"),
+                         self._read(machine_path, "modes/new/config/new.yaml"))
+
+        config = self._read(machine_path, "config/config.yaml")
+        self.assertTrue(config.startswith("#config_version=4"))
+        self.assertIn("displays:", config)
+        self.assertIn("window_slide_1:", config)
+        self.assertIn("type: color_dmd", config)
+        attract = self._read(machine_path, "modes/attract/config/attract.yaml")
+        self.assertIn("mode_attract_started: slide_1", attract)
+        self.assertIn("ball_started: slide_2", attract)
+        self.assertIn("text: BALL (ball)", attract)
+        show = self._read(machine_path, "shows/flash.yaml")
+        self.assertTrue(show.startswith("#show_version=4"))
+        self.assertIn("flash_slide_1:", show)
+        self.assertIn("inserts: ff", show)
+
+    def test_parallel_output_is_identical(self):
+        sequential = self._migrate("sequential", 1)[1]
+        migrator, parallel = self._migrate("parallel", 2)
+        self.assertEqual(3, migrator.num_config_files)
+        self.assertEqual(1, migrator.num_show_files)
+
+        for file_name in migrator.file_list:
+            relative_name = os.path.relpath(file_name, parallel)
+            self.assertEqual(self._read(sequential, relative_name), self._read(parallel, relative_name),
+                             relative_name)
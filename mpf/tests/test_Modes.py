@@ -71,6 +71,36 @@ class TestModes(MpfFakeGameTestCase):
         self.assertEqual(1, self.mode1_stopping_event_handler.call_count)
         self.assertEqual(1, self.mode1_stopped_event_handler.call_count)
 
+    def test_mode_activation_plan(self):
+        mode = self.machine.modes.mode1
+        handler_count = sum(len(handlers) for handlers in self.machine.events.registered_handlers.values())
+
+        self.machine.events.post('start_mode1')
+        self.advance_time_and_run()
+        self.assertTrue(mode.active)
+        plan = mode._activation_plan
+        self.assertTrue(plan)
+
+        self.machine.events.post('stop_mode1')
+        self.advance_time_and_run()
+        self.assertFalse(mode.active)
+        self.assertEqual(handler_count,
+                         sum(len(handlers) for handlers in self.machine.events.registered_handlers.values()))
+
+        # the plan is only compiled once and reused with the new priority
+        mode.start(mode_priority=500)
+        self.advance_time_and_run()
+        self.assertTrue(mode.active)
+        self.assertIs(plan, mode._activation_plan)
+        for handler in self.machine.events.registered_handlers['stop_mode1']:
+            if handler.callback == mode.stop:
+                self.assertEqual(handler.priority, 501)
+
+        mode.stop()
+        self.advance_time_and_run()
+        self.assertEqual(handler_count,
+                         sum(len(handlers) for handlers in self.machine.events.registered_handlers.values()))
+
     def test_custom_mode_code(self):
         self.assertTrue(self.machine.modes.mode3.custom_code)
 
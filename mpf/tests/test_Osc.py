@@ -1,7 +1,17 @@
 import asyncio
+import socket
+import unittest
 
+from mpf.core.player import Player
 from mpf.tests.MpfTestCase import MpfTestCase, MagicMock, patch, call
 
+try:
+    from pythonosc.osc_bundle import OscBundle
+    from pythonosc.osc_packet import OscPacket
+except ImportError:
+    OscBundle = None
+    OscPacket = None
+
 
 class TestOsc(MpfTestCase):
 
@@ -47,3 +57,105 @@ class TestOsc(MpfTestCase):
             call('/thing/light/blue/17', 1.0),
             call('/thing/light/green/17', 1.0),
             call('/thing/light/red/17', 1.0)], any_order=True)
+
+
+@unittest.skipIf(not OscPacket, "pythonosc is not installed")
+class TestOscPlugin(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'plugin.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/osc/'
+
+    def setUp(self):
+        # local receiver for the bundles sent by the plugin
+        self.receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.receiver.bind(("127.0.0.1", 0))
+        self.receiver.settimeout(.5)
+        self.addCleanup(self.receiver.close)
+
+        server_class = patch('mpf.plugins.osc.AsyncIOOSCUDPServer')
+        self.server_class = server_class.start()
+        self.addCleanup(server_class.stop)
+        self.server_class.return_value.create_serve_endpoint = asyncio.coroutine(lambda: True)
+
+        self.machine_config_patches['mpf']['plugins'] = ['mpf.plugins.osc.Osc']
+        # point the client to the local receiver
+        self.machine_config_patches['osc_plugin'] = {"client_port": self.receiver.getsockname()[1]}
+        # player var monitoring is global. start without users from other tests
+        Player._monitor_users = 0
+        Player.monitor_enabled = False
+        self.addCleanup(Player.disable_monitor)
+        super().setUp()
+
+    def _receive(self):
+        """Return all received bundles as lists of (address, params)."""
+        bundles = []
+        self.receiver.setblocking(False)
+        try:
+            while True:
+                data = self.receiver.recv(65535)
+                self.assertTrue(OscBundle.dgram_is_bundle(data))
+                bundles.append([(message.message.address, message.message.params)
+                                for message in OscPacket(data).messages])
+        except BlockingIOError:
+            pass
+        return bundles
+
+    def test_switch_burst(self):
+        self._receive()
+
+        # burst of 30 switch changes in one loop iteration
+        for _ in range(5):
+            for switch in ("s_test1", "s_test2", "s_test3"):
+                self.machine.switch_controller.process_switch(switch, 1, logical=True)
+                self.machine.switch_controller.process_switch(switch, 0, logical=True)
+        self.advance_time_and_run(.01)
+
+        bundles = self._receive()
+        self.assertEqual(1, len(bundles))
+        self.assertEqual(30, len(bundles[0]))
+        self.assertEqual([("/sw/s_test1", [1]), ("/sw/s_test1", [0]),
+                          ("/sw/s_test2", [1]), ("/sw/s_test2", [0]),
+                          ("/sw/s_test3", [1]), ("/sw/s_test3", [0])] * 5, bundles[0])
+
+        # rate limited to 20Hz. changes within 50ms end up in one bundle
+        self.hit_switch_and_run("s_test1", .01)
+        self.hit_switch_and_run("s_test2", .01)
+        self.hit_switch_and_run("s_test3", .01)
+        self.assertEqual([], self._receive())
+        self.advance_time_and_run(.05)
+        self.assertEqual([[("/sw/s_test1", [1]), ("/sw/s_test2", [1]), ("/sw/s_test3", [1])]], self._receive())
+
+        # bundles are split before they get too large
+        for _ in range(150):
+            self.machine.switch_controller.process_switch("s_test1", 0, logical=True)
+            self.machine.switch_controller.process_switch("s_test1", 1, logical=True)
+        self.advance_time_and_run(.1)
+        bundles = self._receive()
+        self.assertEqual([200, 100], [len(bundle) for bundle in bundles])
+        self.assertEqual(("/sw/s_test1", [0]), bundles[0][0])
+        self.assertEqual(("/sw/s_test1", [1]), bundles[1][-1])
+
+    def test_lights(self):
+        self.advance_time_and_run(.1)
+        self._receive()
+        self.machine.lights["l_test"].color("red")
+        self.advance_time_and_run(.1)
+        self.assertEqual([[("/light/l_test", [255, 0, 0])]], self._receive())
+
+    def test_player_vars_after_bcp_client_stopped(self):
+        self.advance_time_and_run(.1)
+        # a BCP client subscribes and unsubscribes to player vars
+        client = MagicMock()
+        self.machine.bcp.interface._monitor_player_vars(client)
+        self.machine.bcp.interface._monitor_player_vars_stop(client)
+        self.assertTrue(Player.monitor_enabled)
+
+        self._receive()
+        player = Player(self.machine, 0)
+        player.enable_events()
+        player.score = 100
+        self.advance_time_and_run(.1)
+        self.assertIn(("/player/1/score", [100]), [message for bundle in self._receive() for message in bundle])
@@ -540,10 +540,10 @@ SW-16 boards found:
     def _test_servo_via_i2c(self):
         # assert on init
         self.pinproc.write_data.assert_has_calls([
-            call(7, 0x8000, 0x11),
+            call(7, 0x8000, 0x31),
             call(7, 0x8001, 0x04),
             call(7, 0x80FE, 130),
-            call(7, 0x8000, 0x01)
+            call(7, 0x8000, 0x21)
         ])
         self.pinproc.write_data = MagicMock(return_value=True)
         self.machine.servos.servo1.go_to_position(0)
@@ -1,6 +1,21 @@
-from unittest.mock import MagicMock
 from mpf.tests.MpfTestCase import MpfTestCase
-import mpf.platforms.pololu_maestro
+from mpf.tests.loop import MockSerial
+
+
+class MockMaestroSerial(MockSerial):
+
+    """Records all commands sent to the Maestro."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def write_ready(self):
+        return True
+
+    def write(self, msg):
+        self.messages.append(bytes(msg))
+        return len(msg)
 
 
 class TestPololuMaestro(MpfTestCase):
@@ -14,11 +29,9 @@ class TestPololuMaestro(MpfTestCase):
     def get_platform(self):
         return False
 
-    def setUp(self):
-        self.serial = MagicMock()
-        mpf.platforms.pololu_maestro.serial = MagicMock()
-        mpf.platforms.pololu_maestro.serial.Serial.return_value = self.serial
-        super().setUp()
+    def _mock_loop(self):
+        self.serial = MockMaestroSerial()
+        self.clock.mock_serial("COM5", self.serial)
 
     def _build_message(self, command, number, value):
         lsb = value & 0x7f  # 7 bits for least significant byte
@@ -27,29 +40,71 @@ class TestPololuMaestro(MpfTestCase):
         # lsb/msb
         return bytes([0xaa, 0xc, command, number, lsb, msb])
 
+    def _build_multiple_targets(self, first_number, *values):
+        message = bytes([0xaa, 0xc, 0x1f, len(values), first_number])
+        for value in values:
+            message += bytes([value & 0x7f, (value >> 7) & 0x7f])
+        return message
+
     def test_servo_go_to_position(self):
+        self.serial.messages = []
         # go to position 1.0 (on of the ends)
         self.machine.servos.servo1.go_to_position(1.0)
+        # targets are sent at the end of the loop iteration
+        self.assertEqual([], self.serial.messages)
+        self.machine_run()
         # assert that platform got called
-        self.serial.write.assert_called_with(self._build_message(0x04, 1, 9000))
+        self.assertEqual([self._build_message(0x04, 1, 9000)], self.serial.messages)
         # go to position 0.0 (other end)
         self.machine.servos.servo1.go_to_position(0.0)
+        self.machine_run()
         # assert that platform got called
-        self.serial.write.assert_called_with(self._build_message(0x04, 1, 3000))
+        self.assertEqual(self._build_message(0x04, 1, 3000), self.serial.messages[-1])
 
-        self.serial.reset_mock()
+        self.serial.messages = []
         # go to position 1.0 (on of the ends)
         self.machine.servos.servo2.go_to_position(1.0)
+        self.machine_run()
         # assert that platform got called
-        self.serial.write.assert_called_with(self._build_message(0x04, 2, 7800))
+        self.assertEqual(self._build_message(0x04, 2, 7800), self.serial.messages[-1])
         # go to position 0.0 (other end)
         self.machine.servos.servo2.go_to_position(0.0)
+        self.machine_run()
         # assert that platform got called
-        self.serial.write.assert_called_with(self._build_message(0x04, 2, 4200))
+        self.assertEqual(self._build_message(0x04, 2, 4200), self.serial.messages[-1])
         # go to position 0.0 (middle)
         self.machine.servos.servo2.go_to_position(0.5)
+        self.machine_run()
         # assert that platform got called
-        self.serial.write.assert_called_with(self._build_message(0x04, 2, 6000))
+        self.assertEqual(self._build_message(0x04, 2, 6000), self.serial.messages[-1])
+
+    def test_multiple_targets(self):
+        # one command per channel by default. the Micro Maestro does not know Set Multiple Targets
+        self.serial.messages = []
+        self.machine.servos.servo1.go_to_position(1.0)
+        self.machine.servos.servo2.go_to_position(0.0)
+        self.machine_run()
+        self.assertEqual([self._build_message(0x04, 1, 9000),
+                          self._build_message(0x04, 2, 4200)], self.serial.messages)
+
+        self.machine.servos.servo1.platform.config['multiple_targets'] = True
+        self.serial.messages = []
+        self.machine.servos.servo1.go_to_position(0.5)
+        self.machine.servos.servo2.go_to_position(0.0)
+        self.machine.servos.servo4.go_to_position(0.0)
+        self.machine.servos.servo1.go_to_position(1.0)
+        self.machine_run()
+        # servo 1 and 2 are neighbours. only the latest target of servo1 is sent
+        self.assertEqual([self._build_multiple_targets(1, 9000, 4200),
+                          self._build_message(0x04, 4, 3000)], self.serial.messages)
+
+        # pending targets are sent before other commands of the same channel
+        self.serial.messages = []
+        self.machine.servos.servo1.go_to_position(0.0)
+        self.machine.servos.servo1.set_speed_limit(-1.0)
+        self.machine_run()
+        self.assertEqual([self._build_message(0x04, 1, 3000),
+                          self._build_message(0x07, 1, 0)], self.serial.messages)
 
     def test_servo_set_speed(self):
         # test setting speed in config
@@ -58,11 +113,11 @@ class TestPololuMaestro(MpfTestCase):
         self.assertEqual(-1.0, self.machine.servos.servo2.speed_limit)
 
         self.machine.servos.servo1.set_speed_limit(-1.0)
-        self.serial.write.assert_called_with(self._build_message(0x07, 1, 0))
+        self.assertEqual(self._build_message(0x07, 1, 0), self.serial.messages[-1])
         self.machine.servos.servo1.set_speed_limit(0.0)
-        self.serial.write.assert_called_with(self._build_message(0x07, 1, 1))
+        self.assertEqual(self._build_message(0x07, 1, 1), self.serial.messages[-1])
         self.machine.servos.servo1.set_speed_limit(0.5)
-        self.serial.write.assert_called_with(self._build_message(0x07, 1, 18))
+        self.assertEqual(self._build_message(0x07, 1, 18), self.serial.messages[-1])
         self.machine.servos.servo1.set_speed_limit(1.0)
 
     def test_servo_set_acceleration(self):
@@ -72,11 +127,10 @@ class TestPololuMaestro(MpfTestCase):
         self.assertEqual(-1.0, self.machine.servos.servo2.acceleration_limit)
 
         self.machine.servos.servo1.set_speed_limit(-1.0)
-        self.serial.write.assert_called_with(self._build_message(0x07, 1, 0))
+        self.assertEqual(self._build_message(0x07, 1, 0), self.serial.messages[-1])
         self.machine.servos.servo1.set_speed_limit(0.0)
-        self.serial.write.assert_called_with(self._build_message(0x07, 1, 1))
+        self.assertEqual(self._build_message(0x07, 1, 1), self.serial.messages[-1])
         self.machine.servos.servo1.set_acceleration_limit(0.5)
-        self.serial.write.assert_called_with(self._build_message(0x09, 1, 180))
+        self.assertEqual(self._build_message(0x09, 1, 180), self.serial.messages[-1])
         self.machine.servos.servo1.set_acceleration_limit(1.0)
-        self.serial.write.assert_called_with(self._build_message(0x09, 1, 255))
-
+        self.assertEqual(self._build_message(0x09, 1, 255), self.serial.messages[-1])
@@ -0,0 +1,106 @@
+from unittest.mock import MagicMock
+
+from mpf.core.platform_controller import SwitchRuleSettings, DriverRuleSettings, PulseRuleSettings
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestPowerSupplyUnit(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/psu/'
+
+    def get_platform(self):
+        return 'virtual'
+
+    def setUp(self):
+        super().setUp()
+        self.pulses = []
+        self.start_time = self.machine.clock.get_time()
+        for coil in self.machine.coils:
+            coil.hw_driver.pulse = MagicMock(side_effect=lambda *args, name=coil.name: self._pulsed(name))
+
+    def _pulsed(self, name):
+        self.pulses.append((name, round((self.machine.clock.get_time() - self.start_time) * 1000)))
+
+    def _scheduler_handles(self, psu):
+        return [handle for handle in self.loop._scheduled
+                if not handle._cancelled and handle._callback == psu._run_scheduler]
+
+    def test_concurrent_pulses_within_budget(self):
+        self.assertEqual(0, self.machine.coils["reset_1"].pulse(max_wait_ms=100))
+        self.assertEqual(0, self.machine.coils["reset_2"].pulse(max_wait_ms=100))
+        # 12A do not fit into 10A. wait for the first pulse plus release_wait_ms
+        self.assertAlmostEqual(40, self.machine.coils["reset_3"].pulse(max_wait_ms=100))
+        self.assertEqual([("reset_1", 0), ("reset_2", 0)], self.pulses)
+
+        self.advance_time_and_run(.1)
+        self.assertEqual([("reset_1", 0), ("reset_2", 0), ("reset_3", 40)], self.pulses)
+
+    def test_priority(self):
+        self.machine.coils["reset_1"].pulse(max_wait_ms=100)
+        self.machine.coils["reset_2"].pulse(max_wait_ms=100)
+        self.assertAlmostEqual(40, self.machine.coils["trough_eject"].pulse(max_wait_ms=200))
+        self.assertAlmostEqual(40, self.machine.coils["kickback"].pulse(max_wait_ms=200))
+        # both are released from one scheduler callback
+        self.assertEqual(1, len(self._scheduler_handles(self.machine.psus["budget"])))
+
+        self.advance_time_and_run(.2)
+        # the kickback goes first. the trough eject waits until it finished
+        self.assertEqual([("reset_1", 0), ("reset_2", 0), ("kickback", 40), ("trough_eject", 70)], self.pulses)
+        self.assertEqual(0, len(self._scheduler_handles(self.machine.psus["budget"])))
+
+    def test_max_wait_ms(self):
+        self.machine.coils["reset_1"].pulse(max_wait_ms=100)
+        self.machine.coils["reset_2"].pulse(max_wait_ms=100)
+        # would have to wait 40ms
+        self.assertEqual(0, self.machine.coils["reset_3"].pulse(max_wait_ms=20))
+        # no max_wait_ms means pulse now
+        self.assertEqual(0, self.machine.coils["trough_eject"].pulse())
+        self.assertEqual([("reset_1", 0), ("reset_2", 0), ("reset_3", 0), ("trough_eject", 0)], self.pulses)
+
+        self.advance_time_and_run(.1)
+
+        # queued pulses are released at their deadline at the latest
+        self.pulses = []
+        self.start_time = self.machine.clock.get_time()
+        self.machine.coils["reset_1"].pulse(max_wait_ms=100)
+        self.machine.coils["reset_2"].pulse(max_wait_ms=100)
+        self.assertAlmostEqual(40, self.machine.coils["trough_eject"].pulse(max_wait_ms=45))
+        # the kickback overtakes the trough eject and would block it until 70ms
+        self.assertAlmostEqual(40, self.machine.coils["kickback"].pulse(max_wait_ms=100))
+        self.advance_time_and_run(.1)
+        self.assertEqual([("reset_1", 0), ("reset_2", 0), ("kickback", 40), ("trough_eject", 45)], self.pulses)
+
+    def test_exclusive_pulses(self):
+        # coils without psu_amps use the whole PSU
+        self.machine.coils["reset_1"].pulse(max_wait_ms=100)
+        self.assertAlmostEqual(40, self.machine.coils["knocker"].pulse(max_wait_ms=100))
+        self.assertAlmostEqual(70, self.machine.coils["reset_2"].pulse(max_wait_ms=100))
+        self.advance_time_and_run(.1)
+        self.assertEqual([("reset_1", 0), ("knocker", 40), ("reset_2", 70)], self.pulses)
+
+        # PSUs without max_amps serialise all pulses
+        self.pulses = []
+        self.start_time = self.machine.clock.get_time()
+        self.machine.coils["serial_1"].pulse(max_wait_ms=100)
+        self.assertAlmostEqual(30, self.machine.coils["serial_2"].pulse(max_wait_ms=100))
+        self.assertAlmostEqual(60, self.machine.coils["serial_1"].pulse(max_wait_ms=100))
+        self.advance_time_and_run(.1)
+        self.assertEqual([("serial_1", 0), ("serial_2", 30), ("serial_1", 60)], self.pulses)
+
+    def test_rule_pulse_within_budget(self):
+        self.machine.platform_controller.set_pulse_on_hit_rule(
+            SwitchRuleSettings(switch=self.machine.switches["s_kickback"], debounce=False, invert=False),
+            DriverRuleSettings(driver=self.machine.coils["kickback"], recycle=False),
+            PulseRuleSettings(duration=20, power=1.0))
+        self.machine.switch_controller.process_switch("s_kickback", 1, True)
+
+        # the rule pulse uses 5A of the budget. 4A still fit
+        self.assertEqual(0, self.machine.coils["reset_1"].pulse(max_wait_ms=100))
+        # 13A do not fit. wait for the rule pulse plus release_wait_ms
+        self.assertAlmostEqual(30, self.machine.coils["reset_2"].pulse(max_wait_ms=100))
+        self.advance_time_and_run(.1)
+        self.assertEqual([("reset_1", 0), ("reset_2", 30)], self.pulses)
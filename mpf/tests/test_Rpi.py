@@ -85,6 +85,14 @@ class MockApigpio():
             """Write byte to i2c register on handle."""
             self.i2c_write.append((handle, register, data))
 
+        @asyncio.coroutine
+        def _pigpio_aio_command_ext(self, cmd, p1, p2, p3, extents):
+            """Run extended pigpio command. Only I2CWI (block write) is used."""
+            assert cmd == 68
+            assert p3 == sum(len(extent) for extent in extents)
+            self.i2c_write.append((p1, p2, b"".join(extents)))
+            return 0
+
         @asyncio.coroutine
         def i2c_read_byte_data(self, handle, register):
             """Write byte to i2c register on handle."""
@@ -189,6 +197,11 @@ class TestRpi(MpfTestCase):
         device.i2c_write8(43, 1337)
         self.machine_run()
         self.assertEqual(((0, 123), 43, 1337), self.pi.i2c_write[0])
+
+        # one I2CWI command for the whole block
+        device.i2c_write_block(6, [0, 0, 88, 2])
+        self.machine_run()
+        self.assertEqual([((0, 123), 6, bytes([0, 0, 88, 2]))], self.pi.i2c_write[1:])
         self.pi.i2c_read.append(1337)
         result = self.loop.run_until_complete(device.i2c_read8(43))
         self.assertEqual(1337, result)
@@ -0,0 +1,47 @@
+from mpf.core.settings_controller import SettingEntry
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestSettingsController(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/credits/'
+
+    def test_snapshot(self):
+        settings = self.machine.settings
+        self.assertEqual(1.0, settings.snapshot.flipper_power)
+        self.assertEqual(1.0, settings.get_setting_value("flipper_power"))
+        self.assertEqual(1.0, settings.flipper_power)
+
+        with self.assertRaises(AssertionError):
+            settings.get_setting_value("invalid")
+        with self.assertRaises(AttributeError):
+            settings.snapshot.invalid
+
+        # snapshots are immutable and replaced when a value changes
+        snapshot = settings.snapshot
+        settings.set_setting_value("flipper_power", 0.8)
+        self.assertEqual(1.0, snapshot.flipper_power)
+        self.assertEqual(0.8, settings.snapshot.flipper_power)
+        self.assertEqual(0.8, settings.get_setting_value("flipper_power"))
+
+        # changing the machine var directly also updates the snapshot
+        self.machine.set_machine_var("flipper_power", 1.2)
+        self.assertEqual(1.2, settings.snapshot.flipper_power)
+        self.machine.remove_machine_var("flipper_power")
+        self.assertEqual(1.0, settings.snapshot.flipper_power)
+
+        # unrelated machine vars do not create a new snapshot
+        snapshot = settings.snapshot
+        self.machine.set_machine_var("some_var", 7)
+        self.assertIs(snapshot, settings.snapshot)
+
+        # new settings show up in the snapshot
+        settings.add_setting(SettingEntry("test", "Test", 1, "test_var", "a", {"a": "A (default)", "b": "B"}))
+        self.assertEqual("a", settings.snapshot.test)
+        settings.set_setting_value("test", "b")
+        self.assertEqual("b", settings.snapshot.test)
+        self.assertEqual("b", self.machine.get_machine_var("test_var"))
@@ -54,6 +54,31 @@ class TestShotGroups(MpfFakeGameTestCase):
 
         self.stop_game()
 
+    def test_common_state_follows_shot_jumps(self):
+        self.mock_event("test_group_complete")
+        self.start_game()
+        group = self.machine.shot_groups["test_group"]
+        self.assertEqual("unlit", group.common_state)
+
+        # state changes outside of the group keep the counts in sync
+        self.machine.shots["shot_1"].jump(1)
+        self.assertIsNone(group.common_state)
+        for shot in ("shot_2", "shot_3", "shot_4"):
+            self.machine.shots[shot].jump(1)
+        self.assertEqual("lit", group.common_state)
+
+        self.machine.shots["shot_3"].jump(0)
+        self.assertIsNone(group.common_state)
+        self.machine.shots["shot_3"].jump(1)
+        self.assertEqual("lit", group.common_state)
+
+        # rotation is a permutation and does not change the common state
+        group.rotate()
+        self.assertEqual("lit", group.common_state)
+
+        self.stop_game()
+        self.assertEqual("None", group.common_state)
+
     def test_rotate(self):
         self.start_game()
 
@@ -0,0 +1,67 @@
+import os
+import unittest
+
+import mpf
+from mpf.commands.simulate import GameSimulator, format_report
+
+
+class TestSimulate(unittest.TestCase):
+
+    def _settings(self, **kwargs):
+        settings = {
+            'seed': 3,
+            'games': 3,
+            'max_game_time': 3600,
+            'switch_interval': .5,
+            'ball_time': 20,
+            'capture_chance': .1,
+            'scripted': False,
+            'profile': False,
+            'plunger_time': '1s',
+            'settle_time': 10,
+            'loglevel': 99,
+        }
+        settings.update(kwargs)
+        return settings
+
+    def _run(self, settings):
+        mpf_path = os.path.abspath(os.path.dirname(mpf.__file__))
+        options = {
+            'force_platform': 'smart_virtual',
+            'production': False,
+            'mpfconfigfile': os.path.join(mpf_path, "mpfconfig.yaml"),
+            'configfile': ["config.yaml"],
+            'bcp': False,
+            'no_load_cache': False,
+            'create_config_cache': False,
+            'text_ui': False,
+            'force_assets_load': False,
+            'profile_startup': None,
+        }
+        machine_path = os.path.join(mpf_path, "tests/machine_files/simulate/")
+        return GameSimulator(mpf_path, machine_path, options, settings).run()
+
+    def test_simulate_games(self):
+        result = self._run(self._settings())
+        self.assertEqual([], result["errors"])
+        self.assertEqual(3, result["games"])
+        self.assertEqual(3, result["events"]["game_ended"])
+        self.assertEqual(9, result["events"]["ball_started"])
+        self.assertGreater(result["switch_hits"], 0)
+        self.assertGreater(result["simulated_time"], result["wall_time"])
+
+        # the same seed plays exactly the same games
+        result2 = self._run(self._settings())
+        self.assertEqual(result["events"], result2["events"])
+        self.assertEqual(result["switch_hits"], result2["switch_hits"])
+
+        report = format_report([result, result2], 1, 2, 5)
+        self.assertIn("Simulated 6 games", report)
+        self.assertIn("Errors: 0", report)
+
+    def test_stuck_game(self):
+        # without random switch activity balls never drain
+        result = self._run(self._settings(scripted=True, max_game_time=100, games=1))
+        self.assertEqual(0, result["games"])
+        self.assertEqual(1, len(result["errors"]))
+        self.assertIn("did not end", result["errors"][0])
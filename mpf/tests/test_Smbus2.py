@@ -35,6 +35,13 @@ class TestSmbus2(MpfTestCase):
         self.smbus_instance.write_byte_data.assert_called_once_with(17, 23, 1337)
         self.smbus.assert_called_once_with('1', loop=self.loop)
 
+        result = asyncio.Future(loop=self.loop)
+        result.set_result(True)
+        self.smbus_instance.write_i2c_block_data = MagicMock(return_value=result)
+        device.i2c_write_block(6, [0, 0, 88, 2])
+        self.machine_run()
+        self.smbus_instance.write_i2c_block_data.assert_called_once_with(17, 6, [0, 0, 88, 2])
+
         result = asyncio.Future(loop=self.loop)
         result.set_result(1337)
         self.smbus_instance.read_byte_data = MagicMock(return_value=result)
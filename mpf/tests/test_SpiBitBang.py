@@ -1,4 +1,5 @@
-import asyncio
+import time
+from unittest.mock import patch
 
 from mpf.tests.MpfTestCase import MpfTestCase, MagicMock
 
@@ -60,3 +61,152 @@ class TestSpiBigBang(MpfTestCase):
         self.assertSwitchState("s_trough_6", False)
         self.assertSwitchState("s_trough_7", True)
 
+
+
+class MockGpio:
+
+    """Simulates a chain of shift registers on RPi.GPIO."""
+
+    BCM = "BCM"
+    IN = "IN"
+    OUT = "OUT"
+    LOW = 0
+    HIGH = 1
+
+    def __init__(self, miso, clock, cs, bits):
+        self.miso = miso
+        self.clock = clock
+        self.cs = cs
+        self.bits = bits
+        self.inputs = 0
+        self.outputs = {}
+        self._register = 0
+        self.frames = 0
+
+    def setmode(self, mode):
+        assert mode == self.BCM
+
+    def setup(self, pin, direction, initial=None):
+        if direction == self.OUT:
+            self.outputs[pin] = initial
+
+    def cleanup(self, pins):
+        pass
+
+    def output(self, pin, value):
+        if not self.outputs[pin] and value:
+            if pin == self.cs:
+                # latch inputs
+                self._register = self.inputs
+                self.frames += 1
+            elif pin == self.clock:
+                self._register = (self._register << 1) & ((1 << self.bits) - 1)
+        self.outputs[pin] = value
+
+    def input(self, pin):
+        assert pin == self.miso
+        return bool(self._register & (1 << (self.bits - 1)))
+
+
+class MockSpiDevModule:
+
+    """Simulates a chain of shift registers on spidev."""
+
+    def __init__(self, bits):
+        self.bits = bits
+        self.inputs = 0
+        self.opened = None
+        self.max_speed_hz = None
+        self.mode = None
+        self.cshigh = None
+        self.frames = 0
+
+    def SpiDev(self):
+        return self
+
+    def open(self, bus, device):
+        self.opened = (bus, device)
+
+    def close(self):
+        self.opened = None
+
+    def readbytes(self, count):
+        self.frames += 1
+        return list(self.inputs.to_bytes(count, byteorder="big"))
+
+
+class TestSpiBitBangThreadedBase(MpfTestCase):
+
+    def getMachinePath(self):
+        return 'tests/machine_files/spi_bit_bang/'
+
+    def get_platform(self):
+        # no force platform
+        return False
+
+    def _wait_for_switch(self, name, state):
+        # frames arrive from the worker thread in real time
+        for _ in range(200):
+            if self.machine.switch_controller.is_active(name) == state:
+                return
+            time.sleep(.005)
+            self.advance_time_and_run(.01)
+        self.fail("Switch {} did not become {}".format(name, state))
+
+    def _check_inputs(self, mock):
+        switch_changes = []
+        self.machine.switch_controller.add_monitor(lambda change: switch_changes.append((change.name, change.state)))
+
+        mock.inputs = (1 << 15) | (1 << 3) | (1 << 2)
+        self._wait_for_switch("s_input_15", True)
+        self._wait_for_switch("s_input_3", True)
+        self.assertSwitchState("s_input_0", False)
+        self.assertSwitchState("s_input_9", False)
+
+        mock.inputs = (1 << 9) | (1 << 3) | 1
+        self._wait_for_switch("s_input_15", False)
+        self._wait_for_switch("s_input_0", True)
+        self._wait_for_switch("s_input_9", True)
+        self.assertSwitchState("s_input_3", True)
+
+        # only changed inputs are reported. unconfigured inputs are ignored
+        self.assertEqual([("s_input_3", 1), ("s_input_15", 1), ("s_input_0", 1), ("s_input_9", 1),
+                          ("s_input_15", 0)], switch_changes)
+        self.assertGreater(mock.frames, 2)
+
+
+class TestSpiBitBangGpioThread(TestSpiBitBangThreadedBase):
+
+    def getConfigFile(self):
+        return 'gpio_thread.yaml'
+
+    def setUp(self):
+        self.gpio = MockGpio(miso=17, clock=27, cs=22, bits=16)
+        patcher = patch("mpf.platforms.spi_bit_bang.GPIO", self.gpio)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+    def test_gpio_thread(self):
+        self._check_inputs(self.gpio)
+
+
+class TestSpiBitBangSpidev(TestSpiBitBangThreadedBase):
+
+    def getConfigFile(self):
+        return 'spidev.yaml'
+
+    def setUp(self):
+        self.spidev = MockSpiDevModule(bits=16)
+        patcher = patch("mpf.platforms.spi_bit_bang.spidev", self.spidev)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+    def test_spidev(self):
+        self.assertEqual((0, 1), self.spidev.opened)
+        self.assertEqual(500000, self.spidev.max_speed_hz)
+        # same wiring as the bit bang backends
+        self.assertEqual(0, self.spidev.mode)
+        self.assertTrue(self.spidev.cshigh)
+        self._check_inputs(self.spidev)
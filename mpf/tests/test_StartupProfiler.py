@@ -0,0 +1,42 @@
+"""Test the startup profiler."""
+import os
+import tempfile
+
+from mpf.tests.MpfTestCase import MpfTestCase
+
+
+class TestStartupProfiler(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'test_modes.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/mode_tests/'
+
+    def getOptions(self):
+        options = super().getOptions()
+        self.profile_file = os.path.join(tempfile.mkdtemp(), "startup_profile.txt")
+        options['profile_startup'] = self.profile_file
+        return options
+
+    def test_measurements(self):
+        measurements = {(measurement.category, measurement.name) for measurement in
+                        self.machine.startup_profiler.measurements}
+        self.assertIn(("init", "load_config"), measurements)
+        self.assertIn(("init_phase", "init_phase_1"), measurements)
+        self.assertIn(("platform", "virtual"), measurements)
+        self.assertIn(("core_module", "events"), measurements)
+        self.assertIn(("mode", "mode1"), measurements)
+        self.assertIn(("device_create", "playfields"), measurements)
+        self.assertIn(("device_initialize", "playfields"), measurements)
+
+    def test_report(self):
+        # report is written after init and profiling stops
+        self.assertFalse(self.machine.startup_profiler.enabled)
+
+        with open(self.profile_file) as f:
+            report = f.read()
+
+        self.assertIn("MPF startup profile", report)
+        self.assertIn("init_phase_1", report)
+        self.assertIn("mode1", report)
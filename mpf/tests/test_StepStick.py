@@ -1,5 +1,6 @@
 import asyncio
 
+from mpf.platforms.step_stick import StepTrain
 from mpf.tests.MpfTestCase import MpfTestCase, MagicMock, patch
 
 
@@ -57,3 +58,34 @@ class TestStepStick(MpfTestCase):
         self.assertEqual("enabled", direction.state)
         self.assertEqual(40, step_enable.call_count)
         self.assertEqual(40, step_disable.call_count)
+
+    def test_step_train(self):
+        self.hit_switch_and_run("s_home", .1)
+        stepper = self.machine.steppers["stepper1"].hw_stepper
+        step_enable = self.machine.digital_outputs["c_step"].hw_driver.enable = MagicMock()
+        step_disable = self.machine.digital_outputs["c_step"].hw_driver.disable = MagicMock()
+        direction = self.machine.digital_outputs["c_direction"].hw_driver
+
+        # one call and one future for the whole move
+        future = stepper.move_step_train(-30, .01, .02)
+        self.assertEqual("disabled", direction.state)
+        self.advance_time_and_run(.85)
+        self.assertFalse(future.done())
+        self.assertEqual(29, step_enable.call_count)
+        self.advance_time_and_run(.1)
+        self.assertTrue(future.done())
+        self.assertEqual(30, future.result())
+        self.assertEqual(30, step_enable.call_count)
+        self.assertEqual(30, step_disable.call_count)
+
+        # stop completes the future early
+        future = stepper.move_step_train(100, .01, .01)
+        self.advance_time_and_run(.095)
+        stepper.stop()
+        self.advance_time_and_run(1)
+        self.assertTrue(future.done())
+        self.assertEqual(5, future.result())
+
+    def test_step_train_is_abstract(self):
+        with self.assertRaises(TypeError):
+            StepTrain(self.loop, MagicMock(), MagicMock(), 1, .01, .01)
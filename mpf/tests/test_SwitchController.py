@@ -62,6 +62,77 @@ class TestSwitchController(MpfTestCase):
         self.hit_switch_and_run("s_test", 1)
         self.assertTrue(future.done())
 
+    def test_switch_watch(self):
+        handlers = len(self.machine.switch_controller.registered_switches[self.machine.switches["s_test"]][1])
+        watch = self.machine.switch_controller.watch_any_switch(["s_test", "s_test_events"])
+        self.assertEqual(handlers + 1,
+                         len(self.machine.switch_controller.registered_switches[self.machine.switches["s_test"]][1]))
+
+        # changes without a pending wait are ignored
+        self.hit_and_release_switch("s_test")
+        future = watch.wait()
+        self.advance_time_and_run(1)
+        self.assertFalse(future.done())
+        self.hit_switch_and_run("s_test_events", 1)
+        self.assertEqual({"switch_name": "s_test_events", "state": 1, "ms": 0}, future.result())
+
+        # the watch can be reused and cancelled waits do not break it
+        future = watch.wait()
+        future.cancel()
+        self.assertTrue(watch.wait(only_on_change=False).done())
+        # a new wait cancels the pending one
+        future = watch.wait()
+        watch.wait()
+        self.assertTrue(future.cancelled())
+        future = watch.wait()
+        self.hit_switch_and_run("s_test", 1)
+        self.assertEqual("s_test", future.result()["switch_name"])
+
+        # remove handlers
+        future = watch.wait()
+        watch.close()
+        self.release_switch_and_run("s_test", 1)
+        self.hit_switch_and_run("s_test", 1)
+        self.assertFalse(future.done())
+        self.assertEqual(handlers,
+                         len(self.machine.switch_controller.registered_switches[self.machine.switches["s_test"]][1]))
+
+    def test_switch_watch_opposite_state(self):
+        self.hit_switch_and_run("s_test", 1)
+        watch = self.machine.switch_controller.watch_any_switch(["s_test", "s_test_events"], state=2, ms=100)
+        future = watch.wait()
+        # s_test has to become inactive for 100ms
+        self.release_switch_and_run("s_test", .05)
+        self.hit_switch_and_run("s_test", 1)
+        self.assertFalse(future.done())
+        self.release_switch_and_run("s_test", .2)
+        self.assertEqual({"switch_name": "s_test", "state": 0, "ms": 100}, future.result())
+
+        # s_test_events has to become active
+        future = watch.wait()
+        self.hit_switch_and_run("s_test_events", .2)
+        self.assertEqual({"switch_name": "s_test_events", "state": 1, "ms": 100}, future.result())
+        watch.close()
+
+    def test_switch_watch_ms(self):
+        watch = self.machine.switch_controller.watch_any_switch(["s_test"], state=1, ms=100)
+        # the switch became active before the wait but not long enough ago
+        self.hit_switch_and_run("s_test", .05)
+        future = watch.wait()
+        self.advance_time_and_run(.04)
+        self.assertFalse(future.done())
+        self.advance_time_and_run(.02)
+        self.assertTrue(future.done())
+
+        future = watch.wait()
+        self.release_switch_and_run("s_test", 1)
+        self.hit_switch_and_run("s_test", .05)
+        self.release_switch_and_run("s_test", 1)
+        self.assertFalse(future.done())
+        self.hit_switch_and_run("s_test", .11)
+        self.assertTrue(future.done())
+        watch.close()
+
     def test_verify_switches(self):
         self.assertTrue(self.machine.switch_controller.verify_switches())
 
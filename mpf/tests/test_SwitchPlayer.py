@@ -57,3 +57,30 @@ class TestSwitchPlayer(MpfTestCase):
         self.assertEqual(False, self.machine.switch_controller.is_active("s_test2"))
         self.assertEqual(False, self.machine.switch_controller.is_active("s_test3"))
         self.assertEqual(3, self.hits)
+
+    def test_second_start_event(self):
+        self.hits = 0
+        self.machine.switch_controller.add_switch_handler("s_test3", self._sw_handler)
+        self.post_event("test_start")
+        self.advance_time_and_run(0.75)
+        self.assertEqual(True, self.machine.switch_controller.is_active("s_test1"))
+        self.assertEqual(1, self.hits)
+
+        # a start event while the script runs continues the script with the current step
+        self.post_event("test_start")
+        self.advance_time_and_run(0.05)
+        self.assertEqual(True, self.machine.switch_controller.is_active("s_test1"))
+        self.advance_time_and_run(0.1)
+        self.assertEqual(False, self.machine.switch_controller.is_active("s_test1"))
+        self.assertEqual(1, self.hits)
+
+        self.advance_time_and_run(10)
+        self.assertEqual(3, self.hits)
+
+        # after the script finished the next start event plays it again from the first step
+        self.post_event("test_start")
+        self.advance_time_and_run(0.15)
+        self.assertEqual(True, self.machine.switch_controller.is_active("s_test1"))
+        self.advance_time_and_run(10)
+        self.assertEqual(False, self.machine.switch_controller.is_active("s_test1"))
+        self.assertEqual(6, self.hits)
@@ -0,0 +1,120 @@
+import os
+import tempfile
+
+import mpf
+from mpf.commands.replay import SwitchReplay, compare_recordings, format_report
+from mpf.core.switch_recorder import SwitchRecording
+from mpf.tests.MpfGameTestCase import MpfGameTestCase
+
+
+class TestSwitchRecorder(MpfGameTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/switch_recorder/'
+
+    def get_platform(self):
+        return 'smart_virtual'
+
+    def get_enable_plugins(self):
+        # record with the same plugins as the replay
+        return True
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.temp_dir.name, "switches.mpfrec")
+        self.machine_config_patches['mpf']['switch_recorder_file'] = self.file_name
+        del self.machine_config_patches['mpf']['plugins']
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+        self.temp_dir.cleanup()
+
+    def _play_game(self):
+        for switch in ("s_ball_switch1", "s_ball_switch2"):
+            self.hit_switch_and_run(switch, 1)
+        self.advance_time_and_run(10)
+
+        self.hit_and_release_switch("s_start")
+        self.advance_time_and_run(5)
+        self.assertGameIsRunning()
+
+        trough = self.machine.ball_devices["bd_trough"]
+        for ball in range(3):
+            self.advance_time_and_run(5)
+            for _ in range(ball + 1):
+                self.hit_and_release_switch("s_target1")
+                self.advance_time_and_run(.5)
+                self.hit_and_release_switch("s_spinner")
+                self.advance_time_and_run(.1)
+            self.hit_and_release_switch("s_target2")
+            self.advance_time_and_run(1)
+            self.machine.default_platform.add_ball_to_device(trough)
+            self.advance_time_and_run(10)
+
+        self.assertGameIsNotRunning()
+
+    def _replay(self, recording, output_name):
+        mpf_path = os.path.abspath(os.path.dirname(mpf.__file__))
+        options = {
+            'force_platform': 'virtual',
+            'production': False,
+            'mpfconfigfile': os.path.join(mpf_path, "mpfconfig.yaml"),
+            'configfile': ["config.yaml"],
+            'bcp': False,
+            'no_load_cache': False,
+            'create_config_cache': False,
+            'text_ui': False,
+            'force_assets_load': False,
+            'profile_startup': None,
+        }
+        machine_path = os.path.join(mpf_path, "tests/machine_files/switch_recorder/")
+        return SwitchReplay(mpf_path, machine_path, options, recording,
+                            os.path.join(self.temp_dir.name, output_name)).run()
+
+    def test_record_and_replay(self):
+        self._play_game()
+        # the recording ends when the machine shuts down
+        self.post_event("shutdown")
+
+        recording = SwitchRecording.load(self.file_name)
+        self.assertEqual([], recording.start_state["active_switches"])
+        self.assertIn(("s_target2", 1), [(name, state) for _, name, state, _ in recording.switches])
+        self.assertIn("game_ended", [name for _, name in recording.events])
+        self.assertIn("eject_coil1", [name for _, name, _ in recording.pulses])
+        self.assertEqual(1, len(recording.final_state["players"]))
+        self.assertEqual(3 * 1000 + 6 * 110, recording.final_state["players"][0]["score"])
+        self.assertEqual(3, recording.final_state["machine_vars"]["target_hits"])
+        # timestamps are monotonic
+        times = [timestamp for timestamp, _, _, _ in recording.switches]
+        self.assertEqual(sorted(times), times)
+
+        # the replay on the virtual platform posts the same events and ends in the same state
+        result = self._replay(recording, "replay.mpfrec")
+        self.assertEqual([], result["errors"])
+        self.assertEqual([], compare_recordings(recording, result["replayed"]))
+        self.assertGreater(result["simulated_time"], result["wall_time"])
+        self.assertIn("Divergences: 0", format_report(recording, result, [], 5))
+
+        # drop the first spinner hit
+        first_hit = [i for i, (_, name, _, _) in enumerate(recording.switches) if name == "s_spinner"][0]
+        del recording.switches[first_hit:first_hit + 2]
+        result = self._replay(recording, "replay2.mpfrec")
+        differences = compare_recordings(recording, result["replayed"])
+        self.assertIn("Player 1 var score: recorded 3660 replayed 3650", differences)
+        self.assertIn("Event s_spinner_active posted 6 times but replayed 5 times", differences)
+        self.assertTrue(differences[0].startswith("Events diverge at event"))
+
+    def test_truncated_recording(self):
+        self.hit_and_release_switch("s_target1")
+        self.machine.switch_recorder.flush()
+        with open(self.file_name, "rb") as f:
+            data = f.read()
+
+        # a power loss in the middle of the last record
+        recording = SwitchRecording.parse(data[:-3])
+        self.assertIsNone(recording.final_state)
+        self.assertEqual([("s_target1", 1)], [(name, state) for _, name, state, _ in recording.switches])
@@ -0,0 +1,101 @@
+from asciimatics.screen import Screen
+
+from mpf.tests.MpfTestCase import MpfTestCase, patch
+
+
+class HeadlessScreen(Screen):
+
+    """Asciimatics screen which counts the cells it would draw."""
+
+    def __init__(self, height=50, width=160):
+        super().__init__(height, width, None, False)
+        self.cells_drawn = 0
+        self.refreshes = 0
+
+    def refresh(self):
+        self.refreshes += 1
+        super().refresh()
+
+    def _print_at(self, text, x, y, width):
+        self.cells_drawn += 1
+
+    def _change_colours(self, colour, attr, bg):
+        pass
+
+    def _clear(self):
+        pass
+
+    def _scroll(self, lines):
+        pass
+
+    def get_event(self):
+        return None
+
+    def wait_for_input(self, timeout):
+        pass
+
+    def close(self, restore=True):
+        pass
+
+    def set_title(self, title):
+        pass
+
+    def has_resized(self):
+        return False
+
+
+class TestTextUi(MpfTestCase):
+
+    def getConfigFile(self):
+        return 'config.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/text_ui/'
+
+    def getOptions(self):
+        options = super().getOptions()
+        options['text_ui'] = True
+        return options
+
+    def setUp(self):
+        self.screen = HeadlessScreen()
+        screen_open = patch('mpf.core.text_ui.Screen.open', return_value=self.screen)
+        screen_open.start()
+        self.addCleanup(screen_open.stop)
+        super().setUp()
+
+    def test_switch_updates(self):
+        self.advance_time_and_run(1.5)
+        self.assertEqual("s_matrix_000", self._read_cell(*self.machine.text_ui.switches[
+            self.machine.switches.s_matrix_000][1:], 12))
+
+        # burst of switch changes only draws the changed switches and refreshes once
+        refreshes = self.screen.refreshes
+        cells_drawn = self.screen.cells_drawn
+        for i in range(0, 10):
+            self.machine.switch_controller.process_switch("s_matrix_{:03d}".format(i), 1, logical=True)
+        self.advance_time_and_run(.01)
+        self.assertEqual(refreshes + 1, self.screen.refreshes)
+        self.assertEqual(10 * len("s_matrix_000"), self.screen.cells_drawn - cells_drawn)
+        self.assertEqual(2, self._read_bg(*self.machine.text_ui.switches[self.machine.switches.s_matrix_000][1:]))
+        self.assertEqual(0, self._read_bg(*self.machine.text_ui.switches[self.machine.switches.s_matrix_010][1:]))
+
+        # refreshes are capped to MAX_FPS
+        refreshes = self.screen.refreshes
+        for i in range(0, 10):
+            self.release_switch_and_run("s_matrix_{:03d}".format(i), .001)
+        self.advance_time_and_run(.1)
+        self.assertLessEqual(self.screen.refreshes - refreshes, 3)
+        self.assertEqual(0, self._read_bg(*self.machine.text_ui.switches[self.machine.switches.s_matrix_000][1:]))
+
+        # nothing changed. nothing is drawn
+        cells_drawn = self.screen.cells_drawn
+        self.machine.text_ui._update_switches()
+        self.advance_time_and_run(.1)
+        self.assertEqual(cells_drawn, self.screen.cells_drawn)
+
+    def _read_cell(self, x, y, length):
+        return "".join(chr(self.screen.get_from(x + i, y)[0]) for i in range(length))
+
+    def _read_bg(self, x, y):
+        return self.screen.get_from(x, y)[3]
@@ -1,6 +1,8 @@
 # TODO: test remaining actions
 # TODO: test empty control_events
 
+from unittest.mock import call, patch
+
 from mpf.tests.MpfFakeGameTestCase import MpfFakeGameTestCase
 
 
@@ -215,6 +217,41 @@ class TestTimer(MpfFakeGameTestCase):
 
         self.assertTrue(timer.running)
 
+    def test_shared_tick(self):
+        self.start_game()
+
+        # both timers start running with the mode and tick every second
+        self.machine.events.post('start_mode_with_timers')
+        self.machine_run()
+        timer1 = self.machine.timers['timer_start_running']
+        timer2 = self.machine.timers['timer_restart_on_complete']
+        self.assertEqual(timer1.timer.get_next_call_time(), timer2.timer.get_next_call_time())
+        next_tick = timer1.timer.get_next_call_time()
+        self.assertEqual(1, len([handle for handle in self.loop._scheduled
+                                 if handle._when == next_tick and not handle._cancelled]))
+
+        self.advance_time_and_run(4)
+        self.assertEqual(4, timer1.ticks)
+        self.assertEqual(4, timer2.ticks)
+
+        # restart on complete changes running and ticks multiple times in one tick.
+        # the monitor only sees the resulting change
+        with patch.object(type(self.machine.bcp.interface), "notify_device_changes") as notify:
+            self.advance_time_and_run(1)
+        self.assertEqual(5, timer1.ticks)
+        self.assertEqual(0, timer2.ticks)
+        self.assertTrue(timer2.running)
+        self.assertEqual([call(timer1, "ticks", 4, 5)],
+                         [args for args in notify.call_args_list if args[0][0] is timer1])
+        self.assertEqual([call(timer2, "ticks", 4, 0)],
+                         [args for args in notify.call_args_list if args[0][0] is timer2])
+
+        # restarted timer stays in phase
+        self.assertEqual(timer1.timer.get_next_call_time(), timer2.timer.get_next_call_time())
+        self.advance_time_and_run(1)
+        self.assertEqual(6, timer1.ticks)
+        self.assertEqual(1, timer2.ticks)
+
     def test_timer_events(self):
         # add a fake player
         self.start_game()
@@ -1,6 +1,107 @@
-from unittest.mock import MagicMock,Mock
+from mpf.platforms.trinamics import TMCL
 from mpf.tests.MpfTestCase import MpfTestCase
-import mpf.platforms.trinamics_steprocker
+from mpf.tests.loop import MockSerial
+
+
+class MockTMCLSerial(MockSerial):
+
+    """Simulates a TMCL module which answers every request."""
+
+    def __init__(self, loop):
+        super().__init__()
+        self.loop = loop
+        self.queue = bytearray()
+        self.requests = []
+        self.polls_per_move = 3
+        self.latency = .001
+        self.motors = {}
+        self.crashed = False
+        self.lose_replies = 0
+        self.reply_delay = 0
+        self.garbage = b""
+
+    def read(self, length):
+        data = bytes(self.queue[:length])
+        del self.queue[:length]
+        return data
+
+    def read_ready(self):
+        return bool(self.queue)
+
+    def write_ready(self):
+        return True
+
+    def write(self, msg):
+        for i in range(0, len(msg), 9):
+            request = TMCL.decodeRequestCommand(msg[i:i + 9])
+            self.requests.append((self.loop.time(), request))
+            try:
+                value = self._handle(request)
+            except Exception:
+                self.crashed = True
+                raise
+            self.queue.extend(self.garbage)
+            self.garbage = b""
+            if self.lose_replies:
+                self.lose_replies -= 1
+                continue
+            reply = bytes(map(ord, TMCL.encodeReplyCommand(2, request['module-address'], TMCL.STAT_OK,
+                                                           request['command-number'], value)))
+            if self.reply_delay:
+                self.loop.call_later(self.reply_delay, self._deliver, reply)
+            else:
+                self.queue.extend(reply)
+        # the time travel loop only reads after advancing to the next timer. wake it up after the serial latency
+        self.loop.call_later(self.latency, self._wakeup)
+        return len(msg)
+
+    def _wakeup(self):
+        pass
+
+    def _deliver(self, reply):
+        self.queue.extend(reply)
+        self.loop.call_later(self.latency, self._wakeup)
+
+    def _handle(self, request):
+        motor = self.motors.setdefault(request['motor-number'], {
+            "position": 0, "target": 0, "remaining": 0, "homing": 0, "parameters": {}})
+        command = TMCL.COMMAND_NUMBERS[request['command-number']]
+        cmd_type = request['type-number']
+        value = request['value']
+        if value >= 1 << 31:
+            value -= 1 << 32
+
+        if command == "SAP":
+            motor["parameters"][cmd_type] = value
+        elif command == "MVP":
+            motor["target"] = value if cmd_type == TMCL.CMD_MVP_TYPES['ABS'] else motor["position"] + value
+            motor["remaining"] = self.polls_per_move
+        elif command == "RFS":
+            if cmd_type == TMCL.CMD_RFS_TYPES['START']:
+                motor["homing"] = self.polls_per_move
+            elif cmd_type == TMCL.CMD_RFS_TYPES['STOP']:
+                motor["homing"] = 0
+            else:
+                if motor["homing"]:
+                    motor["homing"] -= 1
+                    return 1
+                motor["position"] = motor["target"] = 0
+                return 0
+        elif command == "GAP":
+            if cmd_type == 1:
+                return motor["position"]
+            elif cmd_type == 8:
+                if motor["remaining"]:
+                    motor["remaining"] -= 1
+                    motor["position"] += (motor["target"] - motor["position"]) // 2
+                    return 0
+                motor["position"] = motor["target"]
+                return 1
+            return motor["parameters"].get(cmd_type, 0)
+        elif command not in ("MST", "ROR", "ROL", "STAP"):
+            raise AssertionError("Unexpected command {}".format(command))
+        return 0
+
 
 class TestTrinamicsStepRocker(MpfTestCase):
 
@@ -13,82 +114,133 @@ class TestTrinamicsStepRocker(MpfTestCase):
     def get_platform(self):
         return False
 
-    def test_rotary(self):
-        return
-        stepper = self.machine.steppers.velocityStepper
-
-        # spin clockwise, 45 degrees per second
-        stepper.move_vel_mode( 45 )
-        self.assertEqual( 45, stepper._cachedVelocity )
-
-        # stop
-        stepper.stop()
-        self.assertEqual( 0, stepper._cachedVelocity )
-
-        # spin counter clockwise
-        stepper.move_vel_mode( -60 )
-        self.assertEqual( -60, stepper._cachedVelocity )
-
-        # stop
-        stepper.stop()
-        self.assertEqual( 0, stepper._cachedVelocity )
+    def _mock_loop(self):
+        self.serialMock = MockTMCLSerial(self.loop)
+        self.clock.mock_serial("/dev/ttyACM0", self.serialMock)
 
-        # try to go too fast
-        with self.assertRaises(ValueError):
-            stepper.move_vel_mode( stepper.config['velocity_limit'] + 0.01 )
+    def tearDown(self):
+        self.assertFalse(self.serialMock.crashed)
+        super().tearDown()
 
-        # try a home / should be rejected
-        with self.assertRaises(RuntimeError):
-            stepper.home()
-
-        # try a position move / should be rejected
-        with self.assertRaises(RuntimeError):
-            stepper._move_to_absolute_position(42)
-
-        # try a relative move / should be rejected
-        with self.assertRaises(RuntimeError):
-            stepper.move_rel_pos( 42 )
+    def _wait_for_ready(self, stepper):
+        self.machine.clock.loop.run_until_complete(
+            self.machine.events.wait_for_event('stepper_{}_ready'.format(stepper)))
 
     def test_AbsPositionTest(self):
         stepper = self.machine.steppers.positionStepper
+        motor = self.serialMock.motors[0]
+
+        # parameters were set during init
+        self.assertEqual(int(2.55 * 25), motor["parameters"][6])
+        self.assertEqual(4, motor["parameters"][140])
+        self.assertEqual(8, motor["parameters"][193])
 
         # check home/reset
+        self.advance_time_and_run(1)
+        self.assertTrue(stepper._is_homed)
         self.assertEqual(0.0, stepper._current_position)
 
         # min/max in test file is 0,1 scaling setup for 1.0 = 1 revolution
         stepper._move_to_absolute_position(0.5)
-        self.machine.clock.loop.run_until_complete(self.machine.events.wait_for_event('stepper_positionStepper_ready'))
+        self._wait_for_ready("positionStepper")
         self.assertEqual(0.5, stepper._current_position)
+        self.assertEqual(0.5 * 1400 * 16, motor["position"])
+        self.assertEqual(0.5, stepper.hw_stepper.current_position())
 
         # Go to max
         stepper._move_to_absolute_position(1.0)
-        self.machine.clock.loop.run_until_complete(self.machine.events.wait_for_event('stepper_positionStepper_ready'))
+        self._wait_for_ready("positionStepper")
         self.assertEqual(1.0, stepper._current_position)
+        self.assertEqual(1400 * 16, motor["position"])
 
         # Go to min
         stepper._move_to_absolute_position(0.0)
-        self.machine.clock.loop.run_until_complete(self.machine.events.wait_for_event('stepper_positionStepper_ready'))
+        self._wait_for_ready("positionStepper")
         self.assertEqual(0.0, stepper._current_position)
-
-    def setUp(self):
-        #self.MockTMCLLib = MagicMock(spec=mpf.platforms.trinamics_steprocker.TMCLDevice)
-        self.MockTMCLLib = MagicMock()
-        self.MockTMCLLib.rfs.return_value = int(0)
-        self.MockTMCLLib.gap.side_effect = self.mock_gap
-        self.MockTMCLLib.mvp.side_effect = self.mock_mvp
-        self._trinam_pos = 0
-        mpf.platforms.trinamics_steprocker.TMCLDevice = MagicMock()
-        mpf.platforms.trinamics_steprocker.TMCLDevice.return_value = self.MockTMCLLib
-        super().setUp()
-
-    # Mock functionality needed
-    def mock_mvp(self, motor_number, cmdtype, value):
-        self._trinam_pos = value
-
-    def mock_gap(self, mn, param):
-        global _trinam_pos
-        if param == 1:
-            return self._trinam_pos
-        elif param == 8:
-            return 1
-
+        self.assertEqual(0, motor["position"])
+
+    def test_batched_poll(self):
+        self.advance_time_and_run(1)
+        del self.serialMock.requests[:]
+
+        self.machine.steppers.positionStepper._move_to_absolute_position(0.5)
+        self.machine.steppers.secondStepper._move_to_absolute_position(0.25)
+        self.advance_time_and_run(2)
+
+        self.assertEqual(0.5, self.machine.steppers.positionStepper._current_position)
+        self.assertEqual(0.25, self.machine.steppers.secondStepper._current_position)
+        self.assertEqual(0.25 * 1400 * 16, self.serialMock.motors[1]["position"])
+
+        # status polls of both motors are sent together in every cycle
+        polls = {}
+        for timestamp, request in self.serialMock.requests:
+            if TMCL.COMMAND_NUMBERS[request['command-number']] == "GAP" and request['type-number'] == 8:
+                polls.setdefault(timestamp, []).append(request['motor-number'])
+
+        self.assertEqual(self.serialMock.polls_per_move + 1, len(polls))
+        for motors in polls.values():
+            self.assertEqual([0, 1], sorted(motors))
+
+        # cycles are poll_ms (100ms) apart
+        timestamps = sorted(polls.keys())
+        for first, second in zip(timestamps, timestamps[1:]):
+            self.assertAlmostEqual(.1, second - first, delta=.01)
+
+        # no polling when nothing moves
+        del self.serialMock.requests[:]
+        self.advance_time_and_run(1)
+        self.assertEqual([], self.serialMock.requests)
+
+    def test_lost_and_corrupt_replies(self):
+        self.advance_time_and_run(1)
+        platform = self.machine.steppers.positionStepper.hw_stepper.platform
+        self.serialMock.motors[0]["parameters"][6] = 42
+
+        # a reply which does not arrive fails the request after reply_timeout
+        self.serialMock.lose_replies = 1
+        future = platform.send_command("GAP", 6, 0)
+        self.advance_time_and_run(.05)
+        self.assertFalse(future.done())
+        self.advance_time_and_run(.1)
+        with self.assertRaises(TMCL.TMCLError):
+            future.result()
+
+        # following requests get their own replies
+        future = platform.send_command("GAP", 6, 0)
+        self.assertEqual(42, self.loop.run_until_complete(future))
+
+        # garbage in front of a reply is skipped until the checksum matches
+        self.serialMock.garbage = b"\x02\x01"
+        future = platform.send_command("GAP", 6, 0)
+        second_future = platform.send_command("GAP", 1, 0)
+        self.assertEqual(42, self.loop.run_until_complete(future))
+        self.assertEqual(0, self.loop.run_until_complete(second_future))
+
+    def test_late_replies(self):
+        self.advance_time_and_run(1)
+        platform = self.machine.steppers.positionStepper.hw_stepper.platform
+        self.serialMock.motors[0]["parameters"][6] = 42
+        self.serialMock.motors[0]["position"] = 7
+
+        # both replies arrive after reply_timeout. all outstanding requests fail
+        self.serialMock.reply_delay = .15
+        first_future = platform.send_command("GAP", 6, 0)
+        second_future = platform.send_command("GAP", 1, 0)
+        self.advance_time_and_run(.12)
+        with self.assertRaises(TMCL.TMCLError):
+            first_future.result()
+        with self.assertRaises(TMCL.TMCLError):
+            second_future.result()
+
+        # new requests wait until the late replies stopped
+        self.serialMock.reply_delay = 0
+        del self.serialMock.requests[:]
+        future = platform.send_command("GAP", 1, 0)
+        self.advance_time_and_run(.1)
+        self.assertFalse(future.done())
+        self.assertEqual([], self.serialMock.requests)
+
+        # the late GAP reply (42) is not taken for the new request
+        self.advance_time_and_run(.1)
+        self.assertEqual(7, future.result())
+        self.assertEqual(1, len(self.serialMock.requests))
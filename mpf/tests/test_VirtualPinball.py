@@ -130,3 +130,109 @@ class TestVirtualPinball(MpfTestCase):
         self._encode_and_send(client, "switch", name="s_test_nc", state=1)
         self.advance_time_and_run()
         self.assertSwitchState("s_test_nc", 1)
+
+
+class TestVirtualPinballPlatform(MpfTestCase):
+
+    def __init__(self, methodName):
+        super().__init__(methodName)
+        del self.machine_config_patches['bcp']
+        self.machine_config_patches['bcp'] = dict()
+        self.machine_config_patches['bcp']['connections'] = []
+
+    def getConfigFile(self):
+        return 'vpx.yaml'
+
+    def getMachinePath(self):
+        return 'tests/machine_files/virtual_pinball/'
+
+    def get_platform(self):
+        return False
+
+    def get_use_bcp(self):
+        return True
+
+    def _mock_loop(self):
+        self.mock_server = MockServer(self.clock.loop)
+        self.clock.mock_server("127.0.0.1", 5051, self.mock_server)
+        self.client = MockQueueSocket(self.loop)
+        # init waits until VPX sends start
+        self.loop.create_task(self._connect_vpx())
+
+    @asyncio.coroutine
+    def _connect_vpx(self):
+        yield from self.mock_server.is_bound
+        yield from self.mock_server.add_client(self.client)
+        cmd, _ = yield from self._get_and_decode(self.client)
+        self.assertEqual("hello", cmd)
+        self._encode_and_send(self.client, "vpcom_bridge", subcommand="start")
+        cmd, args = yield from self._get_and_decode(self.client)
+        self.assertEqual("vpcom_bridge_response", cmd)
+        self.assertEqual({"result": True}, args)
+
+    @asyncio.coroutine
+    def _get_and_decode(self, client) -> Generator[int, None, Tuple[str, dict]]:
+        data = yield from client.send_queue.get()
+        return decode_command_string(data[0:-1].decode())
+
+    def _encode_and_send(self, client, cmd, **kwargs):
+        client.recv_queue.append((encode_command_string(cmd, **kwargs) + '\n').encode())
+
+    def test_changes(self):
+        platform = self.machine.default_platform
+        self.assertEqual([], platform.vpx_changed_solenoids())
+        self.assertEqual([], platform.vpx_changed_lamps())
+        self.assertEqual([], platform.vpx_changed_gi_strings())
+        sequence = platform.vpx_changes()["sequence"]
+
+        # nothing changed. no driver or light has to be checked
+        self.assertFalse(platform._dirty_drivers)
+        self.assertFalse(platform._dirty_lights)
+
+        self.machine.coils.c_test.pulse()
+        self.machine.coils.c_test2.enable()
+        self.machine.lights.l_lamp1.on()
+        self.machine.lights.l_gi1.on()
+        self.advance_time_and_run(.01)
+        self.assertEqual([(1, True), (2, True)], sorted(platform.vpx_changed_solenoids()))
+        self.assertEqual([(11, True)], platform.vpx_changed_lamps())
+        self.assertEqual([(21, True)], platform.vpx_changed_gi_strings())
+        self.assertEqual([], platform.vpx_changed_lamps())
+
+        # pulse stays dirty until it ended
+        self.assertEqual({self.machine.coils.c_test.hw_driver}, platform._dirty_drivers)
+        self.advance_time_and_run(.02)
+        self.assertEqual([(1, False)], platform.vpx_changed_solenoids())
+        self.assertFalse(platform._dirty_drivers)
+
+        # fading lights stay dirty until the fade is done
+        self.machine.lights.l_lamp2.color("white", fade_ms=100)
+        self.advance_time_and_run(.02)
+        self.assertEqual([], platform.vpx_changed_lamps())
+        self.assertTrue(platform._dirty_lights)
+        self.advance_time_and_run(.1)
+        self.assertEqual([(12, True)], platform.vpx_changed_lamps())
+        self.assertFalse(platform._dirty_lights)
+
+        self.assertEqual([], platform.vpx_changed_solenoids())
+        platform.vpx_set_switch(2, True)
+
+        # combined query returns the latest state of everything which changed after sequence
+        changes = platform.vpx_changes(sequence)
+        self.assertEqual([(2, True), (1, False)], changes["solenoids"])
+        self.assertEqual([(11, True), (12, True)], changes["lamps"])
+        self.assertEqual([(21, True)], changes["gi"])
+        self.assertEqual([(2, True)], changes["switches"])
+        self.assertSwitchState("s_test2", 1)
+
+        self.assertEqual({"sequence": changes["sequence"], "solenoids": [], "lamps": [], "gi": [], "switches": []},
+                         platform.vpx_changes(changes["sequence"]))
+
+        # over BCP
+        self.machine.coils.c_test2.disable()
+        self._encode_and_send(self.client, "vpcom_bridge", subcommand="changes", sequence=changes["sequence"])
+        self.advance_time_and_run(.01)
+        cmd, args = self.loop.run_until_complete(self._get_and_decode(self.client))
+        self.assertEqual("vpcom_bridge_response", cmd)
+        self.assertEqual({"sequence": changes["sequence"] + 1, "solenoids": [[2, False]], "lamps": [], "gi": [],
+                          "switches": []}, args["result"])